@@ -24,6 +24,7 @@ import maya
 import os
 import sys
 import time
+from concurrent.futures import Future
 from constant_sorrow.constants import FULL, NO_WORKER_BONDED, WORKER_NOT_RUNNING
 from decimal import Decimal
 from eth_tester.exceptions import TransactionFailed as TestTransactionFailed
@@ -438,50 +439,72 @@ class ContractAdministrator(NucypherTokenActor):
             click.confirm("Continue with the allocations process?", abort=True)
 
         batch_deposit_receipts, failed = dict(), False
+        submitted_batches = list()  # type: List[Tuple[List[str], Future]]
+
+        def report_failure():
+            if emitter:
+                emitter.echo(f"\nFailed to deploy next batch. These addresses weren't funded:", color="yellow")
+                for staker in allocator.pending_deposits:
+                    emitter.echo(f"\t{staker}", color="yellow")
+                emitter.echo(f"\nThe failure is caused by the following exception:")
+                for line in traceback.format_exception(*sys.exc_info()):
+                    emitter.echo(line, color='red')
+
+        def settle(deposited_stakers: List[str], future: Future) -> bool:
+            try:
+                receipt = future.result()
+            except Exception:  # Whatever became of this batch, the others still need settling.  TODO: 1950
+                allocator.deposited.difference_update(deposited_stakers)
+                report_failure()
+                return False
+
+            number_of_deposits = len(deposited_stakers)
+            if emitter:
+                emitter.echo(f"\nDeployed allocations for {number_of_deposits} stakers:")
+                for staker in deposited_stakers:
+                    emitter.echo(f"\t{staker}")
+                emitter.echo()
+                bar._last_line = None
+                bar.render_progress()
+
+            bar.update(number_of_deposits)
+
+            if emitter:
+                emitter.echo()
+                paint_receipt_summary(emitter=emitter,
+                                      receipt=receipt,
+                                      chain_name=chain_name,
+                                      transaction_type=f'batch_deposit_{number_of_deposits}_stakers')
+
+            batch_deposit_receipts.update({staker: {'batch_deposit': receipt} for staker in deposited_stakers})
+            return True
+
         with click.progressbar(length=len(allocator.allocations),
                                label="Allocation progress",
                                show_eta=False) as bar:
 
+            # Batches are broadcast without waiting for the previous ones to be mined, so that they can share blocks.
             while allocator.pending_deposits and not failed:
 
                 self.activate_deployer(refresh=True)
 
                 try:
-                    deposited_stakers, receipt = allocator.deposit_next_batch(sender_address=self.deployer_address,
-                                                                              gas_limit=gas_limit)
+                    deposited_stakers, future = allocator.submit_next_batch(sender_address=self.deployer_address,
+                                                                            gas_limit=gas_limit)
                 except (TestTransactionFailed, ValidationError, ValueError):  # TODO: 1950
-                    if emitter:
-                        emitter.echo(f"\nFailed to deploy next batch. These addresses weren't funded:", color="yellow")
-                        for staker in allocator.pending_deposits:
-                            emitter.echo(f"\t{staker}", color="yellow")
-                        emitter.echo(f"\nThe failure is caused by the following exception:")
-
-                    for line in traceback.format_exception(*sys.exc_info()):
-                        emitter.echo(line, color='red')
+                    report_failure()
                     failed = True
-                else:
-                    number_of_deposits = len(deposited_stakers)
-                    if emitter:
-                        emitter.echo(f"\nDeployed allocations for {number_of_deposits} stakers:")
-                        for staker in deposited_stakers:
-                            emitter.echo(f"\t{staker}")
-                        emitter.echo()
-                        bar._last_line = None
-                        bar.render_progress()
-
-                    bar.update(number_of_deposits)
-
-                    if emitter:
-                        emitter.echo()
-                        paint_receipt_summary(emitter=emitter,
-                                              receipt=receipt,
-                                              chain_name=chain_name,
-                                              transaction_type=f'batch_deposit_{number_of_deposits}_stakers')
-
-                    batch_deposit_receipts.update({staker: {'batch_deposit': receipt} for staker in deposited_stakers})
-
-                    if interactive:
+                    continue
+
+                if interactive:
+                    failed = not settle(deposited_stakers, future)
+                    if not failed:
                         click.pause(info=f"\nPress any key to continue with next batch of allocations")
+                else:
+                    submitted_batches.append((deposited_stakers, future))
+
+            for deposited_stakers, future in submitted_batches:
+                settle(deposited_stakers, future)
 
         return batch_deposit_receipts
 
@@ -607,6 +630,21 @@ class Allocator:
     def deposit_next_batch(self,
                            sender_address: str,
                            gas_limit: int = None) -> Tuple[List[str], dict]:
+        deposited_stakers, future = self.submit_next_batch(sender_address=sender_address, gas_limit=gas_limit)
+        try:
+            receipt = future.result()
+        except Exception:
+            self.deposited.difference_update(deposited_stakers)
+            raise
+        return deposited_stakers, receipt
+
+    def submit_next_batch(self,
+                          sender_address: str,
+                          gas_limit: int = None) -> Tuple[List[str], Future]:
+        """
+        Broadcasts the largest batch of pending deposits that fits in `gas_limit`, returning the stakers
+        in the batch and a future of its receipt.  Those stakers are considered deposited from then on.
+        """
 
         pending_stakers = self.pending_deposits
 
@@ -643,13 +681,14 @@ class Allocator:
             raise ValueError(message)
 
         batch_parameters = self.staking_agent.construct_batch_deposit_parameters(deposits=last_good_batch)
-        receipt = self.staking_agent.batch_deposit(*batch_parameters,
-                                                   sender_address=sender_address,
-                                                   gas_limit=gas_limit)
+        future = self.staking_agent.batch_deposit(*batch_parameters,
+                                                  sender_address=sender_address,
+                                                  gas_limit=gas_limit,
+                                                  wait=False)
 
         deposited_stakers = list(last_good_batch.keys())
         self.deposited.update(deposited_stakers)
-        return deposited_stakers, receipt
+        return deposited_stakers, future
 
     @property
     def pending_deposits(self) -> List[str]:
@@ -1676,10 +1715,10 @@ class StakeHolder(Staker):
 
     @property
     def all_stakes(self) -> list:
+        stake_lists = [StakeList(registry=self.registry, checksum_address=account) for account in self.wallet.accounts]
+        StakeList.refresh_all(stake_lists)
         stakes = list()
-        for account in self.wallet.accounts:
-            more_stakes = StakeList(registry=self.registry, checksum_address=account)
-            more_stakes.refresh()
+        for more_stakes in stake_lists:
             stakes.extend(more_stakes)
         return stakes
 
@@ -1692,10 +1731,9 @@ class StakeHolder(Staker):
         return staker
 
     def get_stakers(self) -> List[Staker]:
-        stakers = list()
-        for account in self.wallet.accounts:
-            staker = self.get_staker(checksum_address=account)
-            stakers.append(staker)
+        stakers = [Staker(is_me=True, checksum_address=account, registry=self.registry)
+                   for account in self.wallet.accounts]
+        StakeList.refresh_all(staker.stakes for staker in stakers)
         return stakers
 
     @property
@@ -1703,7 +1741,7 @@ class StakeHolder(Staker):
         """
         The total number of staked tokens, either locked or unlocked in the current period.
         """
-        stake = sum(self.staking_agent.owned_tokens(staker_address=account) for account in self.wallet.accounts)
+        stake = sum(self.staking_agent.owned_tokens_of(staker_addresses=self.wallet.accounts))
         nu_stake = NU.from_nunits(stake)
         return nu_stake
 
@@ -15,10 +15,16 @@ You should have received a copy of the GNU Affero General Public License
 along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
 """
 
+import json
+import os
 import random
+import threading
 
+import bisect
 import math
 import sys
+from concurrent.futures import Future
+from itertools import accumulate
 from constant_sorrow.constants import (  # type: ignore
     CONTRACT_CALL,
     NO_CONTRACT_AVAILABLE,
@@ -34,6 +40,7 @@ from typing import Dict, Iterable, List, Tuple, Type, Union, Any, Optional, cast
 from web3.contract import Contract, ContractFunction
 from web3.types import Wei, Timestamp, TxReceipt, TxParams, Nonce
 
+from nucypher.blockchain.eth.batch import ContractCallBatch
 from nucypher.blockchain.eth.constants import (
     ADJUDICATOR_CONTRACT_NAME,
     DISPATCHER_CONTRACT_NAME,
@@ -188,9 +195,19 @@ class NucypherTokenAgent(EthereumContractAgent):
         return receipt
 
     @contract_api(TRANSACTION)
-    def transfer(self, amount: NuNits, target_address: ChecksumAddress, sender_address: ChecksumAddress) -> TxReceipt:
-        """Transfer an amount of tokens from the sender address to the target address."""
+    def transfer(self,
+                 amount: NuNits,
+                 target_address: ChecksumAddress,
+                 sender_address: ChecksumAddress,
+                 wait: bool = True
+                 ) -> Union[TxReceipt, Future]:
+        """
+        Transfer an amount of tokens from the sender address to the target address.
+        Unless `wait` is True, returns a future of the receipt as soon as the transaction is broadcast.
+        """
         contract_function: ContractFunction = self.contract.functions.transfer(target_address, amount)
+        if not wait:
+            return self.blockchain.submit_transaction(contract_function=contract_function, sender_address=sender_address)
         receipt: TxReceipt = self.blockchain.send_transaction(contract_function=contract_function, sender_address=sender_address)
         return receipt
 
@@ -212,6 +229,143 @@ class NucypherTokenAgent(EthereumContractAgent):
         return approve_and_call_receipt
 
 
+class StakeDistribution:
+    """
+    The active stakers for some lock duration, indexed by the cumulative sum of their locked tokens,
+    so that a point on the line of all stakes can be mapped back to its staker by binary search.
+    """
+
+    def __init__(self, stakers_map: Dict[ChecksumAddress, NuNits]):
+        self.stakers = list(stakers_map)
+        # Plain integers, rather than a typed array: token amounts in NuNits can exceed 64 bits.
+        self.cumulative_stakes = list(accumulate(stakers_map.values()))
+        self.total_stake = self.cumulative_stakes[-1] if self.cumulative_stakes else 0
+
+    def __len__(self) -> int:
+        return len(self.stakers)
+
+    def staker_at(self, point: int) -> ChecksumAddress:
+        return self.stakers[bisect.bisect_right(self.cumulative_stakes, point)]
+
+    def sample_with_replacement(self, points: Iterable[int]) -> List[ChecksumAddress]:
+        return [self.staker_at(point) for point in points]
+
+    def sample_without_replacement(self, quantity: int, rng: random.Random) -> List[ChecksumAddress]:
+        """
+        Successive PPS sampling: each selected stake is removed from the line before the next point is drawn.
+        Rather than rebuilding the cumulative sums, points are drawn on the shortened line and shifted past
+        the removed stakes.
+        """
+        if quantity > len(self):
+            raise ValueError(f"Cannot sample {quantity} stakers out of {len(self)}.")
+
+        removed = list()  # (start, length) of the selected stakes, ordered by start
+        remaining_stake = self.total_stake
+        selected = list()
+        while len(selected) < quantity and remaining_stake > 0:
+            point = rng.randrange(remaining_stake)
+            for start, length in removed:
+                if point >= start:
+                    point += length
+                else:
+                    break
+            index = bisect.bisect_right(self.cumulative_stakes, point)
+            start = self.cumulative_stakes[index - 1] if index else 0
+            length = self.cumulative_stakes[index] - start
+            bisect.insort(removed, (start, length))
+            remaining_stake -= length
+            selected.append(self.stakers[index])
+        return selected
+
+
+class ActiveStakersCache:
+    """
+    Results of `getActiveStakers`, shared by all StakingEscrowAgents and keyed by contract address,
+    period and lock duration.  Active stakers only change from one period to the next (or when a staker
+    transacts with StakingEscrow), so entries for past periods are dropped as soon as a new period is seen.
+
+    Optionally, entries are persisted to a JSON file so that a restarted process can skip paging
+    through the whole staker set.
+    """
+
+    log = Logger("active-stakers-cache")
+
+    def __init__(self, filepath: Optional[str] = None):
+        self.__lock = threading.Lock()
+        self.__entries: Dict[Tuple[ChecksumAddress, Period, int], Tuple[NuNits, Dict[ChecksumAddress, NuNits]]] = dict()
+        self.filepath = None
+        if filepath:
+            self.persist_to(filepath)
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    def persist_to(self, filepath: str) -> None:
+        """Persists entries to `filepath`, first loading whatever an earlier process left there."""
+        with self.__lock:
+            self.filepath = filepath
+            stored_entries = dict()
+            try:
+                with open(filepath, 'r') as file:
+                    for entry in json.load(file):
+                        key = (ChecksumAddress(entry['contract']), Period(entry['period']), int(entry['duration']))
+                        stakers_map = {ChecksumAddress(staker): NuNits(int(tokens)) for staker, tokens in entry['stakers']}
+                        stored_entries[key] = (NuNits(int(entry['n_tokens'])), stakers_map)
+            except FileNotFoundError:
+                return
+            except (OSError, ValueError, TypeError, KeyError) as e:
+                self.log.warn(f"Ignoring unreadable active stakers cache at {filepath}: {e}")
+                return
+            for key, active_stakers in stored_entries.items():
+                self.__entries.setdefault(key, active_stakers)
+
+    def get(self,
+            contract_address: ChecksumAddress,
+            period: Period,
+            duration: int
+            ) -> Optional[Tuple[NuNits, Dict[ChecksumAddress, NuNits]]]:
+        with self.__lock:
+            return self.__entries.get((contract_address, period, duration))
+
+    def put(self,
+            contract_address: ChecksumAddress,
+            period: Period,
+            duration: int,
+            active_stakers: Tuple[NuNits, Dict[ChecksumAddress, NuNits]]
+            ) -> None:
+        with self.__lock:
+            for cached_contract, cached_period, cached_duration in list(self.__entries):
+                if cached_contract == contract_address and cached_period != period:
+                    del self.__entries[cached_contract, cached_period, cached_duration]
+            self.__entries[contract_address, period, duration] = active_stakers
+            self.__save()
+
+    def invalidate(self, contract_address: Optional[ChecksumAddress] = None) -> None:
+        """Forgets the active stakers of `contract_address`, or of every contract if none is given."""
+        with self.__lock:
+            for key in list(self.__entries):
+                if contract_address is None or key[0] == contract_address:
+                    del self.__entries[key]
+            self.__save()
+
+    def __save(self) -> None:
+        if not self.filepath:
+            return
+        stored_entries = [{'contract': contract_address,
+                           'period': period,
+                           'duration': duration,
+                           'n_tokens': str(n_tokens),  # Token amounts can exceed the precision of JSON numbers
+                           'stakers': [[staker, str(tokens)] for staker, tokens in stakers_map.items()]}
+                          for (contract_address, period, duration), (n_tokens, stakers_map) in self.__entries.items()]
+        temp_filepath = f'{self.filepath}.tmp'
+        try:
+            with open(temp_filepath, 'w') as file:
+                json.dump(stored_entries, file)
+            os.replace(temp_filepath, self.filepath)  # Atomic, so readers never see a partial file.
+        except OSError as e:
+            self.log.warn(f"Failed to persist active stakers cache to {self.filepath}: {e}")
+
+
 class StakingEscrowAgent(EthereumContractAgent):
 
     contract_name: str = STAKING_ESCROW_CONTRACT_NAME
@@ -229,6 +383,30 @@ class StakingEscrowAgent(EthereumContractAgent):
     class NotEnoughStakers(Exception):
         """Raised when the are not enough stakers available to complete an operation"""
 
+    # Shared by every agent, so that repeated sampling within a period doesn't page through all stakers again.
+    active_stakers_cache = ActiveStakersCache()
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.__stake_distributions: Dict[int, Tuple[Dict[ChecksumAddress, NuNits], StakeDistribution]] = dict()
+
+    def get_stake_distribution(self, duration: int, pagination_size: Optional[int] = None) -> StakeDistribution:
+        """
+        Returns the distribution of stakes locked for at least `duration` periods.  The distribution is
+        rebuilt only when the (cached) active stakers it was built from have changed.
+        """
+        _n_tokens, stakers_map = self.get_all_active_stakers(periods=duration, pagination_size=pagination_size)
+        try:
+            cached_stakers_map, distribution = self.__stake_distributions[duration]
+            if cached_stakers_map is stakers_map:
+                return distribution
+        except KeyError:
+            pass
+
+        distribution = StakeDistribution(stakers_map=stakers_map)
+        self.__stake_distributions[duration] = (stakers_map, distribution)
+        return distribution
+
     #
     # Staker Network Status
     #
@@ -243,11 +421,17 @@ class StakingEscrowAgent(EthereumContractAgent):
         """Returns the current period"""
         return self.contract.functions.getCurrentPeriod().call()
 
+    @contract_api(CONTRACT_CALL)
+    def get_seconds_per_period(self) -> int:
+        """Returns the duration of a period, in seconds"""
+        return self.contract.functions.secondsPerPeriod().call()
+
     @contract_api(CONTRACT_CALL)
     def get_stakers(self) -> List[ChecksumAddress]:
         """Returns a list of stakers"""
         num_stakers: int = self.get_staker_population()
-        stakers: List[ChecksumAddress] = [self.contract.functions.stakers(i).call() for i in range(num_stakers)]
+        stakers: List[ChecksumAddress] = ContractCallBatch.call_all(self.contract.functions.stakers(i)
+                                                                    for i in range(num_stakers))
         return stakers
 
     @contract_api(CONTRACT_CALL)
@@ -259,15 +443,15 @@ class StakingEscrowAgent(EthereumContractAgent):
         The third contains stakers that have missed commitments before current period
         """
 
-        num_stakers: int = self.get_staker_population()
+        stakers: List[ChecksumAddress] = self.get_stakers()
         current_period: Period = self.get_current_period()
         active_stakers: List[ChecksumAddress] = list()
         pending_stakers: List[ChecksumAddress] = list()
         missing_stakers: List[ChecksumAddress] = list()
 
-        for i in range(num_stakers):
-            staker = self.contract.functions.stakers(i).call()
-            last_committed_period = self.get_last_committed_period(staker)
+        last_committed_periods: List[Period] = ContractCallBatch.call_all(
+            self.contract.functions.getLastCommittedPeriod(staker) for staker in stakers)
+        for staker, last_committed_period in zip(stakers, last_committed_periods):
             if last_committed_period == current_period + 1:
                 active_stakers.append(staker)
             elif last_committed_period == current_period:
@@ -279,10 +463,23 @@ class StakingEscrowAgent(EthereumContractAgent):
 
     @contract_api(CONTRACT_CALL)
     def get_all_active_stakers(self, periods: int, pagination_size: Optional[int] = None) -> Tuple[NuNits, Dict[ChecksumAddress, NuNits]]:
-        """Only stakers which committed to the current period (in the previous period) are used."""
+        """
+        Only stakers which committed to the current period (in the previous period) are used.
+        Results are cached for the rest of the period in `active_stakers_cache`; the returned map is shared
+        and must not be modified.
+        """
         if not periods > 0:
             raise ValueError("Period must be > 0")
 
+        current_period = self.get_current_period()
+        active_stakers = self.active_stakers_cache.get(self.contract_address, current_period, periods)
+        if active_stakers is None:
+            active_stakers = self._get_all_active_stakers(periods=periods, pagination_size=pagination_size)
+            self.active_stakers_cache.put(self.contract_address, current_period, periods, active_stakers)
+        return active_stakers
+
+    def _get_all_active_stakers(self, periods: int, pagination_size: Optional[int] = None) -> Tuple[NuNits, Dict[ChecksumAddress, NuNits]]:
+
         if pagination_size is None:
             pagination_size = StakingEscrowAgent.DEFAULT_PAGINATION_SIZE if self.blockchain.is_light else 0
         elif pagination_size < 0:
@@ -352,6 +549,13 @@ class StakingEscrowAgent(EthereumContractAgent):
         info: list = self.contract.functions.stakerInfo(staker_address).call()
         return StakerInfo(*info[0:9])
 
+    @contract_api(CONTRACT_CALL)
+    def get_staker_info_of(self, staker_addresses: Iterable[ChecksumAddress]) -> List[StakerInfo]:
+        """Like `get_staker_info`, for many stakers at once."""
+        infos: List[list] = ContractCallBatch.call_all(self.contract.functions.stakerInfo(staker)
+                                                       for staker in staker_addresses)
+        return [StakerInfo(*info[0:9]) for info in infos]
+
     @contract_api(CONTRACT_CALL)
     def get_locked_tokens(self, staker_address: ChecksumAddress, periods: int = 0) -> NuNits:
         """
@@ -362,6 +566,15 @@ class StakingEscrowAgent(EthereumContractAgent):
             raise ValueError(f"Periods value must not be negative, Got '{periods}'.")
         return NuNits(self.contract.functions.getLockedTokens(staker_address, periods).call())
 
+    @contract_api(CONTRACT_CALL)
+    def get_locked_tokens_of(self, staker_addresses: Iterable[ChecksumAddress], periods: int = 0) -> List[NuNits]:
+        """Like `get_locked_tokens`, for many stakers at once."""
+        if periods < 0:
+            raise ValueError(f"Periods value must not be negative, Got '{periods}'.")
+        locked_tokens: List[int] = ContractCallBatch.call_all(self.contract.functions.getLockedTokens(staker, periods)
+                                                              for staker in staker_addresses)
+        return [NuNits(tokens) for tokens in locked_tokens]
+
     @contract_api(CONTRACT_CALL)
     def owned_tokens(self, staker_address: ChecksumAddress) -> NuNits:
         """
@@ -369,6 +582,13 @@ class StakingEscrowAgent(EthereumContractAgent):
         """
         return NuNits(self.contract.functions.getAllTokens(staker_address).call())
 
+    @contract_api(CONTRACT_CALL)
+    def owned_tokens_of(self, staker_addresses: Iterable[ChecksumAddress]) -> List[NuNits]:
+        """Like `owned_tokens`, for many stakers at once."""
+        owned_tokens: List[int] = ContractCallBatch.call_all(self.contract.functions.getAllTokens(staker)
+                                                             for staker in staker_addresses)
+        return [NuNits(tokens) for tokens in owned_tokens]
+
     @contract_api(CONTRACT_CALL)
     def get_substake_info(self, staker_address: ChecksumAddress, stake_index: int) -> SubStakeInfo:
         first_period, *others, locked_value = self.contract.functions.getSubStakeInfo(staker_address, stake_index).call()
@@ -382,11 +602,32 @@ class StakingEscrowAgent(EthereumContractAgent):
 
     @contract_api(CONTRACT_CALL)
     def get_all_stakes(self, staker_address: ChecksumAddress) -> Iterable[SubStakeInfo]:
-        stakes_length: int = self.contract.functions.getSubStakesLength(staker_address).call()
-        if stakes_length == 0:
-            return iter(())  # Empty iterable, There are no stakes
-        for stake_index in range(stakes_length):
-            yield self.get_substake_info(staker_address=staker_address, stake_index=stake_index)
+        return iter(self.get_all_stakes_of(staker_addresses=[staker_address])[staker_address])
+
+    @contract_api(CONTRACT_CALL)
+    def get_all_stakes_of(self, staker_addresses: Iterable[ChecksumAddress]) -> Dict[ChecksumAddress, List[SubStakeInfo]]:
+        """
+        Returns the substakes of each of the given stakers.  All the stakers' substakes are read
+        together, in two rounds of batched calls: one for their number, and one for their contents.
+        """
+        staker_addresses = list(staker_addresses)
+        stakes_lengths: List[int] = ContractCallBatch.call_all(self.contract.functions.getSubStakesLength(staker)
+                                                               for staker in staker_addresses)
+
+        substakes = [(staker, stake_index)
+                     for staker, stakes_length in zip(staker_addresses, stakes_lengths)
+                     for stake_index in range(stakes_length)]
+        batch = ContractCallBatch()
+        for staker, stake_index in substakes:
+            batch.add(self.contract.functions.getSubStakeInfo(staker, stake_index))
+            batch.add(self.contract.functions.getLastPeriodOfSubStake(staker, stake_index))
+        results = batch.call()
+
+        all_stakes = {staker: list() for staker in staker_addresses}
+        for position, (staker, stake_index) in enumerate(substakes):
+            (first_period, *others, locked_value), last_period = results[2 * position:2 * position + 2]
+            all_stakes[staker].append(SubStakeInfo(first_period, last_period, locked_value))
+        return all_stakes
 
     @contract_api(TRANSACTION)
     def deposit_tokens(self,
@@ -404,6 +645,7 @@ class StakingEscrowAgent(EthereumContractAgent):
             sender_address = staker_address
         contract_function: ContractFunction = self.contract.functions.deposit(staker_address, amount, lock_periods)
         receipt: TxReceipt = self.blockchain.send_transaction(contract_function=contract_function, sender_address=sender_address)
+        self.active_stakers_cache.invalidate(self.contract_address)
         return receipt
 
     @contract_api(CONTRACT_CALL)
@@ -435,8 +677,13 @@ class StakingEscrowAgent(EthereumContractAgent):
                       lock_periods: List[PeriodDelta],
                       sender_address: ChecksumAddress,
                       dry_run: bool = False,
-                      gas_limit: Optional[Wei] = None
-                      ) -> Union[TxReceipt, Wei]:
+                      gas_limit: Optional[Wei] = None,
+                      wait: bool = True
+                      ) -> Union[TxReceipt, Wei, Future]:
+        """
+        Deposits the given substakes for many stakers in a single transaction.  With `dry_run`, only estimates
+        the gas needed; unless `wait` is True, returns a future of the receipt as soon as the transaction is broadcast.
+        """
 
         min_gas_batch_deposit: Wei = Wei(250_000)  # TODO: move elsewhere?
         if gas_limit and gas_limit < min_gas_batch_deposit:
@@ -451,10 +698,17 @@ class StakingEscrowAgent(EthereumContractAgent):
             if gas_limit and estimated_gas > gas_limit:
                 raise ValueError(f"Estimated gas for transaction exceeds gas limit {gas_limit}")
             return estimated_gas
+        elif not wait:
+            future = self.blockchain.submit_transaction(contract_function=contract_function,
+                                                        sender_address=sender_address,
+                                                        transaction_gas_limit=gas_limit)
+            future.add_done_callback(lambda _: self.active_stakers_cache.invalidate(self.contract_address))
+            return future
         else:
             receipt = self.blockchain.send_transaction(contract_function=contract_function,
                                                        sender_address=sender_address,
                                                        transaction_gas_limit=gas_limit)
+            self.active_stakers_cache.invalidate(self.contract_address)
             return receipt
 
     @contract_api(TRANSACTION)
@@ -466,12 +720,14 @@ class StakingEscrowAgent(EthereumContractAgent):
                      ) -> TxReceipt:
         contract_function: ContractFunction = self.contract.functions.divideStake(stake_index, target_value, periods)
         receipt = self.blockchain.send_transaction(contract_function=contract_function, sender_address=staker_address)
+        self.active_stakers_cache.invalidate(self.contract_address)
         return receipt
 
     @contract_api(TRANSACTION)
     def prolong_stake(self, staker_address: ChecksumAddress, stake_index: int, periods: PeriodDelta) -> TxReceipt:
         contract_function: ContractFunction = self.contract.functions.prolongStake(stake_index, periods)
         receipt = self.blockchain.send_transaction(contract_function=contract_function, sender_address=staker_address)
+        self.active_stakers_cache.invalidate(self.contract_address)
         return receipt
 
     @contract_api(CONTRACT_CALL)
@@ -491,11 +747,32 @@ class StakingEscrowAgent(EthereumContractAgent):
         period: int = self.contract.functions.getLastCommittedPeriod(staker_address).call()
         return Period(period)
 
+    @contract_api(CONTRACT_CALL)
+    def get_last_committed_periods(self, staker_addresses: Iterable[ChecksumAddress]) -> List[Period]:
+        periods: List[int] = ContractCallBatch.call_all(self.contract.functions.getLastCommittedPeriod(staker)
+                                                        for staker in staker_addresses)
+        return [Period(period) for period in periods]
+
+    @contract_api(CONTRACT_CALL)
+    def get_commitment_status(self, staker_address: ChecksumAddress) -> Tuple[Period, Period]:
+        """Returns the current period and the staker's last committed period, read together in a single batch."""
+        current_period, last_committed_period = ContractCallBatch.call_all((
+            self.contract.functions.getCurrentPeriod(),
+            self.contract.functions.getLastCommittedPeriod(staker_address)
+        ))
+        return Period(current_period), Period(last_committed_period)
+
     @contract_api(CONTRACT_CALL)
     def get_worker_from_staker(self, staker_address: ChecksumAddress) -> ChecksumAddress:
         worker: str = self.contract.functions.getWorkerFromStaker(staker_address).call()
         return to_checksum_address(worker)
 
+    @contract_api(CONTRACT_CALL)
+    def get_workers_from_stakers(self, staker_addresses: Iterable[ChecksumAddress]) -> List[ChecksumAddress]:
+        workers: List[str] = ContractCallBatch.call_all(self.contract.functions.getWorkerFromStaker(staker)
+                                                        for staker in staker_addresses)
+        return [to_checksum_address(worker) for worker in workers]
+
     @contract_api(CONTRACT_CALL)
     def get_staker_from_worker(self, worker_address: ChecksumAddress) -> ChecksumAddress:
         staker = self.contract.functions.stakerFromWorker(worker_address).call()
@@ -518,6 +795,7 @@ class StakingEscrowAgent(EthereumContractAgent):
         """
         contract_function: ContractFunction = self.contract.functions.commitToNextPeriod()
         receipt: TxReceipt = self.blockchain.send_transaction(contract_function=contract_function, sender_address=worker_address)
+        self.active_stakers_cache.invalidate(self.contract_address)
         return receipt
 
     @contract_api(TRANSACTION)
@@ -529,6 +807,7 @@ class StakingEscrowAgent(EthereumContractAgent):
         """
         contract_function: ContractFunction = self.contract.functions.mint()
         receipt: TxReceipt = self.blockchain.send_transaction(contract_function=contract_function, sender_address=staker_address)
+        self.active_stakers_cache.invalidate(self.contract_address)
         return receipt
 
     @contract_api(CONTRACT_CALL)
@@ -573,6 +852,13 @@ class StakingEscrowAgent(EthereumContractAgent):
         wind_down_flag, restake_flag, measure_work_flag, snapshot_flag = flags
         return StakerFlags(wind_down_flag, restake_flag, measure_work_flag, snapshot_flag)
 
+    @contract_api(CONTRACT_CALL)
+    def get_flags_of(self, staker_addresses: Iterable[ChecksumAddress]) -> List[StakerFlags]:
+        """Like `get_flags`, for many stakers at once."""
+        all_flags: List[tuple] = ContractCallBatch.call_all(self.contract.functions.getFlags(staker)
+                                                            for staker in staker_addresses)
+        return [StakerFlags(*flags) for flags in all_flags]
+
     @contract_api(CONTRACT_CALL)
     def is_restaking(self, staker_address: ChecksumAddress) -> bool:
         flags = self.get_flags(staker_address)
@@ -582,6 +868,11 @@ class StakingEscrowAgent(EthereumContractAgent):
     def is_restaking_locked(self, staker_address: ChecksumAddress) -> bool:
         return self.contract.functions.isReStakeLocked(staker_address).call()
 
+    @contract_api(CONTRACT_CALL)
+    def are_restaking_locked(self, staker_addresses: Iterable[ChecksumAddress]) -> List[bool]:
+        return ContractCallBatch.call_all(self.contract.functions.isReStakeLocked(staker)
+                                          for staker in staker_addresses)
+
     @contract_api(TRANSACTION)
     def set_restaking(self, staker_address: ChecksumAddress, value: bool) -> TxReceipt:
         """
@@ -590,6 +881,7 @@ class StakingEscrowAgent(EthereumContractAgent):
         """
         contract_function: ContractFunction = self.contract.functions.setReStake(value)
         receipt: TxReceipt = self.blockchain.send_transaction(contract_function=contract_function, sender_address=staker_address)
+        self.active_stakers_cache.invalidate(self.contract_address)
         # TODO: Handle ReStakeSet event (see #1193)
         return receipt
 
@@ -619,6 +911,7 @@ class StakingEscrowAgent(EthereumContractAgent):
         """
         contract_function: ContractFunction = self.contract.functions.setWindDown(value)
         receipt = self.blockchain.send_transaction(contract_function=contract_function, sender_address=staker_address)
+        self.active_stakers_cache.invalidate(self.contract_address)
         # TODO: Handle WindDownSet event (see #1193)
         return receipt
 
@@ -676,9 +969,11 @@ class StakingEscrowAgent(EthereumContractAgent):
         Returns an iterator of all staker addresses via cumulative sum, on-network.
         Staker addresses are returned in the order in which they registered with the StakingEscrow contract's ledger
         """
-        for index in range(self.get_staker_population()):
-            staker_address: ChecksumAddress = self.contract.functions.stakers(index).call()
-            yield staker_address
+        num_stakers: int = self.get_staker_population()
+        batch_size = ContractCallBatch.DEFAULT_BATCH_SIZE
+        for start_index in range(0, num_stakers, batch_size):
+            indices = range(start_index, min(start_index + batch_size, num_stakers))
+            yield from ContractCallBatch.call_all(self.contract.functions.stakers(index) for index in indices)
 
     @contract_api(CONTRACT_CALL)
     def sample(self,
@@ -686,7 +981,8 @@ class StakingEscrowAgent(EthereumContractAgent):
                duration: int,
                additional_ursulas: float = 1.5,
                attempts: int = 5,
-               pagination_size: Optional[int] = None
+               pagination_size: Optional[int] = None,
+               replacement: bool = True
                ) -> List[ChecksumAddress]:
         """
         Select n random Stakers, according to their stake distribution.
@@ -709,38 +1005,33 @@ class StakingEscrowAgent(EthereumContractAgent):
         In this case, Stakers 0, 1, 3 and 5 will be selected.
 
         Only stakers which made a commitment to the current period (in the previous period) are used.
+
+        With `replacement=False`, stakes are sampled without replacement instead:  exactly `quantity` distinct
+        stakers are drawn in one pass, and `additional_ursulas` and `attempts` are unused.
         """
 
         system_random = random.SystemRandom()
-        n_tokens, stakers_map = self.get_all_active_stakers(periods=duration, pagination_size=pagination_size)
+        distribution = self.get_stake_distribution(duration=duration, pagination_size=pagination_size)
+        n_tokens = distribution.total_stake
         if n_tokens == 0:
             raise self.NotEnoughStakers('There are no locked tokens for duration {}.'.format(duration))
 
+        if not replacement:
+            if quantity > len(distribution):
+                raise self.NotEnoughStakers(f'Cannot sample {quantity} out of {len(distribution)} stakers.')
+            addresses = distribution.sample_without_replacement(quantity=quantity, rng=system_random)
+            self.log.debug(f"Sampled {len(addresses)} stakers: {addresses}")
+            if len(addresses) < quantity:
+                raise self.NotEnoughStakers(f'Only {len(addresses)} stakers have tokens locked for duration {duration}.')
+            return addresses
+
         sample_size = quantity
         for _ in range(attempts):
             sample_size = math.ceil(sample_size * additional_ursulas)
-            points = sorted(system_random.randrange(n_tokens) for _ in range(sample_size))
+            points = [system_random.randrange(n_tokens) for _ in range(sample_size)]
             self.log.debug(f"Sampling {sample_size} stakers with random points: {points}")
 
-            addresses = set()
-            stakers = list(stakers_map.items())
-
-            point_index = 0
-            sum_of_locked_tokens = 0
-            staker_index = 0
-            stakers_len = len(stakers)
-            while staker_index < stakers_len and point_index < sample_size:
-                current_staker = stakers[staker_index][0]
-                staker_tokens = stakers[staker_index][1]
-                next_sum_value = sum_of_locked_tokens + staker_tokens
-
-                point = points[point_index]
-                if sum_of_locked_tokens <= point < next_sum_value:
-                    addresses.add(to_checksum_address(current_staker))
-                    point_index += 1
-                else:
-                    staker_index += 1
-                    sum_of_locked_tokens = next_sum_value
+            addresses = set(distribution.sample_with_replacement(points))
 
             self.log.debug(f"Sampled {len(addresses)} stakers: {list(addresses)}")
             if len(addresses) >= quantity:
@@ -880,6 +1171,13 @@ class PolicyManagerAgent(EthereumContractAgent):
         fee_amount = self.contract.functions.nodes(staker_address).call()[0]
         return fee_amount
 
+    @contract_api(CONTRACT_CALL)
+    def get_fee_amounts(self, staker_addresses: Iterable[ChecksumAddress]) -> List[Wei]:
+        """Like `get_fee_amount`, for many stakers at once."""
+        nodes: List[list] = ContractCallBatch.call_all(self.contract.functions.nodes(staker)
+                                                       for staker in staker_addresses)
+        return [node_info[0] for node_info in nodes]
+
     @contract_api(CONTRACT_CALL)
     def get_fee_rate_range(self) -> Tuple[Wei, Wei, Wei]:
         """Check minimum, default & maximum fee rate for all policies ('global fee range')"""
@@ -892,6 +1190,12 @@ class PolicyManagerAgent(EthereumContractAgent):
         min_rate = self.contract.functions.getMinFeeRate(staker_address).call()
         return min_rate
 
+    @contract_api(CONTRACT_CALL)
+    def get_min_fee_rates(self, staker_addresses: Iterable[ChecksumAddress]) -> List[Wei]:
+        """Like `get_min_fee_rate`, for many stakers at once."""
+        return ContractCallBatch.call_all(self.contract.functions.getMinFeeRate(staker)
+                                          for staker in staker_addresses)
+
     @contract_api(CONTRACT_CALL)
     def get_raw_min_fee_rate(self, staker_address: ChecksumAddress) -> Wei:
         """Check minimum acceptable fee rate set by staker for their associated worker"""
@@ -1027,6 +1331,7 @@ class PreallocationEscrowAgent(EthereumContractAgent):
     def lock(self, amount: NuNits, periods: PeriodDelta) -> TxReceipt:
         contract_function: ContractFunction = self.__interface_contract.functions.lockAndCreate(amount, periods)
         receipt = self.blockchain.send_transaction(contract_function=contract_function, sender_address=self.__beneficiary)
+        StakingEscrowAgent.active_stakers_cache.invalidate()
         return receipt
 
     @contract_api(TRANSACTION)
@@ -1045,6 +1350,7 @@ class PreallocationEscrowAgent(EthereumContractAgent):
     def deposit_as_staker(self, amount: NuNits, lock_periods: PeriodDelta) -> TxReceipt:
         contract_function: ContractFunction = self.__interface_contract.functions.depositAsStaker(amount, lock_periods)
         receipt = self.blockchain.send_transaction(contract_function=contract_function, sender_address=self.__beneficiary)
+        StakingEscrowAgent.active_stakers_cache.invalidate()
         return receipt
 
     @contract_api(TRANSACTION)
@@ -1068,6 +1374,7 @@ class PreallocationEscrowAgent(EthereumContractAgent):
     def mint(self) -> TxReceipt:
         contract_function: ContractFunction = self.__interface_contract.functions.mint()
         receipt = self.blockchain.send_transaction(contract_function=contract_function, sender_address=self.__beneficiary)
+        StakingEscrowAgent.active_stakers_cache.invalidate()
         return receipt
 
     @contract_api(TRANSACTION)
@@ -1091,6 +1398,7 @@ class PreallocationEscrowAgent(EthereumContractAgent):
         contract_function: ContractFunction = self.__interface_contract.functions.setReStake(value)
         receipt = self.blockchain.send_transaction(contract_function=contract_function, sender_address=self.__beneficiary)
         # TODO: Handle ReStakeSet event (see #1193)
+        StakingEscrowAgent.active_stakers_cache.invalidate()
         return receipt
 
     @contract_api(TRANSACTION)
@@ -1109,6 +1417,7 @@ class PreallocationEscrowAgent(EthereumContractAgent):
         contract_function: ContractFunction = self.__interface_contract.functions.setWindDown(value)
         receipt = self.blockchain.send_transaction(contract_function=contract_function, sender_address=self.__beneficiary)
         # TODO: Handle WindDownSet event (see #1193)
+        StakingEscrowAgent.active_stakers_cache.invalidate()
         return receipt
 
 
@@ -0,0 +1,112 @@
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import requests
+from hexbytes import HexBytes
+from twisted.logger import Logger
+from typing import Any, Dict, Iterable, List, Tuple
+from web3 import HTTPProvider
+from web3._utils.abi import get_abi_output_types, map_abi_data
+from web3._utils.normalizers import BASE_RETURN_NORMALIZERS
+from web3.contract import ContractFunction
+
+
+def json_rpc_batch(provider: HTTPProvider, calls: List[Tuple[str, list]]) -> Dict[int, dict]:
+    """
+    Sends (method, params) calls to an HTTP provider as a single JSON-RPC batch request,
+    returning the responses keyed by the index of their call.
+    """
+    payload = [{'jsonrpc': '2.0', 'id': request_id, 'method': method, 'params': params}
+               for request_id, (method, params) in enumerate(calls)]
+    response = requests.post(provider.endpoint_uri, json=payload, **provider.get_request_kwargs())
+    response.raise_for_status()
+    return {result['id']: result for result in response.json()}
+
+
+class ContractCallBatch:
+    """
+    Aggregates many read-only contract function calls into a few JSON-RPC batch requests.
+
+    Providers that can't take batch requests (IPC, websockets and the test providers) are
+    called one function at a time, as are any calls that fail within a batch, so that errors
+    surface exactly as they would from `ContractFunction.call()`.
+    """
+
+    DEFAULT_BATCH_SIZE = 100
+    log = Logger("contract-call-batch")
+
+    def __init__(self, batch_size: int = DEFAULT_BATCH_SIZE):
+        self.batch_size = batch_size
+        self.__functions = list()  # type: List[ContractFunction]
+
+    def __len__(self) -> int:
+        return len(self.__functions)
+
+    def add(self, contract_function: ContractFunction) -> int:
+        """Adds a call to the batch, returning its index in the results."""
+        self.__functions.append(contract_function)
+        return len(self.__functions) - 1
+
+    def call(self) -> List[Any]:
+        """Performs every call in the batch, returning their results in order."""
+        functions, self.__functions = self.__functions, list()
+        results = list()
+        for start in range(0, len(functions), self.batch_size):
+            results.extend(self._call_chunk(functions[start:start + self.batch_size]))
+        return results
+
+    @classmethod
+    def call_all(cls, contract_functions: Iterable[ContractFunction], batch_size: int = DEFAULT_BATCH_SIZE) -> List[Any]:
+        batch = cls(batch_size=batch_size)
+        for contract_function in contract_functions:
+            batch.add(contract_function)
+        return batch.call()
+
+    def _call_chunk(self, functions: List[ContractFunction]) -> List[Any]:
+        if not functions:
+            return []
+
+        provider = functions[0].web3.provider
+        if len(functions) == 1 or not isinstance(provider, HTTPProvider):
+            return [function.call() for function in functions]
+
+        calls = [('eth_call', [{'to': function.address, 'data': function._encode_transaction_data()}, 'latest'])
+                 for function in functions]
+        try:
+            responses = json_rpc_batch(provider, calls)
+        except (requests.RequestException, ValueError, TypeError, KeyError) as e:
+            # Not every node (or proxy in front of one) accepts batch requests.
+            self.log.debug(f"Batch of {len(functions)} calls failed ({e}); calling one at a time.")
+            return [function.call() for function in functions]
+
+        results = list()
+        for request_id, function in enumerate(functions):
+            result = responses.get(request_id, dict())
+            if 'result' not in result:
+                results.append(function.call())  # Raises, just as an individual call would.
+                continue
+            results.append(self._decode(function, result['result']))
+        return results
+
+    @staticmethod
+    def _decode(function: ContractFunction, return_data: str) -> Any:
+        output_types = get_abi_output_types(function.abi)
+        output_data = function.web3.codec.decode_abi(output_types, HexBytes(return_data))
+        normalized_data = map_abi_data(BASE_RETURN_NORMALIZERS, output_types, output_data)
+        if len(normalized_data) == 1:
+            return normalized_data[0]
+        return normalized_data
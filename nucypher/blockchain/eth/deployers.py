@@ -445,6 +445,7 @@ class ProxyContractDeployer(BaseContractDeployer):
         upgrade_receipt = self.blockchain.send_transaction(contract_function=upgrade_function,
                                                            sender_address=self.deployer_address,
                                                            transaction_gas_limit=gas_limit)
+        self.blockchain.clear_contract_cache()
         return upgrade_receipt
 
     def build_retarget_transaction(self,
@@ -466,6 +467,7 @@ class ProxyContractDeployer(BaseContractDeployer):
         rollback_receipt = self.blockchain.send_transaction(contract_function=rollback_function,
                                                             sender_address=self.deployer_address,
                                                             payload=origin_args)
+        self.blockchain.clear_contract_cache()
         return rollback_receipt
 
 
@@ -14,24 +14,129 @@ GNU Affero General Public License for more details.
 You should have received a copy of the GNU Affero General Public License
 along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
 """
-from web3.contract import Contract
+import json
+import requests
+import sqlite3
+import threading
+from collections import OrderedDict
+from hexbytes import HexBytes
+from twisted.logger import Logger
+from typing import Dict, Iterable, Iterator, List, Optional, Union
+from web3 import HTTPProvider, Web3
+from web3.contract import Contract, ContractEvent
+from web3.exceptions import BlockNotFound
 
+from nucypher.blockchain.eth.batch import json_rpc_batch
 from nucypher.blockchain.eth.interfaces import BlockchainInterfaceFactory
 
 
+class BlockHeaderCache:
+    """
+    Process-wide LRU cache of the block metadata needed by events, keyed by block hash
+    (so that it is never confused by reorganizations or by development chains being reset).
+    Headers which are missing are fetched together, in JSON-RPC batches where the provider allows it.
+    """
+
+    DEFAULT_MAX_SIZE = 10_000
+    BATCH_SIZE = 100
+
+    log = Logger('block-headers')
+
+    def __init__(self, max_size: int = DEFAULT_MAX_SIZE):
+        self.max_size = max_size
+        self.__headers = OrderedDict()  # type: OrderedDict[HexBytes, dict]
+        self.__lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.__headers)
+
+    def __contains__(self, block_hash: bytes) -> bool:
+        return HexBytes(block_hash) in self.__headers
+
+    def get(self, w3: Web3, block_hash: bytes, batch: Iterable[bytes] = ()) -> dict:
+        """Returns the header of `block_hash`, fetching those of any uncached blocks in `batch` along with it."""
+        block_hash = HexBytes(block_hash)
+        with self.__lock:
+            header = self.__headers.get(block_hash)
+            if header is not None:
+                self.__headers.move_to_end(block_hash)
+                return header
+        fetched_headers = self.fetch(w3, [block_hash, *batch])
+        try:
+            return fetched_headers[block_hash]
+        except KeyError:  # Another thread got to it first.
+            with self.__lock:
+                return self.__headers[block_hash]
+
+    def fetch(self, w3: Web3, block_hashes: Iterable[bytes]) -> Dict[HexBytes, dict]:
+        """Fetches the headers of those `block_hashes` which aren't cached yet, returning them."""
+        with self.__lock:
+            missing = list(OrderedDict.fromkeys(HexBytes(h) for h in block_hashes if HexBytes(h) not in self.__headers))
+        fetched_headers = dict()
+        for start in range(0, len(missing), self.BATCH_SIZE):
+            chunk = missing[start:start + self.BATCH_SIZE]
+            fetched_headers.update(zip(chunk, self._fetch_headers(w3, chunk)))
+        with self.__lock:
+            for block_hash, header in fetched_headers.items():
+                self.__headers[block_hash] = header
+                self.__headers.move_to_end(block_hash)
+            while len(self.__headers) > self.max_size:
+                self.__headers.popitem(last=False)
+        return fetched_headers
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__headers.clear()
+
+    def _fetch_headers(self, w3: Web3, block_hashes: List[HexBytes]) -> List[dict]:
+        if len(block_hashes) > 1 and isinstance(w3.provider, HTTPProvider):
+            calls = [('eth_getBlockByHash', [block_hash.hex(), False]) for block_hash in block_hashes]
+            try:
+                responses = json_rpc_batch(w3.provider, calls)
+                return [{'number': int(responses[i]['result']['number'], 16),
+                         'timestamp': int(responses[i]['result']['timestamp'], 16)}
+                        for i in range(len(block_hashes))]
+            except (requests.RequestException, ValueError, TypeError, KeyError) as e:
+                self.log.debug(f"Batch of {len(block_hashes)} block requests failed ({e}); fetching one at a time.")
+        headers = list()
+        for block_hash in block_hashes:
+            block = w3.eth.getBlock(block_hash)
+            headers.append({'number': block['number'], 'timestamp': block['timestamp']})
+        return headers
+
+
 class EventRecord:
-    def __init__(self, event: dict):
+
+    # Shared by all events, so that a block's header is fetched at most once per process.
+    block_headers = BlockHeaderCache()
+
+    def __init__(self, event: dict, timestamp: Optional[int] = None, batch: Iterable[bytes] = ()):
+        """
+        The block timestamp is only fetched when it is first read.  Events materialized together can share
+        a `batch` of block hashes, so that the first timestamp read fetches the headers of all of them at once.
+        """
         self.raw_event = dict(event)
         self.args = dict(event['args'])
         self.block_number = event['blockNumber']
+        self.block_hash = event.get('blockHash')
         self.transaction_hash = event['transactionHash'].hex()
+        self.__timestamp = timestamp
+        self.__batch = batch
 
-        try:
-            blockchain = BlockchainInterfaceFactory.get_interface()
-        except BlockchainInterfaceFactory.NoRegisteredInterfaces:
-            self.timestamp = None
-        else:
-            self.timestamp = blockchain.client.w3.eth.getBlock(self.block_number)['timestamp'],
+    @property
+    def timestamp(self) -> Optional[int]:
+        if self.__timestamp is None:
+            try:
+                blockchain = BlockchainInterfaceFactory.get_interface()
+            except BlockchainInterfaceFactory.NoRegisteredInterfaces:
+                return None
+            w3 = blockchain.client.w3
+            if self.block_hash is None:
+                self.__timestamp = w3.eth.getBlock(self.block_number)['timestamp']
+            else:
+                self.__timestamp = self.block_headers.get(w3, self.block_hash, batch=self.__batch)['timestamp']
+            self.__batch = ()
+        return self.__timestamp
 
     def __repr__(self):
         pairs_to_show = dict(self.args.items())
@@ -41,10 +146,196 @@ class EventRecord:
         return r
 
 
+class EventIndex:
+    """
+    Local SQLite index of contract events and the timestamps of the blocks they were emitted in.
+
+    Logs are ingested incrementally, in bounded block ranges, the first time a range is queried;
+    afterwards, queries over that range are answered from the index without touching the chain.
+    The most recent `finality_depth` blocks could still be reorganized, so they are never indexed
+    and are always read from the chain.
+    """
+
+    DEFAULT_CHUNK_SIZE = 5_000  # blocks per eth_getLogs request
+    DEFAULT_FINALITY_DEPTH = 12
+
+    _SCHEMA = (
+        "CREATE TABLE IF NOT EXISTS events ("
+        "chain_id INTEGER, contract TEXT, event_name TEXT, block_number INTEGER, log_index INTEGER, "
+        "transaction_index INTEGER, transaction_hash TEXT, block_hash TEXT, args TEXT, "
+        "PRIMARY KEY (chain_id, contract, block_number, log_index))",
+        "CREATE INDEX IF NOT EXISTS events_by_name ON events (chain_id, contract, event_name, block_number)",
+        "CREATE TABLE IF NOT EXISTS indexed_ranges ("
+        "chain_id INTEGER, contract TEXT, event_name TEXT, first_block INTEGER, last_block INTEGER, "
+        "last_block_hash TEXT, PRIMARY KEY (chain_id, contract, event_name))",
+        "CREATE TABLE IF NOT EXISTS block_timestamps ("
+        "chain_id INTEGER, block_number INTEGER, timestamp INTEGER, PRIMARY KEY (chain_id, block_number))",
+    )
+
+    log = Logger('event-index')
+
+    def __init__(self,
+                 filepath: str = ':memory:',
+                 chunk_size: int = DEFAULT_CHUNK_SIZE,
+                 finality_depth: int = DEFAULT_FINALITY_DEPTH):
+        self.filepath = filepath
+        self.chunk_size = chunk_size
+        self.finality_depth = finality_depth
+        self.__lock = threading.Lock()
+        self.__db = sqlite3.connect(filepath, check_same_thread=False)
+        with self.__db:
+            for statement in self._SCHEMA:
+                self.__db.execute(statement)
+
+    def close(self) -> None:
+        self.__db.close()
+
+    def events(self,
+               contract_event: ContractEvent,
+               from_block: Union[int, str] = 0,
+               to_block: Union[int, str] = 'latest',
+               argument_filters: Optional[Dict] = None
+               ) -> Iterator[EventRecord]:
+        """Yields the events of type `contract_event` emitted within the (inclusive) block range, in order."""
+        latest_block = contract_event.web3.eth.blockNumber
+        from_block = latest_block if from_block == 'latest' else from_block
+        to_block = latest_block if to_block == 'latest' else to_block
+        argument_filters = argument_filters or dict()
+        final_block = min(to_block, latest_block - self.finality_depth)
+
+        records = list()
+        if from_block <= final_block:
+            with self.__lock:
+                records.extend(self.__indexed_events(contract_event, from_block, final_block))
+        if to_block > final_block:
+            entries = contract_event.getLogs(argument_filters=argument_filters,
+                                             fromBlock=max(from_block, final_block + 1),
+                                             toBlock=to_block)
+            batch = [entry['blockHash'] for entry in entries]
+            records.extend(EventRecord(entry, batch=batch) for entry in entries)
+
+        for record in records:
+            if self._matches(record, argument_filters):
+                yield record
+
+    @staticmethod
+    def _matches(record: EventRecord, argument_filters: Dict) -> bool:
+        for name, expected in argument_filters.items():
+            accepted = expected if isinstance(expected, (list, tuple, set)) else (expected, )
+            if record.args.get(name) not in accepted:
+                return False
+        return True
+
+    def __indexed_events(self, contract_event: ContractEvent, from_block: int, to_block: int) -> List[EventRecord]:
+        chain_id = int(contract_event.web3.eth.chainId)
+        self.__ensure_indexed(contract_event, chain_id, from_block, to_block)
+
+        rows = self.__db.execute(
+            "SELECT e.block_number, e.log_index, e.transaction_index, e.transaction_hash, e.block_hash, e.args, "
+            "b.timestamp FROM events e LEFT JOIN block_timestamps b "
+            "ON b.chain_id = e.chain_id AND b.block_number = e.block_number "
+            "WHERE e.chain_id = ? AND e.contract = ? AND e.event_name = ? AND e.block_number BETWEEN ? AND ? "
+            "ORDER BY e.block_number, e.log_index",
+            (chain_id, contract_event.address, contract_event.event_name, from_block, to_block))
+
+        records = list()
+        for block_number, log_index, transaction_index, transaction_hash, block_hash, args, timestamp in rows:
+            entry = {'args': json.loads(args, object_hook=self._decode_bytes),
+                     'event': contract_event.event_name,
+                     'logIndex': log_index,
+                     'transactionIndex': transaction_index,
+                     'transactionHash': HexBytes(transaction_hash),
+                     'address': contract_event.address,
+                     'blockHash': HexBytes(block_hash),
+                     'blockNumber': block_number}
+            records.append(EventRecord(entry, timestamp=timestamp))
+        return records
+
+    def __ensure_indexed(self, contract_event: ContractEvent, chain_id: int, from_block: int, to_block: int) -> None:
+        key = (chain_id, contract_event.address, contract_event.event_name)
+        indexed_range = self.__db.execute("SELECT first_block, last_block, last_block_hash FROM indexed_ranges "
+                                          "WHERE chain_id = ? AND contract = ? AND event_name = ?", key).fetchone()
+        if indexed_range:
+            first_block, last_block, last_block_hash = indexed_range
+            try:
+                chain_block_hash = contract_event.web3.eth.getBlock(last_block)['hash'].hex()
+            except BlockNotFound:
+                chain_block_hash = None  # The chain is now shorter than what we indexed.
+            if chain_block_hash != last_block_hash:
+                # The chain we indexed is gone (e.g. a development chain was reset).
+                self.log.info(f"Discarding stale index of {contract_event.event_name} events of {contract_event.address}")
+                with self.__db:
+                    self.__db.execute("DELETE FROM events WHERE chain_id = ? AND contract = ? AND event_name = ?", key)
+                    self.__db.execute("DELETE FROM indexed_ranges WHERE chain_id = ? AND contract = ? AND event_name = ?", key)
+                indexed_range = None
+
+        if not indexed_range:
+            first_block, last_block = from_block, from_block - 1
+
+        # Grow the indexed range backwards, then forwards, so that it is always contiguous.
+        for chunk_end in range(first_block - 1, from_block - 1, -self.chunk_size):
+            chunk_start = max(from_block, chunk_end - self.chunk_size + 1)
+            self.__ingest(contract_event, chain_id, chunk_start, chunk_end, first_block=chunk_start, last_block=last_block)
+            first_block = chunk_start
+        for chunk_start in range(last_block + 1, to_block + 1, self.chunk_size):
+            chunk_end = min(to_block, chunk_start + self.chunk_size - 1)
+            self.__ingest(contract_event, chain_id, chunk_start, chunk_end, first_block=first_block, last_block=chunk_end)
+            last_block = chunk_end
+
+    def __ingest(self,
+                 contract_event: ContractEvent,
+                 chain_id: int,
+                 chunk_start: int,
+                 chunk_end: int,
+                 first_block: int,
+                 last_block: int
+                 ) -> None:
+        w3 = contract_event.web3
+        entries = contract_event.getLogs(fromBlock=chunk_start, toBlock=chunk_end)
+
+        known_blocks = {row[0] for row in self.__db.execute(
+            "SELECT block_number FROM block_timestamps WHERE chain_id = ? AND block_number BETWEEN ? AND ?",
+            (chain_id, chunk_start, chunk_end))}
+        unknown_blocks = {entry['blockNumber']: entry['blockHash']
+                          for entry in entries if entry['blockNumber'] not in known_blocks}
+
+        # The headers of all the blocks are fetched (in batches) along with the first one.
+        batch = list(unknown_blocks.values())
+        timestamps = [(chain_id, block_number, EventRecord.block_headers.get(w3, block_hash, batch=batch)['timestamp'])
+                      for block_number, block_hash in unknown_blocks.items()]
+        last_block_hash = w3.eth.getBlock(last_block)['hash'].hex()
+
+        with self.__db:  # Events and the range they belong to are committed together.
+            self.__db.executemany(
+                "INSERT OR REPLACE INTO events VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [(chain_id, contract_event.address, contract_event.event_name, entry['blockNumber'],
+                  entry['logIndex'], entry['transactionIndex'], entry['transactionHash'].hex(),
+                  entry['blockHash'].hex(), json.dumps(dict(entry['args']), default=self._encode_bytes))
+                 for entry in entries])
+            self.__db.executemany("INSERT OR REPLACE INTO block_timestamps VALUES (?, ?, ?)", timestamps)
+            self.__db.execute("INSERT OR REPLACE INTO indexed_ranges VALUES (?, ?, ?, ?, ?, ?)",
+                              (chain_id, contract_event.address, contract_event.event_name,
+                               first_block, last_block, last_block_hash))
+        self.log.debug(f"Indexed {len(entries)} {contract_event.event_name} events in blocks {chunk_start}-{chunk_end}")
+
+    @staticmethod
+    def _encode_bytes(value):
+        if isinstance(value, bytes):
+            return {'__bytes__': bytes(value).hex()}
+        raise TypeError(f"{type(value)} is not JSON serializable")
+
+    @staticmethod
+    def _decode_bytes(value: dict):
+        if set(value) == {'__bytes__'}:
+            return bytes.fromhex(value['__bytes__'])
+        return value
+
+
 class ContractEvents:
 
-    def __init__(self, contract: Contract):
+    def __init__(self, contract: Contract, index: Optional[EventIndex] = None):
         self.contract = contract
+        self.index = index
         self.names = tuple(e.event_name for e in contract.events)
 
     def __get_web3_event_by_name(self, event_name: str):
@@ -63,12 +354,20 @@ class ContractEvents:
             if to_block is None:
                 to_block = 'latest'
 
+            if self.index is not None:
+                yield from self.index.events(event_method,
+                                             from_block=from_block,
+                                             to_block=to_block,
+                                             argument_filters=argument_filters)
+                return
+
             event_filter = event_method.createFilter(fromBlock=from_block,
                                                      toBlock=to_block,
                                                      argument_filters=argument_filters)
             entries = event_filter.get_all_entries()
+            batch = [entry['blockHash'] for entry in entries]
             for entry in entries:
-                yield EventRecord(entry)
+                yield EventRecord(entry, batch=batch)
         return wrapper
 
     def __getattr__(self, event_name: str):
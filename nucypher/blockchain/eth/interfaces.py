@@ -23,6 +23,7 @@ import os
 import pprint
 import requests
 import time
+from concurrent.futures import Future
 from constant_sorrow.constants import (
     INSUFFICIENT_ETH,
     NO_BLOCKCHAIN_CONNECTION,
@@ -35,8 +36,9 @@ from eth_tester import EthereumTester
 from eth_tester.exceptions import TransactionFailed as TestTransactionFailed
 from eth_utils import to_checksum_address
 from twisted.logger import Logger
-from typing import Callable, List, NamedTuple, Tuple, Union
+from typing import Callable, Dict, List, NamedTuple, Tuple, Union
 from urllib.parse import urlparse
+from weakref import WeakKeyDictionary
 from web3 import HTTPProvider, IPCProvider, Web3, WebsocketProvider, middleware
 from web3.contract import Contract, ContractConstructor, ContractFunction
 from web3.exceptions import TimeExhausted, ValidationError
@@ -45,6 +47,7 @@ from web3.middleware import geth_poa_middleware
 
 from nucypher.blockchain.eth.clients import EthereumClient, POA_CHAINS
 from nucypher.blockchain.eth.decorators import validate_checksum_address
+from nucypher.blockchain.eth.pipeline import TransactionPipeline
 from nucypher.blockchain.eth.providers import (
     _get_auto_provider,
     _get_HTTP_provider,
@@ -227,6 +230,9 @@ class BlockchainInterface:
         self.transacting_power = READ_ONLY_INTERFACE
         self.is_light = light
         self.gas_strategy = self.get_gas_strategy(gas_strategy)
+        self.__transaction_pipeline = None
+        self.__contracts = WeakKeyDictionary()  # type: WeakKeyDictionary  # registry index -> {lookup: contract}
+        self.__proxy_targets = dict()           # type: Dict[str, str]
 
     def __repr__(self):
         r = '{name}({uri})'.format(name=self.__class__.__name__, uri=self.provider_uri)
@@ -469,14 +475,17 @@ class BlockchainInterface:
                           sender_address: str,
                           payload: dict = None,
                           transaction_gas_limit: int = None,
+                          nonce: int = None
                           ) -> dict:
 
         #
         # Build Payload
         #
 
+        if nonce is None:
+            nonce = self.client.w3.eth.getTransactionCount(sender_address, 'pending')
         base_payload = {'chainId': int(self.client.chain_id),
-                        'nonce': self.client.w3.eth.getTransactionCount(sender_address, 'pending'),
+                        'nonce': nonce,
                         'from': sender_address,
                         'gasPrice': self.client.gas_price}
 
@@ -541,6 +550,11 @@ class BlockchainInterface:
             txhash = self.client.send_raw_transaction(signed_raw_transaction)  # <--- BROADCAST
         except (TestTransactionFailed, ValueError) as error:
             raise  # TODO: Unify with Transaction failed handling
+        finally:
+            # Whether or not it was accepted, this transaction's nonce wasn't counted by the pipeline.
+            sender_address = transaction_dict.get('from')
+            if self.__transaction_pipeline is not None and sender_address:
+                self.__transaction_pipeline.resync_nonce(sender_address)
 
         #
         # Receipt
@@ -554,9 +568,11 @@ class BlockchainInterface:
         else:
             self.log.debug(f"[RECEIPT-{transaction_name}] | txhash: {receipt['transactionHash'].hex()}")
 
-        #
-        # Confirmations
-        #
+        self.verify_receipt(receipt=receipt, transaction_hash=txhash)
+        return receipt
+
+    def verify_receipt(self, receipt: dict, transaction_hash) -> None:
+        """Raises InterfaceError if the receipt shows that the transaction failed."""
 
         # Primary check
         transaction_status = receipt.get('status', UNKNOWN_TX_STATUS)
@@ -566,16 +582,14 @@ class BlockchainInterface:
             raise self.InterfaceError(failure)
 
         if transaction_status is UNKNOWN_TX_STATUS:
-            self.log.info(f"Unknown transaction status for {txhash} (receipt did not contain a status field)")
+            self.log.info(f"Unknown transaction status for {transaction_hash} (receipt did not contain a status field)")
 
             # Secondary check
-            tx = self.client.get_transaction(txhash)
+            tx = self.client.get_transaction(transaction_hash)
             if tx["gas"] == receipt["gasUsed"]:
                 raise self.InterfaceError(f"Transaction consumed 100% of transaction gas."
                                           f"Full receipt: \n {pprint.pformat(receipt, indent=2)}")
 
-        return receipt
-
     def get_blocktime(self):
         return self.client.get_blocktime()
 
@@ -604,6 +618,30 @@ class BlockchainInterface:
                                                       confirmations=confirmations)
         return receipt
 
+    @property
+    def transaction_pipeline(self) -> TransactionPipeline:
+        if self.__transaction_pipeline is None:
+            self.__transaction_pipeline = TransactionPipeline(blockchain=self)
+        return self.__transaction_pipeline
+
+    @validate_checksum_address
+    def submit_transaction(self,
+                           contract_function: Union[ContractFunction, ContractConstructor],
+                           sender_address: str,
+                           payload: dict = None,
+                           transaction_gas_limit: int = None
+                           ) -> Future:
+        """
+        Like `send_transaction`, but returns as soon as the transaction is broadcast,
+        with a future that resolves to its receipt once it is mined.
+        """
+        if self.transacting_power is READ_ONLY_INTERFACE:
+            raise self.InterfaceError(str(READ_ONLY_INTERFACE))
+        return self.transaction_pipeline.submit(contract_function=contract_function,
+                                                sender_address=sender_address,
+                                                payload=payload,
+                                                transaction_gas_limit=transaction_gas_limit)
+
     def get_contract_by_name(self,
                              registry: BaseContractRegistry,
                              contract_name: str,
@@ -615,7 +653,16 @@ class BlockchainInterface:
         """
         Instantiate a deployed contract from registry data,
         and assimilate it with its proxy if it is upgradeable.
+
+        Contracts are cached for as long as the registry is unchanged (see `clear_contract_cache`).
         """
+        contracts = self.__contracts.setdefault(registry.index, dict())
+        lookup = (contract_name, contract_version, enrollment_version, proxy_name, use_proxy_address)
+        try:
+            return contracts[lookup]
+        except KeyError:
+            pass
+
         target_contract_records = registry.search(contract_name=contract_name, contract_version=contract_version)
 
         if not target_contract_records:
@@ -634,7 +681,7 @@ class BlockchainInterface:
                                                              ContractFactoryClass=self._contract_factory)
 
                 # Read this dispatcher's target address from the blockchain
-                proxy_live_target_address = proxy_contract.functions.target().call()
+                proxy_live_target_address = self._get_proxy_target(proxy_contract)
                 for target_name, target_version, target_address, target_abi in target_contract_records:
 
                     if target_address == proxy_live_target_address:
@@ -685,8 +732,23 @@ class BlockchainInterface:
                                                        version=selected_version,
                                                        ContractFactoryClass=self._contract_factory)
 
+        contracts[lookup] = unified_contract
         return unified_contract
 
+    def _get_proxy_target(self, proxy_contract: VersionedContract) -> str:
+        """Returns the address targeted by a proxy contract, reading it from the blockchain only once."""
+        try:
+            return self.__proxy_targets[proxy_contract.address]
+        except KeyError:
+            target_address = proxy_contract.functions.target().call()
+            self.__proxy_targets[proxy_contract.address] = target_address
+            return target_address
+
+    def clear_contract_cache(self) -> None:
+        """Forgets cached contracts and proxy targets; to be called once a proxy is retargeted."""
+        self.__contracts.clear()
+        self.__proxy_targets.clear()
+
     @staticmethod
     def __get_enrollment_version_index(version_index: Union[int, str],
                                        enrollments: int,
@@ -890,7 +952,7 @@ class BlockchainDeployerInterface(BlockchainInterface):
                                                          ContractFactoryClass=self._contract_factory)
 
             # Read this dispatchers target address from the blockchain
-            proxy_live_target_address = proxy_contract.functions.target().call()
+            proxy_live_target_address = self._get_proxy_target(proxy_contract)
 
             if proxy_live_target_address == target_address:
                 dispatchers.append(proxy_contract)
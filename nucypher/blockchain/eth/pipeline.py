@@ -0,0 +1,197 @@
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import Future
+from twisted.logger import Logger
+from typing import Dict, List, Optional, Union
+from web3.contract import ContractConstructor, ContractFunction
+from web3.exceptions import TimeExhausted, TransactionNotFound
+
+
+class PendingTransaction:
+    """A broadcast transaction, and every replacement of it broadcast since, awaiting its receipt."""
+
+    def __init__(self, transaction_dict: dict, transaction_hash: bytes, transaction_name: str, future: Future):
+        self.transaction_dict = transaction_dict
+        self.transaction_hashes = [transaction_hash]
+        self.transaction_name = transaction_name
+        self.future = future
+        self.broadcast_at = self.last_broadcast_at = time.monotonic()
+        self.gas_bumps = 0
+
+
+class TransactionPipeline:
+    """
+    Sends transactions without waiting for each one to be mined before the next can be broadcast.
+
+    Nonces are tracked locally for each sender, so several transactions from the same sender can be in flight
+    (up to `max_in_flight` in total; further submissions block until one completes).  Receipts are polled by a
+    background thread, and each submission returns a future which resolves to its receipt.  Transactions that
+    go without a receipt for `stuck_timeout` seconds are re-broadcast, with the same nonce and a higher gas price;
+    they time out only once every gas price bump has had `stuck_timeout` seconds to be mined.
+
+    Note that gas is estimated against the latest block, so a transaction which depends on another one that is
+    still in flight should be given an explicit gas limit.
+    """
+
+    DEFAULT_MAX_IN_FLIGHT = 16
+    DEFAULT_STUCK_TIMEOUT = 180  # seconds
+    GAS_BUMP_FACTOR = 1.125      # Nodes only accept replacements that pay at least 10% more.
+    MAX_GAS_BUMPS = 5
+
+    log = Logger('transaction-pipeline')
+
+    def __init__(self,
+                 blockchain: 'BlockchainInterface',
+                 max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+                 stuck_timeout: int = DEFAULT_STUCK_TIMEOUT):
+        self.blockchain = blockchain
+        self.max_in_flight = max_in_flight
+        self.stuck_timeout = stuck_timeout
+        self.timeout = max(blockchain.TIMEOUT, stuck_timeout * (self.MAX_GAS_BUMPS + 1))
+
+        self.__nonces = dict()                                # type: Dict[str, int]
+        self.__sender_locks = defaultdict(threading.Lock)     # type: Dict[str, threading.Lock]
+        self.__in_flight_slots = threading.BoundedSemaphore(max_in_flight)
+        self.__pending = list()                               # type: List[PendingTransaction]
+        self.__lock = threading.Lock()
+        self.__poller = None                                  # type: Optional[threading.Thread]
+
+    def __len__(self) -> int:
+        with self.__lock:
+            return len(self.__pending)
+
+    def submit(self,
+               contract_function: Union[ContractFunction, ContractConstructor],
+               sender_address: str,
+               payload: dict = None,
+               transaction_gas_limit: int = None
+               ) -> Future:
+        """Builds, signs and broadcasts a transaction, returning a future of its receipt."""
+        self.__in_flight_slots.acquire()
+        try:
+            with self.__sender_locks[sender_address]:
+                nonce = self.__nonces.get(sender_address)
+                if nonce is None:
+                    nonce = self.blockchain.client.w3.eth.getTransactionCount(sender_address, 'pending')
+                transaction_dict = self.blockchain.build_transaction(contract_function=contract_function,
+                                                                     sender_address=sender_address,
+                                                                     payload=payload,
+                                                                     transaction_gas_limit=transaction_gas_limit,
+                                                                     nonce=nonce)
+                try:
+                    transaction_hash = self.__broadcast(transaction_dict)
+                except Exception:
+                    # Whatever happened to this nonce, the node knows better.
+                    self.__nonces.pop(sender_address, None)
+                    raise
+                self.__nonces[sender_address] = nonce + 1
+        except Exception:
+            self.__in_flight_slots.release()
+            raise
+
+        transaction_name = getattr(contract_function, 'fn_name', 'DEPLOY').upper()
+        self.log.debug(f"[PIPELINE-{transaction_name}] | broadcast {transaction_hash.hex()} with nonce {nonce}")
+        future = Future()
+        future.add_done_callback(lambda _: self.__in_flight_slots.release())
+        with self.__lock:
+            self.__pending.append(PendingTransaction(transaction_dict=transaction_dict,
+                                                     transaction_hash=transaction_hash,
+                                                     transaction_name=transaction_name,
+                                                     future=future))
+            if self.__poller is None:
+                self.__poller = threading.Thread(target=self.__poll_receipts, name='transaction-pipeline', daemon=True)
+                self.__poller.start()
+        return future
+
+    def resync_nonce(self, sender_address: str) -> None:
+        """Forgets the sender's nonce; to be called after sending a transaction from it by other means."""
+        with self.__sender_locks[sender_address]:
+            self.__nonces.pop(sender_address, None)
+
+    def wait(self, timeout: float = None) -> None:
+        """Blocks until every transaction submitted so far has either been mined or failed."""
+        with self.__lock:
+            futures = [pending.future for pending in self.__pending]
+        for future in futures:
+            future.exception(timeout=timeout)
+
+    def __broadcast(self, transaction_dict: dict) -> bytes:
+        signed_raw_transaction = self.blockchain.transacting_power.sign_transaction(transaction_dict)
+        return self.blockchain.client.send_raw_transaction(signed_raw_transaction)
+
+    def __poll_receipts(self) -> None:
+        while True:
+            with self.__lock:
+                if not self.__pending:
+                    self.__poller = None
+                    return
+                pending_transactions = list(self.__pending)
+
+            for pending in pending_transactions:
+                try:
+                    done = self.__check(pending)
+                except Exception as e:
+                    pending.future.set_exception(e)
+                    done = True
+                if done:
+                    with self.__lock:
+                        self.__pending.remove(pending)
+
+            time.sleep(self.blockchain.client.TRANSACTION_POLLING_TIME)
+
+    def __check(self, pending: PendingTransaction) -> bool:
+        for transaction_hash in pending.transaction_hashes:
+            try:
+                receipt = self.blockchain.client.w3.eth.getTransactionReceipt(transaction_hash)
+            except TransactionNotFound:
+                continue
+            if receipt is None:
+                continue
+            self.log.debug(f"[RECEIPT-{pending.transaction_name}] | txhash: {receipt['transactionHash'].hex()}")
+            self.blockchain.verify_receipt(receipt=receipt, transaction_hash=transaction_hash)
+            pending.future.set_result(receipt)
+            return True
+
+        now = time.monotonic()
+        if now - pending.last_broadcast_at > self.stuck_timeout:
+            if pending.gas_bumps < self.MAX_GAS_BUMPS:
+                self.__bump_gas_price(pending)
+            elif now - pending.broadcast_at > self.timeout:
+                raise TimeExhausted(f"Transaction {pending.transaction_hashes[0].hex()} is not in the chain after "
+                                    f"{pending.gas_bumps} gas price bumps and {now - pending.broadcast_at:.0f} seconds")
+        return False
+
+    def __bump_gas_price(self, pending: PendingTransaction) -> None:
+        replacement = dict(pending.transaction_dict)
+        replacement['gasPrice'] = max(int(replacement['gasPrice'] * self.GAS_BUMP_FACTOR) + 1,
+                                      self.blockchain.client.gas_price)
+        pending.last_broadcast_at = time.monotonic()
+        pending.gas_bumps += 1
+        try:
+            transaction_hash = self.__broadcast(replacement)
+        except ValueError as e:
+            # Most likely, the original transaction was mined in the meantime.
+            self.log.debug(f"Replacement of {pending.transaction_hashes[0].hex()} was rejected: {e}")
+            return
+        self.log.info(f"[PIPELINE-{pending.transaction_name}] | {pending.transaction_hashes[0].hex()} seems stuck; "
+                      f"replaced by {transaction_hash.hex()} at {replacement['gasPrice']} wei per gas")
+        pending.transaction_dict = replacement
+        pending.transaction_hashes.append(transaction_hash)
@@ -14,8 +14,8 @@ GNU Affero General Public License for more details.
 You should have received a copy of the GNU Affero General Public License
 along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
 """
+import copy
 import json
-from json import JSONDecodeError
 from os.path import abspath, dirname
 
 import hashlib
@@ -26,7 +26,7 @@ import tempfile
 from abc import ABC, abstractmethod
 from constant_sorrow.constants import NO_REGISTRY_SOURCE, REGISTRY_COMMITTED
 from twisted.logger import Logger
-from typing import Dict, Iterator, List, Tuple, Type, Union
+from typing import Dict, Hashable, Iterator, List, NamedTuple, Optional, Tuple, Type, Union
 
 from nucypher.blockchain.eth.constants import PREALLOCATION_ESCROW_CONTRACT_NAME
 from nucypher.blockchain.eth.networks import NetworksInventory
@@ -184,6 +184,26 @@ class RegistrySourceManager:
             raise self.NoSourcesAvailable
 
 
+class RegistryIndex:
+    """The records of a contract registry, as (name, version, address, abi) tuples indexed by name and address."""
+
+    def __init__(self, registry_data: list, revision: Hashable = None):
+        self.revision = revision
+        self.records = list()     # type: List[tuple]
+        self.by_name = dict()     # type: Dict[str, List[tuple]]
+        self.by_address = dict()  # type: Dict[str, List[tuple]]
+        for contract in registry_data:
+            if len(contract) == 3:
+                name, address, abi = contract
+                version = None
+            else:
+                name, version, address, abi = contract
+            record = (name, version, address, abi)
+            self.records.append(record)
+            self.by_name.setdefault(name, list()).append(record)
+            self.by_address.setdefault(address, list()).append(record)
+
+
 class BaseContractRegistry(ABC):
     """
     Records known contracts on the disk for future access and utility. This
@@ -224,6 +244,8 @@ class BaseContractRegistry(ABC):
 
     def __init__(self, source=NO_REGISTRY_SOURCE, *args, **kwargs):
         self.__source = source
+        self.__index = None  # type: Optional[RegistryIndex]
+        self.__id = None     # type: Optional[Tuple[Hashable, str]]
         self.log = Logger("registry")
 
     def __eq__(self, other) -> bool:
@@ -238,12 +260,41 @@ class BaseContractRegistry(ABC):
     @property
     def id(self) -> str:
         """Returns a hexstr of the registry contents."""
+        revision = self._revision()
+        if revision is not None and self.__id is not None and self.__id[0] == revision:
+            return self.__id[1]
         blake = hashlib.blake2b()
         blake.update(self.__class__.__name__.encode())
         blake.update(json.dumps(self.read()).encode())
         digest = blake.digest().hex()
+        self.__id = (revision, digest)
         return digest
 
+    @property
+    def index(self) -> RegistryIndex:
+        """
+        The registry's records, indexed by name and address.  The index is kept until the registry changes;
+        the same index object is returned for as long as the registry contents are known to be the same.
+        """
+        revision = self._revision()
+        index = self.__index
+        if index is None or revision is None or index.revision != revision:
+            try:
+                index = RegistryIndex(self.read(), revision=revision)
+            except (ValueError, TypeError):
+                message = "Missing or corrupted registry data"
+                self.log.critical(message)
+                raise self.InvalidRegistry(message)
+            self.__index = index
+        return index
+
+    def _revision(self) -> Optional[Hashable]:
+        """A cheap token which changes whenever the registry contents do, or None if there isn't one."""
+        return None
+
+    def _invalidate_index(self) -> None:
+        self.__index = None
+
     @abstractmethod
     def _destroy(self) -> None:
         raise NotImplementedError
@@ -280,12 +331,12 @@ class BaseContractRegistry(ABC):
 
     @property
     def enrolled_names(self) -> Iterator:
-        entries = iter(record[0] for record in self.read())
+        entries = iter(record[0] for record in self.index.records)
         return entries
 
     @property
     def enrolled_addresses(self) -> Iterator:
-        entries = iter(record[1] for record in self.read())
+        entries = iter(record[2] for record in self.index.records)
         return entries
 
     def enroll(self, contract_name, contract_address, contract_abi, contract_version) -> None:
@@ -318,24 +369,12 @@ class BaseContractRegistry(ABC):
         if bool(contract_version) and not bool(contract_name):
             raise ValueError("Pass contract_version together with contract_name.")
 
-        contracts = list()
-        registry_data = self.read()
-
-        try:
-            for contract in registry_data:
-                if len(contract) == 3:
-                    name, address, abi = contract
-                    version = None
-                else:
-                    name, version, address, abi = contract
-                if contract_name == name and \
-                        (contract_version is None or version == contract_version) or \
-                        contract_address == address:
-                    contracts.append((name, version, address, abi))
-        except ValueError:
-            message = "Missing or corrupted registry data"
-            self.log.critical(message)
-            raise self.InvalidRegistry(message)
+        index = self.index
+        if contract_name:
+            contracts = [record for record in index.by_name.get(contract_name, ())
+                         if contract_version is None or record[1] == contract_version]
+        else:
+            contracts = list(index.by_address.get(contract_address, ()))
 
         if not contracts:
             raise self.UnknownContract(contract_name)
@@ -349,6 +388,13 @@ class BaseContractRegistry(ABC):
         return result
 
 
+class RegistryFileContents(NamedTuple):
+    filepath: str
+    signature: Tuple[int, int, int]  # inode, size and modification time of the file when it was read
+    digest: str
+    registry_data: Union[list, dict]
+
+
 class LocalContractRegistry(BaseContractRegistry):
 
     REGISTRY_TYPE = 'contract'
@@ -356,6 +402,7 @@ class LocalContractRegistry(BaseContractRegistry):
     def __init__(self, filepath: str, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.__filepath = filepath
+        self.__contents = None  # type: Optional[RegistryFileContents]
         self.log.info(f"Using {self.REGISTRY_TYPE} registry {filepath}")
 
     def __repr__(self):
@@ -368,6 +415,7 @@ class LocalContractRegistry(BaseContractRegistry):
 
     def _swap_registry(self, filepath: str) -> bool:
         self.__filepath = filepath
+        self._invalidate_index()
         return True
 
     def read(self) -> Union[list, dict]:
@@ -377,27 +425,44 @@ class LocalContractRegistry(BaseContractRegistry):
         If you are modifying or updating the registry file, you _must_ call
         this function first to get the current state to append to the dict or
         modify it because _write_registry_file overwrites the file.
+
+        The parsed registry is kept in memory; the file is read again only when its
+        size or modification time changes, and parsed again only when its hash does.
         """
+        return copy.copy(self.__load().registry_data)
+
+    def __load(self) -> RegistryFileContents:
+        filepath = self.filepath
         try:
-            with open(self.filepath, 'r') as registry_file:
-                self.log.debug("Reading from registry: filepath {}".format(self.filepath))
-                registry_file.seek(0)
+            stat = os.stat(filepath)
+            signature = (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+            contents = self.__contents
+            if contents and contents.filepath == filepath and contents.signature == signature:
+                return contents
+
+            with open(filepath, 'rb') as registry_file:
+                self.log.debug("Reading from registry: filepath {}".format(filepath))
                 file_data = registry_file.read()
-                if file_data:
-                    try:
-                        registry_data = json.loads(file_data)
-                    except JSONDecodeError:
-                        raise self.RegistryError(f"Registry contains invalid JSON at '{self.__filepath}'")
-                else:
-                    registry_data = list() if self._multi_contract else dict()
-
         except FileNotFoundError:
-            raise self.NoRegistry("No registry at filepath: {}".format(self.filepath))
+            raise self.NoRegistry("No registry at filepath: {}".format(filepath))
 
-        except JSONDecodeError:
-            raise
-
-        return registry_data
+        digest = hashlib.blake2b(file_data).hexdigest()
+        if contents and contents.filepath == filepath and contents.digest == digest:
+            contents = contents._replace(signature=signature)  # Touched, but unchanged
+        else:
+            if file_data:
+                try:
+                    registry_data = json.loads(file_data)
+                except ValueError:
+                    raise self.RegistryError(f"Registry contains invalid JSON at '{filepath}'")
+            else:
+                registry_data = list() if self._multi_contract else dict()
+            contents = RegistryFileContents(filepath=filepath,
+                                            signature=signature,
+                                            digest=digest,
+                                            registry_data=registry_data)
+        self.__contents = contents
+        return contents
 
     def write(self, registry_data: Union[List, Dict]) -> None:
         """
@@ -412,6 +477,18 @@ class LocalContractRegistry(BaseContractRegistry):
             registry_file.seek(0)
             registry_file.write(json.dumps(registry_data))
             registry_file.truncate()
+        self._invalidate_index()
+
+    def _revision(self) -> Optional[Hashable]:
+        try:
+            contents = self.__load()
+        except self.RegistryError:
+            return None
+        return contents.filepath, contents.digest
+
+    def _invalidate_index(self) -> None:
+        super()._invalidate_index()
+        self.__contents = None
 
     def _destroy(self) -> None:
         os.remove(self.filepath)
@@ -437,6 +514,7 @@ class TemporaryContractRegistry(LocalContractRegistry):
         self.log.info("Cleared temporary registry at {}".format(self.filepath))
         with open(self.filepath, 'w') as registry_file:
             registry_file.write('')
+        self._invalidate_index()
 
     def commit(self, filepath) -> str:
         """writes the current state of the registry to a file"""
@@ -458,16 +536,22 @@ class InMemoryContractRegistry(BaseContractRegistry):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.__registry_data = None
+        self.__revision = 0
         self.filepath = "::memory::"
 
     def clear(self):
         self.__registry_data = None
+        self.__revision += 1
 
     def _swap_registry(self, filepath: str) -> bool:
         raise NotImplementedError
 
     def write(self, registry_data: list) -> None:
         self.__registry_data = json.dumps(registry_data)
+        self.__revision += 1
+
+    def _revision(self) -> Optional[Hashable]:
+        return self.__revision
 
     def read(self) -> list:
         try:
@@ -496,6 +580,7 @@ class InMemoryContractRegistry(BaseContractRegistry):
 
     def _destroy(self) -> None:
         self.__registry_data = dict()
+        self.__revision += 1
 
 
 class AllocationRegistry(LocalContractRegistry):
@@ -591,6 +676,9 @@ class InMemoryAllocationRegistry(AllocationRegistry):
     def _swap_registry(self, filepath: str) -> bool:
         raise NotImplementedError
 
+    def _revision(self) -> Optional[Hashable]:
+        return None
+
     def write(self, registry_data: dict) -> None:
         self.__registry_data = json.dumps(registry_data)
 
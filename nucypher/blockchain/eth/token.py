@@ -19,12 +19,14 @@ from _pydecimal import Decimal
 from collections import UserList
 
 import maya
-from constant_sorrow.constants import (EMPTY_STAKING_SLOT, NEW_STAKE, NOT_STAKING, NO_STAKING_RECEIPT,
+from constant_sorrow.constants import (NEW_STAKE, NOT_STAKING, NO_STAKING_RECEIPT,
                                        UNKNOWN_WORKER_STATUS)
 from eth_utils import currency, is_checksum_address
-from twisted.internet import reactor, task
+from twisted.internet import reactor
+from twisted.internet.interfaces import IDelayedCall
+from twisted.python.failure import Failure
 from twisted.logger import Logger
-from typing import Callable, Dict, Tuple, Union
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union
 
 from nucypher.blockchain.eth.agents import ContractAgency, StakingEscrowAgent
 from nucypher.blockchain.eth.decorators import validate_checksum_address
@@ -265,6 +267,7 @@ class Stake:
                         index: int,
                         stake_info: Tuple[int, int, int],
                         economics,
+                        worker_address: str = None,
                         *args, **kwargs
                         ) -> 'Stake':
 
@@ -280,7 +283,9 @@ class Stake:
                        validate_now=False,
                        *args, **kwargs)
 
-        instance.worker_address = instance.staking_agent.get_worker_from_staker(staker_address=checksum_address)
+        if worker_address is None:
+            worker_address = instance.staking_agent.get_worker_from_staker(staker_address=checksum_address)
+        instance.worker_address = worker_address
         return instance
 
     def to_stake_info(self) -> Tuple[int, int, int]:
@@ -500,9 +505,20 @@ class Stake:
 
 
 class WorkTracker:
+    """
+    Makes a worker's commitments, waking just after each period boundary rather than polling for a new period.
+
+    The tracker sleeps until `BOUNDARY_MARGIN` seconds past the start of the next period (as told by its clock),
+    and at most `REFRESH_RATE` seconds at a time, in case the clock and the chain disagree.  Failed checks and
+    commitments are retried with exponential backoff, from `RETRY_DELAY` up to `MAX_RETRY_DELAY` seconds.
+    """
 
     CLOCK = reactor
-    REFRESH_RATE = 60 * 15  # Fifteen minutes
+    REFRESH_RATE = 60 * 60   # One hour
+    BOUNDARY_MARGIN = 30     # Seconds past the period boundary, leaving time for a block in the new period
+    RETRY_DELAY = 15
+    MAX_RETRY_DELAY = 60 * 15
+    MAX_RETRIES = 8
 
     def __init__(self,
                  worker,
@@ -515,22 +531,37 @@ class WorkTracker:
         self.staking_agent = self.worker.staking_agent
 
         self._refresh_rate = refresh_rate or self.REFRESH_RATE
-        self._tracking_task = task.LoopingCall(self._do_work)
-        self._tracking_task.clock = self.CLOCK
+        self._scheduled_work = None  # type: Optional[IDelayedCall]
+        self.__tracking = False
+        self.__seconds_per_period = None
+        self.__retries = 0
 
         self.__requirement = None
         self.__current_period = None
         self.__start_time = NOT_STAKING
         self.__uptime_period = NOT_STAKING
+        self.__last_commitment_latency = None
         self._abort_on_error = True
 
     @property
     def current_period(self):
         return self.__current_period
 
+    @property
+    def running(self) -> bool:
+        return self.__tracking
+
+    @property
+    def last_commitment_latency(self) -> Optional[float]:
+        """Seconds between the start of a period and the worker's commitment in it, for the latest commitment."""
+        return self.__last_commitment_latency
+
     def stop(self) -> None:
-        if self._tracking_task.running:
-            self._tracking_task.stop()
+        if self.running:
+            self.__tracking = False
+            if self._scheduled_work is not None and self._scheduled_work.active():
+                self._scheduled_work.cancel()
+            self._scheduled_work = None
             self.log.info(f"STOPPED WORK TRACKING")
 
     def start(self, act_now: bool = False, requirement_func: Callable = None, force: bool = False) -> None:
@@ -539,8 +570,10 @@ class WorkTracker:
         to be safely called at any time - For example, it is okay to call
         this function multiple times within the same period.
         """
-        if self._tracking_task.running and not force:
-            return
+        if self.running:
+            if not force:
+                return
+            self.stop()
 
         # Add optional confirmation requirement callable
         self.__requirement = requirement_func
@@ -549,10 +582,15 @@ class WorkTracker:
         self.__start_time = maya.now()
         self.__uptime_period = self.staking_agent.get_current_period()
         self.__current_period = self.__uptime_period
+        self.__seconds_per_period = self.staking_agent.get_seconds_per_period()
+        self.__retries = 0
 
         self.log.info(f"START WORK TRACKING")
-        d = self._tracking_task.start(interval=self._refresh_rate, now=act_now)
-        d.addErrback(self.handle_working_errors)
+        self.__tracking = True
+        if act_now:
+            self.__work()  # Which schedules the next round of work.
+        else:
+            self._scheduled_work = self.CLOCK.callLater(self._seconds_until_next_period(), self.__work)
 
     def _crash_gracefully(self, failure=None) -> None:
         """
@@ -572,6 +610,35 @@ class WorkTracker:
             self.log.warn('Unhandled error during work tracking: {failure.getTraceback()!r}',
                           failure=failure)
 
+    def _seconds_until_next_period(self) -> float:
+        """Seconds to sleep until just after the next period boundary, capped at the refresh rate."""
+        period = self.__current_period or 0
+        next_boundary = (period + 1) * self.__seconds_per_period + self.BOUNDARY_MARGIN
+        if next_boundary - self.CLOCK.seconds() > self.__seconds_per_period:
+            # The clock is behind the chain (or the current period is stale); a period boundary can't be that far.
+            return self._refresh_rate
+        return max(self.BOUNDARY_MARGIN, min(next_boundary - self.CLOCK.seconds(), self._refresh_rate))
+
+    def __work(self) -> None:
+        try:
+            self._do_work()
+        except Exception:
+            self.__retries += 1
+            failure = Failure()
+            if self.__retries > self.MAX_RETRIES:
+                self.__tracking = False
+                self._scheduled_work = None
+                self.handle_working_errors(failure)
+                return
+            delay = min(self.RETRY_DELAY * 2 ** (self.__retries - 1), self.MAX_RETRY_DELAY)
+            self.log.warn(f'Work tracking failed (attempt {self.__retries} of {self.MAX_RETRIES}); '
+                          f'retrying in {delay} seconds: {failure.getErrorMessage()}')
+        else:
+            self.__retries = 0
+            delay = self._seconds_until_next_period()
+        if self.running:
+            self._scheduled_work = self.CLOCK.callLater(delay, self.__work)
+
     def __check_work_requirement(self) -> bool:
         # TODO: Check for stake expiration and exit
         if self.__requirement is None:
@@ -589,13 +656,14 @@ class WorkTracker:
 
         # Update on-chain status
         self.log.info(f"Checking for new period. Current period is {self.__current_period}")
-        onchain_period = self.staking_agent.get_current_period()  # < -- Read from contract
+        onchain_period, last_committed_period = self.staking_agent.get_commitment_status(
+            staker_address=self.worker.checksum_address)  # < -- Read from contract
         if self.current_period != onchain_period:
             self.__current_period = onchain_period
             # self.worker.stakes.refresh()  # TODO: #1517 Track stakes for fast access to terminal period.
 
         # Measure working interval
-        interval = onchain_period - self.worker.last_committed_period
+        interval = onchain_period - last_committed_period
         if interval < 0:
             return  # No need to commit to this period.  Save the gas.
         if interval > 0:
@@ -615,6 +683,79 @@ class WorkTracker:
         with transacting_power:
             self.worker.commit_to_next_period()  # < --- blockchain WRITE
 
+        latency = self.CLOCK.seconds() - onchain_period * self.__seconds_per_period
+        if 0 <= latency < self.__seconds_per_period:
+            self.__last_commitment_latency = latency
+
+
+class StakeRecord:
+    """
+    A compact, read-only record of one on-chain substake, for listing and reporting stakes.
+    Unlike `Stake`, it holds no agents, and its methods take the current period instead of reading it.
+    """
+
+    __slots__ = ('staker_address', 'index', 'first_locked_period', 'final_locked_period', 'value')
+
+    def __init__(self, staker_address: str, index: int, first_locked_period: int, final_locked_period: int, value: int):
+        self.staker_address = staker_address
+        self.index = index
+        self.first_locked_period = first_locked_period
+        self.final_locked_period = final_locked_period
+        self.value = value  # NuNits
+
+    def __repr__(self) -> str:
+        return f'StakeRecord(index={self.index}, value={self.value}, end_period={self.final_locked_period}, ' \
+               f'address={self.staker_address[:6]})'
+
+    @classmethod
+    def read_all(cls,
+                 staking_agent: StakingEscrowAgent,
+                 staker_addresses: Iterable[str]
+                 ) -> Dict[str, List['StakeRecord']]:
+        """Reads the substakes of many stakers at once (see `StakingEscrowAgent.get_all_stakes_of`)."""
+        all_stakes = staking_agent.get_all_stakes_of(staker_addresses=staker_addresses)
+        records = {staker: [cls.from_stake_info(staker_address=staker, index=index, stake_info=stake_info)
+                            for index, stake_info in enumerate(stakes)]
+                   for staker, stakes in all_stakes.items()}
+        return records
+
+    @classmethod
+    def from_stake_info(cls, staker_address: str, index: int, stake_info: Tuple[int, int, int]) -> 'StakeRecord':
+        first_locked_period, final_locked_period, value = stake_info
+        return cls(staker_address=staker_address,
+                   index=index,
+                   first_locked_period=first_locked_period,
+                   final_locked_period=final_locked_period,
+                   value=value)
+
+    def to_stake_info(self) -> Tuple[int, int, int]:
+        return self.first_locked_period, self.final_locked_period, self.value
+
+    @property
+    def duration(self) -> int:
+        return (self.final_locked_period - self.first_locked_period) + 1
+
+    def is_active(self, current_period: int) -> bool:
+        return current_period <= self.final_locked_period
+
+    def periods_remaining(self, current_period: int) -> int:
+        return self.final_locked_period - current_period + 1
+
+    def describe(self, current_period: int, seconds_per_period: int) -> Dict[str, str]:
+        """The same description as `Stake.describe`."""
+        start_datetime = datetime_at_period(period=self.first_locked_period,
+                                            seconds_per_period=seconds_per_period,
+                                            start_of_period=True)
+        unlock_datetime = datetime_at_period(period=self.final_locked_period + 1,
+                                             seconds_per_period=seconds_per_period,
+                                             start_of_period=True)
+        data = dict(index=self.index,
+                    value=str(NU.from_nunits(self.value)),
+                    remaining=self.periods_remaining(current_period),
+                    enactment=start_datetime.local_datetime().strftime("%b %d %Y"),
+                    last_period=unlock_datetime.local_datetime().strftime("%b %d %Y"))
+        return data
+
 
 class StakeList(UserList):
 
@@ -639,6 +780,7 @@ class StakeList(UserList):
             if not is_checksum_address(checksum_address):
                 raise ValueError(f'{checksum_address} is not a valid EIP-55 checksum address')
         self.checksum_address = checksum_address
+        self.__records = list()  # type: List[StakeRecord]
         self.__updated = None
 
     @property
@@ -653,48 +795,70 @@ class StakeList(UserList):
     def terminal_period(self) -> int:
         return self.__terminal_period
 
+    @property
+    def records(self) -> List[StakeRecord]:
+        """The stakes as compact records, as of the last refresh."""
+        return self.__records
+
     @validate_checksum_address
     def refresh(self) -> None:
         """Public staking cache invalidation method"""
         return self.__read_stakes()
 
+    @classmethod
+    def refresh_all(cls, stake_lists: Iterable['StakeList']) -> None:
+        """
+        Refreshes several stake lists (using the same staking agent) together,
+        reading all of their stakes in a few rounds of batched calls.
+        """
+        stake_lists = list(stake_lists)
+        if not stake_lists:
+            return
+        staking_agent = stake_lists[0].staking_agent
+        staker_addresses = [stake_list.checksum_address for stake_list in stake_lists]
+
+        current_period = staking_agent.get_current_period()
+        all_records = StakeRecord.read_all(staking_agent=staking_agent, staker_addresses=staker_addresses)
+        workers = staking_agent.get_workers_from_stakers(staker_addresses=staker_addresses)
+        for stake_list, worker_address in zip(stake_lists, workers):
+            stake_list.__load_stakes(records=all_records[stake_list.checksum_address],
+                                     worker_address=worker_address,
+                                     current_period=current_period)
+
     def __read_stakes(self) -> None:
         """Rewrite the local staking cache by reading on-chain stakes"""
+        self.refresh_all([self])
 
+    def __load_stakes(self, records: List[StakeRecord], worker_address: str, current_period: int) -> None:
         existing_records = len(self)
 
         # Candidate replacement cache values
-        current_period = self.staking_agent.get_current_period()
         onchain_stakes, initial_period, terminal_period = list(), 0, current_period
 
-        # Read from blockchain
-        stakes_reader = self.staking_agent.get_all_stakes(staker_address=self.checksum_address)
-        for onchain_index, stake_info in enumerate(stakes_reader):
-
-            if not stake_info:
-                onchain_stake = EMPTY_STAKING_SLOT
+        for record in records:
 
-            else:
-                onchain_stake = Stake.from_stake_info(checksum_address=self.checksum_address,
-                                                      stake_info=stake_info,
-                                                      staking_agent=self.staking_agent,
-                                                      index=onchain_index,
-                                                      economics=self.economics)
+            onchain_stake = Stake.from_stake_info(checksum_address=self.checksum_address,
+                                                  stake_info=record.to_stake_info(),
+                                                  staking_agent=self.staking_agent,
+                                                  index=record.index,
+                                                  economics=self.economics,
+                                                  worker_address=worker_address)
 
-                # rack the earliest terminal period
-                if onchain_stake.first_locked_period:
-                    if onchain_stake.first_locked_period < initial_period:
-                        initial_period = onchain_stake.first_locked_period
+            # rack the earliest terminal period
+            if onchain_stake.first_locked_period:
+                if onchain_stake.first_locked_period < initial_period:
+                    initial_period = onchain_stake.first_locked_period
 
-                # rack the latest terminal period
-                if onchain_stake.final_locked_period > terminal_period:
-                    terminal_period = onchain_stake.final_locked_period
+            # rack the latest terminal period
+            if onchain_stake.final_locked_period > terminal_period:
+                terminal_period = onchain_stake.final_locked_period
 
             # Store the replacement stake
             onchain_stakes.append(onchain_stake)
 
         # Commit the new stake and terminal values to the cache
         self.data = onchain_stakes
+        self.__records = records
         if onchain_stakes:
             self.__initial_period = initial_period
             self.__terminal_period = terminal_period
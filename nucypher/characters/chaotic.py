@@ -22,6 +22,7 @@ import math
 import maya
 import os
 import time
+from concurrent.futures import Future
 from constant_sorrow.constants import NOT_RUNNING, NO_DATABASE_AVAILABLE
 from datetime import datetime, timedelta
 from decimal import Decimal
@@ -323,17 +324,20 @@ class Felix(Character, NucypherTokenActor):
 
         return int(amount)
 
-    def __transfer(self, disbursement: int, recipient_address: str) -> str:
-        """Perform a single token transfer transaction from one account to another."""
+    def __transfer(self, disbursement: int, recipient_address: str) -> Future:
+        """
+        Broadcast a single token transfer transaction from one account to another,
+        returning a future of its receipt.
+        """
 
         # Re-unlock from cache
         self.blockchain.transacting_power.activate()
 
         self.__disbursement += 1
-        receipt = self.token_agent.transfer(amount=disbursement,
-                                            target_address=recipient_address,
-                                            sender_address=self.checksum_address)
-        txhash = receipt['transactionHash']
+        future = self.token_agent.transfer(amount=disbursement,
+                                           target_address=recipient_address,
+                                           sender_address=self.checksum_address,
+                                           wait=False)
         if self.distribute_ether:
             ether = self.ETHER_AIRDROP_AMOUNT
             transaction = {'to': recipient_address,
@@ -341,16 +345,12 @@ class Felix(Character, NucypherTokenActor):
                            'value': ether,
                            'gasPrice': self.blockchain.client.gas_price}
             ether_txhash = self.blockchain.client.send_transaction(transaction)
+            # The node assigned this transaction a nonce of its own.
+            self.blockchain.transaction_pipeline.resync_nonce(self.checksum_address)
+            self.log.info(f"Disbursement #{self.__disbursement} ETH {ether_txhash.hex()[:-6]} "
+                          f"({self.ETHER_AIRDROP_AMOUNT} wei) -> {recipient_address}")
 
-            self.log.info(f"Disbursement #{self.__disbursement} OK | NU {txhash.hex()[-6:]} | ETH {ether_txhash.hex()[:-6]} "
-                          f"({str(NU(disbursement, 'NuNit'))} + {self.ETHER_AIRDROP_AMOUNT} wei) -> {recipient_address}")
-
-        else:
-            self.log.info(
-                f"Disbursement #{self.__disbursement} OK | {txhash.hex()[-6:]} |"
-                f"({str(NU(disbursement, 'NuNit'))} -> {recipient_address}")
-
-        return txhash
+        return future
 
     def airdrop_tokens(self):
         """
@@ -431,14 +431,19 @@ class Felix(Character, NucypherTokenActor):
             time.sleep(1)
             self.log.info(f"NU Token airdrop starting in {3 - i} seconds...")
 
-        # Slowly, in series...
+        # Each batch is broadcast at once, then settled.
         for batch, staged_disbursement in enumerate(batches, start=1):
             self.log.info(f"======= Batch #{batch} ========")
 
-            for recipient, disbursement in staged_disbursement:
+            # Perform the transfers... leaky faucet.
+            transfers = [(recipient, disbursement, self.__transfer(disbursement=disbursement,
+                                                                   recipient_address=recipient.address))
+                         for recipient, disbursement in staged_disbursement]
 
-                # Perform the transfer... leaky faucet.
-                self.__transfer(disbursement=disbursement, recipient_address=recipient.address)
+            for recipient, disbursement, future in transfers:
+                receipt = future.result()
+                self.log.info(f"Disbursement OK | NU {receipt['transactionHash'].hex()[-6:]} | "
+                              f"({str(NU(disbursement, 'NuNit'))} -> {recipient.address})")
                 self.__distributed += disbursement
 
                 # Update the database record
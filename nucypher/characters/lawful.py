@@ -16,8 +16,11 @@ along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
 """
 
 import json
+import threading
 from base64 import b64decode, b64encode
-from collections import OrderedDict
+from collections import OrderedDict, deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
 from random import shuffle
 
 import maya
@@ -39,7 +42,7 @@ from sqlalchemy.exc import OperationalError
 from twisted.internet import reactor, stdio, threads
 from twisted.internet.task import LoopingCall
 from twisted.logger import Logger
-from typing import Dict, Iterable, List, Set, Tuple, Union
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
 from umbral import pre
 from umbral.keys import UmbralPublicKey
 from umbral.kfrags import KFrag
@@ -62,11 +65,12 @@ from nucypher.characters.control.emitters import StdoutEmitter
 from nucypher.characters.control.interfaces import AliceInterface, BobInterface, EnricoInterface
 from nucypher.cli.processes import UrsulaCommandProtocol
 from nucypher.config.storages import ForgetfulNodeStorage, NodeStorage
-from nucypher.crypto.api import encrypt_and_sign, keccak_digest
+from nucypher.crypto.api import encrypt_and_sign, keccak_digest, reencrypt_from_bytes
 from nucypher.crypto.constants import PUBLIC_ADDRESS_LENGTH, PUBLIC_KEY_LENGTH
 from nucypher.crypto.kits import UmbralMessageKit
 from nucypher.crypto.powers import DecryptingPower, DelegatingPower, PowerUpError, SigningPower, TransactingPower
 from nucypher.crypto.signing import InvalidSignature
+from nucypher.datastore.datastore import TreasureMapStore, WorkOrderArchive
 from nucypher.datastore.keypairs import HostingKeypair
 from nucypher.datastore.threading import ThreadedSession
 from nucypher.network.exceptions import NodeSeemsToBeDown
@@ -108,6 +112,9 @@ class Alice(Character, BlockchainPolicyAuthor):
                  network_middleware: RestMiddleware = None,
                  controller: bool = True,
 
+                 # Sampling
+                 active_stakers_cache_filepath: str = None,
+
                  *args, **kwargs) -> None:
 
         #
@@ -139,6 +146,9 @@ class Alice(Character, BlockchainPolicyAuthor):
                                                  signer=signer or Web3Signer(blockchain.client))
 
             self._crypto_power.consume_power_up(transacting_power)
+            if active_stakers_cache_filepath:
+                # Spares a restarted Alice from paging through every active staker again this period.
+                StakingEscrowAgent.active_stakers_cache.persist_to(active_stakers_cache_filepath)
             BlockchainPolicyAuthor.__init__(self,
                                             registry=self.registry,
                                             rate=rate,
@@ -435,6 +445,13 @@ class Bob(Character):
 
     _default_crypto_powerups = [SigningPower, DecryptingPower]
 
+    # WorkOrders sent concurrently beyond the threshold m, so that a slow Ursula doesn't stall retrieval
+    DEFAULT_SPARE_URSULAS = 1
+
+    # Latency estimates (in seconds) used to prefer fast Ursulas when assembling WorkOrders
+    UNMEASURED_LATENCY = 2
+    UNRESPONSIVE_LATENCY = 10
+
     class IncorrectCFragsReceived(Exception):
         """
         Raised when Bob detects incorrect CFrags returned by some Ursulas
@@ -451,6 +468,7 @@ class Bob(Character):
 
         from nucypher.policy.collections import WorkOrderHistory  # Need a bigger strategy to avoid circulars.
         self._completed_work_orders = WorkOrderHistory()
+        self._ursula_latencies = dict()  # checksum address -> seconds
 
         self.log = Logger(self.__class__.__name__)
         self.log.info(self.banner)
@@ -624,6 +642,9 @@ class Bob(Character):
 
         random_walk = list(treasure_map_to_use)
         shuffle(random_walk)  # Mutates list in-place
+
+        # Try the Ursulas who have answered fastest in the past first; the sort is stable, so ties stay shuffled.
+        random_walk.sort(key=lambda destination: self._ursula_latencies.get(destination[0], self.UNMEASURED_LATENCY))
         for node_id, arrangement_id in random_walk:
 
             capsules_to_include = []
@@ -663,10 +684,33 @@ class Bob(Character):
             raise TypeError(
                 "This WorkOrder is already complete; if you want Ursula to perform additional service, make a new WorkOrder.")
 
-        cfrags_and_signatures = self.network_middleware.reencrypt(work_order)
+        cfrags_and_signatures = self._send_work_order(work_order)
+        return self._complete_work_order(work_order, cfrags_and_signatures, retain_cfrags=retain_cfrags)
+
+    def _send_work_order(self, work_order):
+        """
+        Sends a WorkOrder to its Ursula and returns the raw cfrags and signatures,
+        keeping track of how long the Ursula took to answer.
+        """
+        checksum_address = work_order.ursula.checksum_address
+        start = time.monotonic()
+        try:
+            cfrags_and_signatures = self.network_middleware.reencrypt(work_order)
+        except NodeSeemsToBeDown:
+            self._record_ursula_latency(checksum_address, self.UNRESPONSIVE_LATENCY)
+            raise
+        self._record_ursula_latency(checksum_address, time.monotonic() - start)
+        return cfrags_and_signatures
+
+    def _record_ursula_latency(self, checksum_address: str, latency: float) -> None:
+        previous_latency = self._ursula_latencies.get(checksum_address)
+        if previous_latency is not None:
+            latency = (previous_latency + latency) / 2
+        self._ursula_latencies[checksum_address] = latency
+
+    def _complete_work_order(self, work_order, cfrags_and_signatures, retain_cfrags=False):
         cfrags = work_order.complete(cfrags_and_signatures)
         self._completed_work_orders.save_work_order(work_order, as_replete=retain_cfrags)
-
         return cfrags
 
     def join_policy(self, label, alice_verifying_key, node_list=None, block=False):
@@ -684,7 +728,15 @@ class Bob(Character):
                  use_attached_cfrags: bool = False,
                  use_precedent_work_orders: bool = False,
                  policy_encrypting_key: UmbralPublicKey = None,
-                 treasure_map: Union['TreasureMap', bytes] = None):
+                 treasure_map: Union['TreasureMap', bytes] = None,
+                 spare_ursulas: int = None):
+        """
+        WorkOrders are sent to m + spare_ursulas Ursulas at once; cfrags are attached as they arrive,
+        and outstanding WorkOrders are abandoned as soon as every capsule has reached the threshold.
+        """
+
+        if spare_ursulas is None:
+            spare_ursulas = self.DEFAULT_SPARE_URSULAS
 
         # Try our best to get an UmbralPublicKey from input
         alice_verifying_key = UmbralPublicKey.from_bytes(bytes(alice_verifying_key))
@@ -769,58 +821,70 @@ class Bob(Character):
             # TODO Optimization: Block here (or maybe even later) until map is done being followed (instead of blocking above). #1114
             the_airing_of_grievances = []
 
-            for work_order in new_work_orders.values():
-                for capsule in work_order.tasks:
-                    work_order_is_useful = False
-                    if len(capsule) >= m:
-                        capsules_to_activate.discard(capsule)
-                    else:
-                        work_order_is_useful = True
-                        break
-
-                # If all the capsules are now activated, we can stop here.
-                if not capsules_to_activate:
-                    break
+            # Capsules which already have enough CFrags (ie, from precedent WorkOrders) don't need activating.
+            capsules_to_activate = {capsule for capsule in capsules_to_activate if len(capsule) < m}
 
-                if not work_order_is_useful:
-                    # None of the Capsules for this particular WorkOrder need to be activated.  Move on to the next one.
-                    continue
-
-                # We don't have enough CFrags yet.  Let's get another one from a WorkOrder.
-                try:
-                    self.get_reencrypted_cfrags(work_order, retain_cfrags=retain_cfrags)
-                except NodeSeemsToBeDown as e:
-                    # TODO: What to do here?  Ursula isn't supposed to be down.  NRN
-                    self.log.info(f"Ursula ({work_order.ursula}) seems to be down while trying to complete WorkOrder: {work_order}")
-                    continue
-                except self.network_middleware.NotFound:
-                    # This Ursula claims not to have a matching KFrag.  Maybe this has been revoked?
-                    # TODO: What's the thing to do here?  Do we want to track these Ursulas in some way in case they're lying?  567
-                    self.log.warn(f"Ursula ({work_order.ursula}) claims not to have the KFrag to complete WorkOrder: {work_order}.  Has accessed been revoked?")
-                    continue
-                except self.network_middleware.UnexpectedResponse:
-                    raise # TODO: Handle this
-
-                for capsule, pre_task in work_order.tasks.items():
-                    try:
-                        capsule.attach_cfrag(pre_task.cfrag)
-                    except UmbralCorrectnessError:
-                        task = work_order.tasks[0]
-                        # TODO: WARNING - This block is untested.
-                        from nucypher.policy.collections import IndisputableEvidence
-                        evidence = IndisputableEvidence(task=task, work_order=work_order)
-                        # I got a lot of problems with you people ...
-                        the_airing_of_grievances.append(evidence)
-
-                    if len(capsule) >= m:
-                        capsules_to_activate.discard(capsule)
-
-                # If all the capsules are now activated, we can stop here.
-                if not capsules_to_activate:
-                    break
-            else:
-                raise Ursula.NotEnoughUrsulas(
-                    "Unable to reach m Ursulas.  See the logs for which Ursulas are down or noncompliant.")
+            pending_work_orders = deque(new_work_orders.values())
+            in_flight = dict()  # future -> WorkOrder
+            executor = ThreadPoolExecutor(max_workers=m + spare_ursulas)
+            try:
+                while capsules_to_activate:
+
+                    # Keep m + spare_ursulas WorkOrders in flight.
+                    while pending_work_orders and len(in_flight) < m + spare_ursulas:
+                        work_order = pending_work_orders.popleft()
+                        if capsules_to_activate.isdisjoint(work_order.tasks):
+                            # None of the Capsules for this particular WorkOrder need to be activated.
+                            continue
+                        in_flight[executor.submit(self._send_work_order, work_order)] = work_order
+
+                    if not in_flight:
+                        raise Ursula.NotEnoughUrsulas(
+                            "Unable to reach m Ursulas.  See the logs for which Ursulas are down or noncompliant.")
+
+                    done, _not_done = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        work_order = in_flight.pop(future)
+                        try:
+                            cfrags_and_signatures = future.result()
+                        except NodeSeemsToBeDown as e:
+                            # TODO: What to do here?  Ursula isn't supposed to be down.  NRN
+                            self.log.info(f"Ursula ({work_order.ursula}) seems to be down while trying to complete WorkOrder: {work_order}")
+                            continue
+                        except self.network_middleware.NotFound:
+                            # This Ursula claims not to have a matching KFrag.  Maybe this has been revoked?
+                            # TODO: What's the thing to do here?  Do we want to track these Ursulas in some way in case they're lying?  567
+                            self.log.warn(f"Ursula ({work_order.ursula}) claims not to have the KFrag to complete WorkOrder: {work_order}.  Has accessed been revoked?")
+                            continue
+                        except self.network_middleware.UnexpectedResponse:
+                            raise # TODO: Handle this
+
+                        self._complete_work_order(work_order, cfrags_and_signatures, retain_cfrags=retain_cfrags)
+
+                        for capsule, pre_task in work_order.tasks.items():
+                            if capsule not in capsules_to_activate:
+                                continue
+                            try:
+                                capsule.attach_cfrag(pre_task.cfrag)
+                            except UmbralCorrectnessError:
+                                task = work_order.tasks[0]
+                                # TODO: WARNING - This block is untested.
+                                from nucypher.policy.collections import IndisputableEvidence
+                                evidence = IndisputableEvidence(task=task, work_order=work_order)
+                                # I got a lot of problems with you people ...
+                                the_airing_of_grievances.append(evidence)
+
+                            if len(capsule) >= m:
+                                capsules_to_activate.discard(capsule)
+
+                        # If all the capsules are now activated, we can stop here.
+                        if not capsules_to_activate:
+                            break
+            finally:
+                # Abandon any WorkOrders still in flight; their results are no longer needed.
+                for future in in_flight:
+                    future.cancel()
+                executor.shutdown(wait=False)
 
             if the_airing_of_grievances:
                 # ... and now you're gonna hear about it!
@@ -893,6 +957,7 @@ class Ursula(Teacher, Character, Worker):
     _default_crypto_powerups = [SigningPower, DecryptingPower]
 
     _pruning_interval = 60  # seconds
+    __serialization_cache = None  # (the parts below, domains, bytes) as of the last serialization
 
     class NotEnoughUrsulas(Learner.NotEnoughTeachers, StakingEscrowAgent.NotEnoughStakers):
         """
@@ -917,6 +982,8 @@ class Ursula(Teacher, Character, Worker):
                  timestamp=None,
                  availability_check: bool = True,
                  prune_datastore: bool = True,
+                 workorder_archive_dir: str = None,
+                 reencryption_processes: int = None,
 
                  # Blockchain
                  decentralized_identity_evidence: bytes = constants.NOT_SIGNED,
@@ -965,9 +1032,6 @@ class Ursula(Teacher, Character, Worker):
 
         if is_me:
 
-            # In-Memory TreasureMap tracking
-            self._stored_treasure_maps = dict()
-
             # Learner
             self._start_learning_now = start_learning_now
 
@@ -979,6 +1043,12 @@ class Ursula(Teacher, Character, Worker):
             self.__pruning_task = None
             self._prune_datastore = prune_datastore
             self._arrangement_pruning_task = LoopingCall(f=self.__prune_arrangements)
+            self._workorder_archive = WorkOrderArchive(workorder_archive_dir) if workorder_archive_dir else None
+
+            # Batch Re-encryption (lazily started worker processes)
+            self._reencryption_processes = reencryption_processes
+            self.__reencryption_pool = None
+            self.__reencryption_pool_lock = threading.Lock()
 
         #
         # Ursula the Decentralized Worker (Self)
@@ -1033,6 +1103,9 @@ class Ursula(Teacher, Character, Worker):
                                                    rest_app=rest_app, datastore=datastore,
                                                    hosting_power=tls_hosting_power)
 
+                # TreasureMaps are kept in the datastore, rather than in memory.
+                self.treasure_maps = TreasureMapStore(datastore)
+
             #
             # Stranger-Ursula
             #
@@ -1084,15 +1157,30 @@ class Ursula(Teacher, Character, Worker):
             self.log.debug(message)
 
     def __prune_arrangements(self) -> None:
-        """Deletes all expired arrangements and kfrags in the datastore."""
+        """Deletes all expired arrangements, kfrags and treasure maps in the datastore."""
         now = datetime.fromtimestamp(self._arrangement_pruning_task.clock.seconds())
         try:
-            result = self.datastore.del_expired_policy_arrangements(now=now)
+            result = self.datastore.del_expired_policy_arrangements(now=now, workorder_archive=self._workorder_archive)
+            pruned_treasure_maps = self.datastore.del_expired_treasure_maps(now=now)
         except OperationalError:
             self.log.warn(f"Failed to prune policy arrangements; DB session rolled back.")
+        except OSError as e:
+            self.log.warn(f"Failed to archive WorkOrders of expired arrangements ({e}); DB session rolled back.")
         else:
             if result > 0:
                 self.log.debug(f"Pruned {result} policy arrangements.")
+            if pruned_treasure_maps > 0:
+                self.log.debug(f"Pruned {pruned_treasure_maps} treasure maps.")
+
+    def __start_pruning(self, now: bool = True) -> None:
+        self.__pruning_task = self._arrangement_pruning_task.start(interval=self._pruning_interval, now=now)
+        self.__pruning_task.addErrback(self.__handle_pruning_errors)
+
+    def __handle_pruning_errors(self, failure) -> None:
+        cleaned_traceback = failure.getTraceback().replace('{', '').replace('}', '')
+        self.log.warn(f"Unhandled error during datastore pruning: {cleaned_traceback}")
+        if not self._arrangement_pruning_task.running:
+            self.__start_pruning(now=False)
 
     def run(self,
             emitter: StdoutEmitter = None,
@@ -1116,7 +1204,7 @@ class Ursula(Teacher, Character, Worker):
             emitter.message(f"Starting services...", color='yellow')
 
         if pruning:
-            self.__pruning_task = self._arrangement_pruning_task.start(interval=self._pruning_interval, now=True)
+            self.__start_pruning(now=True)
             if emitter:
                 emitter.message(f"✓ Database pruning", color='green')
 
@@ -1185,6 +1273,11 @@ class Ursula(Teacher, Character, Worker):
             self.work_tracker.stop()
         if self._arrangement_pruning_task.running:
             self._arrangement_pruning_task.stop()
+        with self.__reencryption_pool_lock:
+            if self.__reencryption_pool:
+                self.__reencryption_pool.shutdown(wait=False)
+                self.__reencryption_pool = None
+        self.datastore.workorder_journal.stop()
         if halt_reactor:
             reactor.stop()
 
@@ -1210,12 +1303,25 @@ class Ursula(Teacher, Character, Worker):
         return self._crypto_power.power_ups(TLSHostingPower).keypair.certificate
 
     def __bytes__(self):
+        certificate = self.rest_server_certificate()
+
+        # We're serialized all the time (fleet state, node storage, announcements), but seldom change;
+        # reuse the previous bytes unless one of their mutable parts has been replaced since.
+        serialized_parts = (self.timestamp,
+                            self._interface_signature,
+                            self.decentralized_identity_evidence,
+                            certificate,
+                            self.rest_interface)
+        domains_key = frozenset(self.serving_domains)
+        if self.__serialization_cache:
+            cached_parts, cached_domains_key, cached_bytes = self.__serialization_cache
+            if cached_domains_key == domains_key and all(a is b for a, b in zip(cached_parts, serialized_parts)):
+                return cached_bytes
 
         version = self.TEACHER_VERSION.to_bytes(2, "big")
         interface_info = VariableLengthBytestring(bytes(self.rest_interface))
         decentralized_identity_evidence = VariableLengthBytestring(self.decentralized_identity_evidence)
 
-        certificate = self.rest_server_certificate()
         cert_vbytes = VariableLengthBytestring(certificate.public_bytes(Encoding.PEM))
 
         domains = {domain.encode('utf-8') for domain in self.serving_domains}
@@ -1230,6 +1336,7 @@ class Ursula(Teacher, Character, Worker):
                                  bytes(cert_vbytes),
                                  bytes(interface_info))
                                 )
+        self.__serialization_cache = serialized_parts, domains_key, as_bytes
         return as_bytes
 
     #
@@ -1399,6 +1506,7 @@ class Ursula(Teacher, Character, Worker):
 
         # Version stuff checked out.  Moving on.
         node_sprout = cls.internal_splitter(payload, partial=True)
+        node_sprout.payload_bytes = payload  # So that the sprout needn't be re-encoded to be passed along.
         return node_sprout
 
     @classmethod
@@ -1506,9 +1614,8 @@ class Ursula(Teacher, Character, Worker):
 
     def _reencrypt(self, kfrag: KFrag, work_order: 'WorkOrder', alice_verifying_key: UmbralPublicKey):
 
-        # Prepare a bytestring for concatenating re-encrypted
-        # capsule data for each work order task.
-        cfrag_byte_stream = bytes()
+        # Collect the re-encrypted capsule data for each work order task, concatenating once at the end.
+        cfrag_byte_stream = []
         for task in work_order.tasks:
             # Ursula signs on top of Bob's signature of each task.
             # Now both are committed to the same task.  See #259.
@@ -1524,10 +1631,89 @@ class Ursula(Teacher, Character, Worker):
 
             # Next, Ursula signs to commit to her results.
             reencryption_signature = self.stamp(bytes(cfrag))
-            cfrag_byte_stream += VariableLengthBytestring(cfrag) + reencryption_signature
+            cfrag_byte_stream.append(bytes(VariableLengthBytestring(cfrag)) + bytes(reencryption_signature))
 
         # ... and finally returns all the re-encrypted bytes
-        return cfrag_byte_stream
+        return b''.join(cfrag_byte_stream)
+
+    def _reencrypt_batch(self,
+                         reencryption_jobs: List[Optional[Tuple[KFrag, 'WorkOrder', UmbralPublicKey]]]
+                         ) -> Iterator[bytes]:
+        """
+        Re-encrypts many WorkOrders, yielding the cfrag byte stream of each one, in order, as it is completed.
+        Jobs which are None, or which fail, yield an empty byte stream;  a failure is confined to its own WorkOrder.
+
+        If this Ursula was started with reencryption_processes, every task is handed to a
+        process pool up front, so that later WorkOrders are re-encrypted while earlier ones are signed and sent.
+        """
+        if not self._reencryption_processes:
+            for job in reencryption_jobs:
+                try:
+                    yield self._reencrypt(*job) if job else b''
+                except Exception as e:
+                    self.log.warn(f"Failed to re-encrypt {job[1]}: {e}")
+                    yield b''
+            return
+
+        pool = self.__get_reencryption_pool()
+        pool_is_broken = False
+        submitted_jobs = []
+        for job in reencryption_jobs:
+            if not job:
+                submitted_jobs.append(None)
+                continue
+            kfrag, work_order, alice_verifying_key = job
+            kfrag_bytes, alice_verifying_key_bytes = bytes(kfrag), bytes(alice_verifying_key)
+            futures = []
+            try:
+                for task in work_order.tasks:
+                    # Ursula signs on top of Bob's signature of each task.  See #259.
+                    reencryption_metadata = bytes(self.stamp(bytes(task.signature)))
+                    future = pool.submit(reencrypt_from_bytes,
+                                         kfrag_bytes,
+                                         bytes(task.capsule),
+                                         alice_verifying_key_bytes,
+                                         reencryption_metadata)
+                    futures.append(future)
+            except Exception as e:
+                pool_is_broken |= isinstance(e, BrokenProcessPool)
+                self.log.warn(f"Failed to hand {work_order} over for re-encryption: {e}")
+                futures = None
+            submitted_jobs.append(futures)
+
+        for futures in submitted_jobs:
+            if futures is None:
+                yield b''
+                continue
+            cfrag_byte_stream = []
+            try:
+                for future in futures:
+                    cfrag_bytes = future.result()
+                    reencryption_signature = self.stamp(cfrag_bytes)
+                    cfrag_byte_stream.append(bytes(VariableLengthBytestring(cfrag_bytes)) + bytes(reencryption_signature))
+            except Exception as e:
+                pool_is_broken |= isinstance(e, BrokenProcessPool)
+                self.log.warn(f"Failed to re-encrypt a WorkOrder: {e}")
+                yield b''
+            else:
+                yield b''.join(cfrag_byte_stream)
+
+        if pool_is_broken:
+            self.__discard_reencryption_pool(pool)
+
+    def __get_reencryption_pool(self) -> ProcessPoolExecutor:
+        """The worker processes for batch re-encryption, started by whichever request needs them first."""
+        with self.__reencryption_pool_lock:
+            if self.__reencryption_pool is None:
+                self.__reencryption_pool = ProcessPoolExecutor(max_workers=self._reencryption_processes)
+            return self.__reencryption_pool
+
+    def __discard_reencryption_pool(self, pool: ProcessPoolExecutor) -> None:
+        """Drops a pool whose workers died, so that the next batch starts a new one."""
+        with self.__reencryption_pool_lock:
+            if self.__reencryption_pool is pool:
+                self.__reencryption_pool = None
+        pool.shutdown(wait=False)
 
 
 class Enrico(Character):
@@ -29,7 +29,7 @@ from nucypher.blockchain.eth.interfaces import BlockchainInterfaceFactory
 from nucypher.blockchain.eth.networks import NetworksInventory
 from nucypher.blockchain.eth.registry import InMemoryContractRegistry, IndividualAllocationRegistry
 from nucypher.blockchain.eth.signers import Signer
-from nucypher.blockchain.eth.token import NU, Stake
+from nucypher.blockchain.eth.token import NU, Stake, StakeList
 from nucypher.characters.control.emitters import StdoutEmitter
 from nucypher.cli.literature import (
     GENERIC_SELECT_ACCOUNT,
@@ -148,13 +148,16 @@ def select_client_account(emitter,
     if show_nu_balance:
         headers.append('NU')
 
+    if show_staking:
+        stakers = {account: Staker(is_me=True, checksum_address=account, registry=registry)
+                   for account in enumerated_accounts.values()}
+        StakeList.refresh_all(staker.stakes for staker in stakers.values())
+
     rows = list()
     for index, account in enumerated_accounts.items():
         row = [account]
         if show_staking:
-            staker = Staker(is_me=True, checksum_address=account, registry=registry)
-            staker.stakes.refresh()
-            is_staking = 'Yes' if bool(staker.stakes) else 'No'
+            is_staking = 'Yes' if bool(stakers[account].stakes) else 'No'
             row.append(is_staking)
         if show_eth_balance:
             ether_balance = Web3.fromWei(wallet.eth_balance(account), 'ether')
@@ -25,6 +25,7 @@ from nucypher.blockchain.eth.constants import (
     POLICY_MANAGER_CONTRACT_NAME,
     STAKING_ESCROW_CONTRACT_NAME
 )
+from nucypher.blockchain.eth.events import ContractEvents, EventIndex
 from nucypher.blockchain.eth.utils import datetime_at_period
 from nucypher.cli.config import group_general_config
 from nucypher.cli.options import (
@@ -42,7 +43,7 @@ from nucypher.cli.options import (
 from nucypher.cli.painting.staking import paint_fee_rate_range
 from nucypher.cli.painting.status import paint_contract_status, paint_locked_tokens_status, paint_stakers
 from nucypher.cli.utils import connect_to_blockchain, get_registry, setup_emitter
-from nucypher.config.constants import NUCYPHER_ENVVAR_PROVIDER_URI
+from nucypher.config.constants import DEFAULT_EVENT_INDEX_FILEPATH, NUCYPHER_ENVVAR_PROVIDER_URI
 
 
 class RegistryOptions:
@@ -120,9 +121,11 @@ def locked_tokens(general_config, registry_options, periods):
 @option_event_name
 @click.option('--from-block', help="Collect events from this block number", type=click.INT)
 @click.option('--to-block', help="Collect events until this block number", type=click.INT)
+@click.option('--event-index', 'event_index_filepath', help="Local index of past events, reused between runs",
+              type=click.Path(dir_okay=False), default=DEFAULT_EVENT_INDEX_FILEPATH, show_default=True)
 # TODO: Add options for number of periods in the past (default current period), or range of blocks
 # TODO: Add way to input additional event filters? (e.g., staker, etc)
-def events(general_config, registry_options, contract_name, from_block, to_block, event_name):
+def events(general_config, registry_options, contract_name, from_block, to_block, event_name, event_index_filepath):
     """Show events associated to NuCypher contracts."""
 
     emitter, registry, blockchain = registry_options.setup(general_config=general_config)
@@ -152,14 +155,17 @@ def events(general_config, registry_options, contract_name, from_block, to_block
 
     # TODO: additional input validation for block numbers
     emitter.echo(f"Showing events from block {from_block} to {to_block}")
+    os.makedirs(os.path.dirname(os.path.abspath(event_index_filepath)), exist_ok=True)
+    event_index = EventIndex(filepath=event_index_filepath)
     for contract_name in contract_names:
         title = f" {contract_name} Events ".center(40, "-")
         emitter.echo(f"\n{title}\n", bold=True, color='green')
         agent = ContractAgency.get_agent_by_contract_name(contract_name, registry)
-        names = agent.events.names if not event_name else [event_name]
+        contract_events = ContractEvents(agent.contract, index=event_index)
+        names = contract_events.names if not event_name else [event_name]
         for name in names:
             emitter.echo(f"{name}:", bold=True, color='yellow')
-            event_method = agent.events[name]
+            event_method = contract_events[name]
             for event_record in event_method(from_block=from_block, to_block=to_block):
                 emitter.echo(f"  - {event_record}")
 
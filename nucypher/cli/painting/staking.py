@@ -20,7 +20,7 @@ import tabulate
 from web3.main import Web3
 
 from nucypher.blockchain.eth.constants import STAKING_ESCROW_CONTRACT_NAME
-from nucypher.blockchain.eth.token import NU
+from nucypher.blockchain.eth.token import NU, StakeList
 from nucypher.blockchain.eth.utils import datetime_at_period, prettify_eth_amount
 from nucypher.characters.control.emitters import StdoutEmitter
 from nucypher.cli.literature import POST_STAKING_ADVICE
@@ -39,6 +39,9 @@ def paint_stakes(emitter: StdoutEmitter,
     if not stakers:
         emitter.echo("No staking accounts found.")
 
+    current_period = stakeholder.staking_agent.get_current_period()
+    seconds_per_period = stakeholder.economics.seconds_per_period
+
     total_stakers = 0
     for staker in stakers:
         if not staker.stakes:
@@ -50,8 +53,8 @@ def paint_stakes(emitter: StdoutEmitter,
         if staker_address and staker.checksum_address != staker_address:
             continue
 
-        stakes = sorted(staker.stakes, key=lambda s: s.address_index_ordering_key)
-        active_stakes = filter(lambda s: s.is_active, stakes)
+        stakes = sorted(staker.stakes.records, key=lambda s: s.index)
+        active_stakes = [stake for stake in stakes if stake.is_active(current_period)]
         if not active_stakes:
             emitter.echo(f"There are no active stakes\n")
 
@@ -83,10 +86,11 @@ def paint_stakes(emitter: StdoutEmitter,
 
         rows = list()
         for index, stake in enumerate(stakes):
-            if not stake.is_active and not paint_inactive:
+            if not stake.is_active(current_period) and not paint_inactive:
                 # This stake is inactive.
                 continue
-            rows.append(list(stake.describe().values()))
+            rows.append(list(stake.describe(current_period=current_period,
+                                            seconds_per_period=seconds_per_period).values()))
         total_stakers += 1
         emitter.echo(tabulate.tabulate(rows, headers=STAKE_TABLE_COLUMNS, tablefmt="fancy_grid"))  # newline
 
@@ -186,13 +190,14 @@ def paint_staking_confirmation(emitter, staker, new_stake):
 def paint_staking_accounts(emitter, wallet, registry):
     from nucypher.blockchain.eth.actors import Staker
 
+    stakers = [Staker(is_me=True, checksum_address=account, registry=registry) for account in wallet.accounts]
+    StakeList.refresh_all(staker.stakes for staker in stakers)
+
     rows = list()
-    for account in wallet.accounts:
+    for account, staker in zip(wallet.accounts, stakers):
         eth = str(Web3.fromWei(wallet.eth_balance(account), 'ether')) + " ETH"
         nu = str(NU.from_nunits(wallet.token_balance(account, registry)))
 
-        staker = Staker(is_me=True, checksum_address=account, registry=registry)
-        staker.stakes.refresh()
         is_staking = 'Yes' if bool(staker.stakes) else 'No'
         rows.append((is_staking, account, eth, nu))
     headers = ('Staking', 'Account', 'ETH', 'NU')
@@ -147,26 +147,37 @@ def paint_stakers(emitter, stakers: List[str], staking_agent, policy_agent) -> N
     emitter.echo(f"{'Checksum address':42}  Staker information")
     emitter.echo('=' * (42 + 2 + 53))
 
-    for staker in stakers:
+    # Read everything there is to paint about every staker in a few batched requests.
+    all_owned_tokens = staking_agent.owned_tokens_of(stakers)
+    last_committed_periods = staking_agent.get_last_committed_periods(stakers)
+    workers = staking_agent.get_workers_from_stakers(stakers)
+    all_flags = staking_agent.get_flags_of(stakers)
+    restaking_locks = staking_agent.are_restaking_locked(stakers)
+    staker_infos = staking_agent.get_staker_info_of(stakers)
+    all_locked_tokens = staking_agent.get_locked_tokens_of(stakers)
+    fee_amounts = policy_agent.get_fee_amounts(stakers)
+    min_fee_rates = policy_agent.get_min_fee_rates(stakers)
+
+    for staker_index, staker in enumerate(stakers):
         nickname, pairs = nickname_from_seed(staker)
         symbols = f"{pairs[0][1]}  {pairs[1][1]}"
         emitter.echo(f"{staker}  {'Nickname:':10} {nickname} {symbols}")
         tab = " " * len(staker)
 
-        owned_tokens = staking_agent.owned_tokens(staker)
-        last_committed_period = staking_agent.get_last_committed_period(staker)
-        worker = staking_agent.get_worker_from_staker(staker)
-        is_restaking = staking_agent.is_restaking(staker)
-        is_winding_down = staking_agent.is_winding_down(staker)
+        owned_tokens = all_owned_tokens[staker_index]
+        last_committed_period = last_committed_periods[staker_index]
+        worker = workers[staker_index]
+        is_restaking = all_flags[staker_index].restake_flag
+        is_winding_down = all_flags[staker_index].wind_down_flag
 
         missing_commitments = current_period - last_committed_period
         owned_in_nu = round(NU.from_nunits(owned_tokens), 2)
-        locked_tokens = round(NU.from_nunits(staking_agent.get_locked_tokens(staker)), 2)
+        locked_tokens = round(NU.from_nunits(all_locked_tokens[staker_index]), 2)
 
         emitter.echo(f"{tab}  {'Owned:':10} {owned_in_nu}  (Staked: {locked_tokens})")
         if is_restaking:
-            if staking_agent.is_restaking_locked(staker):
-                unlock_period = staking_agent.get_restake_unlock_period(staker)
+            if restaking_locks[staker_index]:
+                unlock_period = staker_infos[staker_index].lock_restake_until_period
                 emitter.echo(f"{tab}  {'Re-staking:':10} Yes  (Locked until period: {unlock_period})")
             else:
                 emitter.echo(f"{tab}  {'Re-staking:':10} Yes  (Unlocked)")
@@ -191,8 +202,8 @@ def paint_stakers(emitter, stakers: List[str], staking_agent, policy_agent) -> N
         else:
             emitter.echo(f"{worker}")
 
-        fees = prettify_eth_amount(policy_agent.get_fee_amount(staker))
+        fees = prettify_eth_amount(fee_amounts[staker_index])
         emitter.echo(f"{tab}  Unclaimed fees: {fees}")
 
-        min_rate = prettify_eth_amount(policy_agent.get_min_fee_rate(staker))
+        min_rate = prettify_eth_amount(min_fee_rates[staker_index])
         emitter.echo(f"{tab}  Min fee rate: {min_rate}")
@@ -55,6 +55,8 @@ class UrsulaConfiguration(CharacterConfiguration):
                  tls_curve: EllipticCurve = None,
                  certificate: Certificate = None,
                  availability_check: bool = None,
+                 reencryption_processes: int = None,
+                 workorder_archive_dir: str = None,
                  *args, **kwargs) -> None:
 
         if not rest_port:
@@ -69,6 +71,8 @@ class UrsulaConfiguration(CharacterConfiguration):
         self.db_filepath = db_filepath or UNINITIALIZED_CONFIGURATION
         self.worker_address = worker_address
         self.availability_check = availability_check if availability_check is not None else self.DEFAULT_AVAILABILITY_CHECKS
+        self.reencryption_processes = reencryption_processes
+        self.workorder_archive_dir = workorder_archive_dir
         super().__init__(dev_mode=dev_mode, *args, **kwargs)
 
     def generate_runtime_filepaths(self, config_root: str) -> dict:
@@ -88,6 +92,8 @@ class UrsulaConfiguration(CharacterConfiguration):
             rest_port=self.rest_port,
             db_filepath=self.db_filepath,
             availability_check=self.availability_check,
+            reencryption_processes=self.reencryption_processes,
+            workorder_archive_dir=self.workorder_archive_dir,
         )
         return {**super().static_payload(), **payload}
 
@@ -134,8 +140,10 @@ class UrsulaConfiguration(CharacterConfiguration):
         return keyring
 
     def destroy(self) -> None:
-        if os.path.isfile(self.db_filepath):
-            os.remove(self.db_filepath)
+        # Along with the write-ahead log and its index, if any.
+        for filepath in (self.db_filepath, f'{self.db_filepath}-wal', f'{self.db_filepath}-shm'):
+            if os.path.isfile(filepath):
+                os.remove(filepath)
         super().destroy()
 
 
@@ -46,6 +46,7 @@ CONTRACT_ROOT = SOL_PACKAGE / 'source' / 'contracts'
 APP_DIR = AppDirs(nucypher.__title__, nucypher.__author__)
 DEFAULT_CONFIG_ROOT = os.getenv('NUCYPHER_CONFIG_ROOT', default=APP_DIR.user_data_dir)
 USER_LOG_DIR = os.getenv('NUCYPHER_USER_LOG_DIR', default=APP_DIR.user_log_dir)
+DEFAULT_EVENT_INDEX_FILEPATH = os.path.join(DEFAULT_CONFIG_ROOT, 'event_index.sqlite')
 
 
 # Static Seednodes
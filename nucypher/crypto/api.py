@@ -35,7 +35,9 @@ from eth_utils import is_checksum_address, to_checksum_address
 from ipaddress import IPv4Address
 from typing import Tuple
 from umbral import pre
+from umbral.config import default_params
 from umbral.keys import UmbralPrivateKey, UmbralPublicKey
+from umbral.kfrags import KFrag
 from umbral.signing import Signature
 
 from nucypher.crypto.constants import SHA256
@@ -256,3 +258,20 @@ def encrypt_and_sign(recipient_pubkey_enc: UmbralPublicKey,
         message_kit = UmbralMessageKit(ciphertext=ciphertext, capsule=capsule)
 
     return message_kit, signature
+
+
+def reencrypt_from_bytes(kfrag_bytes: bytes,
+                         capsule_bytes: bytes,
+                         alice_verifying_key_bytes: bytes,
+                         metadata: bytes) -> bytes:
+    """
+    Re-encrypts a serialized capsule with a serialized kfrag and returns the serialized cfrag.
+
+    Everything crossing this function's boundary is bytes, so it can be
+    dispatched to a worker process.
+    """
+    capsule = pre.Capsule.from_bytes(capsule_bytes, params=default_params())
+    capsule.set_correctness_keys(verifying=UmbralPublicKey.from_bytes(alice_verifying_key_bytes))
+    kfrag = KFrag.from_bytes(kfrag_bytes)
+    cfrag = pre.reencrypt(kfrag, capsule, metadata=metadata)
+    return cfrag.to_bytes()
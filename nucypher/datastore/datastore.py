@@ -16,18 +16,25 @@ along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
 """
 
 
+import gzip
+import json
 import maya
+import os
+import threading
 from bytestring_splitter import BytestringSplitter
-from datetime import datetime
-from sqlalchemy.exc import OperationalError
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from sqlalchemy.exc import IntegrityError, OperationalError
 from sqlalchemy.orm import sessionmaker
-from typing import List
+from twisted.logger import Logger
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
 from umbral.keys import UmbralPublicKey
 from umbral.kfrags import KFrag
 
 from nucypher.crypto.signing import Signature
 from nucypher.crypto.utils import fingerprint_from_key
-from nucypher.datastore.db.models import Key, PolicyArrangement, Workorder
+from nucypher.datastore.db.models import Key, PolicyArrangement, TreasureMapRecord, Workorder
+from nucypher.datastore.threading import ThreadedSession, session_factory
 
 
 class NotFound(Exception):
@@ -37,20 +44,290 @@ class NotFound(Exception):
     pass
 
 
+class ExpiringLRUCache:
+    """
+    A thread-safe, size-bounded LRU cache whose entries go away when what they cache expires,
+    keeping counts of hits and misses.  The datastore keeps one of the deserialized KFrag and Alice's verifying key
+    of each arrangement, and another of serialized TreasureMaps, so that busy policies aren't always served from disk.
+
+    So that a value read before its key was invalidated isn't cached after, readers take the cache's `generation()`
+    before reading and hand it to `put`, which drops the value if the key was invalidated in the meantime.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.__entries = OrderedDict()  # key -> (value, expiration)
+        self.__lock = threading.Lock()
+
+        # Tombstones of the latest invalidations, and the latest generation of those no longer kept.
+        self.__generation = 0
+        self.__invalidations = OrderedDict()  # key -> generation at which it was invalidated
+        self.__forgotten_generation = 0
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    def __contains__(self, key: bytes) -> bool:
+        return key in self.__entries
+
+    def get(self, key: bytes):
+        """Returns the cached value, or None."""
+        with self.__lock:
+            try:
+                value, _expiration = self.__entries[key]
+            except KeyError:
+                self.misses += 1
+                return None
+            self.__entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def generation(self) -> int:
+        with self.__lock:
+            return self.__generation
+
+    def put(self, key: bytes, value, expiration: Optional[datetime], generation: int = None) -> None:
+        """
+        Caches `value` until `expiration`;  unless, if `generation` is given, `key` was invalidated since then.
+        """
+        with self.__lock:
+            if generation is not None:
+                invalidated_at = self.__invalidations.get(key, self.__forgotten_generation)
+                if invalidated_at > generation:
+                    return  # This value is already stale.
+            self.__entries[key] = (value, expiration)
+            self.__entries.move_to_end(key)
+            while len(self.__entries) > self.max_size:
+                self.__entries.popitem(last=False)
+
+    def invalidate(self, key: bytes) -> None:
+        with self.__lock:
+            self.__entries.pop(key, None)
+            self.__tombstone(key)
+
+    def __tombstone(self, key: bytes) -> None:
+        self.__generation += 1
+        self.__invalidations[key] = self.__generation
+        self.__invalidations.move_to_end(key)
+        while len(self.__invalidations) > self.max_size:
+            _key, generation = self.__invalidations.popitem(last=False)
+            self.__forgotten_generation = generation
+
+    def prune(self, now: datetime) -> None:
+        """Drops the entries which expired by `now`;  those without an expiration stay."""
+        with self.__lock:
+            expired = [key for key, (_value, expiration) in self.__entries.items()
+                       if expiration is not None and expiration <= now]
+            for key in expired:
+                del self.__entries[key]
+                self.__tombstone(key)
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__entries.clear()
+            self.__generation += 1
+            self.__invalidations.clear()
+            self.__forgotten_generation = self.__generation
+
+
+class WorkOrderRecord(NamedTuple):
+    bob_verifying_key: bytes
+    bob_signature: bytes
+    arrangement_id: bytes
+
+
+class WorkOrderJournal:
+    """
+    Write-behind journal of the WorkOrders Ursula has re-encrypted.
+
+    Records are buffered in memory and saved in batches, each in a single transaction, by a background thread
+    which flushes at least every `flush_interval` seconds (bounding what a crash can lose), or sooner once
+    `max_batch_size` records are pending.  Reads of WorkOrders through the Datastore flush the journal first.
+
+    An in-memory SQLite database serializes its writers, so for those there is no background thread:
+    records are flushed as batches fill up, or when WorkOrders are read.
+    """
+
+    DEFAULT_FLUSH_INTERVAL = 1.0  # seconds
+    DEFAULT_MAX_BATCH_SIZE = 500
+
+    log = Logger('workorder-journal')
+
+    def __init__(self,
+                 datastore: 'Datastore',
+                 flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+                 max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+                 background: bool = True):
+        self.datastore = datastore
+        self.flush_interval = flush_interval
+        self.max_batch_size = max_batch_size
+        self.background = background
+
+        self.__pending = list()        # type: List[WorkOrderRecord]
+        self.__lock = threading.Lock()
+        self.__flushing = threading.Lock()
+        self.__wakeup = threading.Condition(self.__lock)
+        self.__flusher = None          # type: Optional[threading.Thread]
+        self.__stopped = False
+
+    def __len__(self) -> int:
+        with self.__lock:
+            return len(self.__pending)
+
+    def record(self, bob_verifying_key: bytes, bob_signature: bytes, arrangement_id: bytes) -> None:
+        record = WorkOrderRecord(bob_verifying_key=bytes(bob_verifying_key),
+                                 bob_signature=bytes(bob_signature),
+                                 arrangement_id=arrangement_id)
+        with self.__lock:
+            self.__pending.append(record)
+            batch_is_full = len(self.__pending) >= self.max_batch_size
+            flushing_in_background = self.background and not self.__stopped
+            if flushing_in_background and self.__flusher is None:
+                self.__flusher = threading.Thread(target=self.__flush_periodically, name='workorder-journal', daemon=True)
+                self.__flusher.start()
+            elif flushing_in_background and batch_is_full:
+                self.__wakeup.notify()
+
+        if batch_is_full and not flushing_in_background:
+            self.flush()
+
+    def flush(self, session=None) -> int:
+        """Saves every pending record, returning how many were saved."""
+        with self.__flushing:
+            with self.__lock:
+                records, self.__pending = self.__pending, list()
+            if not records:
+                return 0
+            try:
+                if session is None:
+                    with ThreadedSession(self.datastore.engine) as session:
+                        saved_workorders = self.datastore.save_workorders(records, session=session)
+                else:
+                    saved_workorders = self.datastore.save_workorders(records, session=session)
+            except Exception:
+                # Whatever went wrong (the database being busy, most likely), keep the records for the next attempt.
+                with self.__lock:
+                    self.__pending[:0] = records
+                raise
+        return len(saved_workorders)
+
+    def stop(self) -> None:
+        """Stops the background thread, after it saves the pending records; the next record starts it anew."""
+        with self.__lock:
+            self.__stopped = True
+            self.__wakeup.notify()
+            flusher = self.__flusher
+        if flusher is not None:
+            flusher.join()
+        with self.__lock:
+            self.__stopped = False
+        self.flush()
+
+    def __flush_periodically(self) -> None:
+        while True:
+            with self.__lock:
+                if not self.__stopped and len(self.__pending) < self.max_batch_size:
+                    self.__wakeup.wait(timeout=self.flush_interval)
+                stopped = self.__stopped
+            try:
+                self.flush()
+            except Exception as e:
+                self.log.warn(f"Failed to save {len(self)} WorkOrders; will retry: {e}")
+            if stopped:
+                with self.__lock:
+                    self.__flusher = None
+                return
+
+
+class WorkOrderArchive:
+    """
+    Gzipped JSON lines of the WorkOrders of expired arrangements, pruned from the live datastore;
+    a file per (UTC) day of pruning.
+    """
+
+    FILENAME_TEMPLATE = 'workorders-{date}.jsonl.gz'
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def write(self, records: Iterable[Dict[str, str]], now: datetime) -> None:
+        filepath = os.path.join(self.directory, self.FILENAME_TEMPLATE.format(date=now.date().isoformat()))
+        with gzip.open(filepath, 'at') as archive:  # Appending adds a gzip member, so files stay readable.
+            for record in records:
+                archive.write(json.dumps(record) + '\n')
+
+    def read(self) -> Iterator[Dict[str, str]]:
+        for filename in sorted(os.listdir(self.directory)):
+            if not filename.endswith('.jsonl.gz'):
+                continue
+            with gzip.open(os.path.join(self.directory, filename), 'rt') as archive:
+                for line in archive:
+                    yield json.loads(line)
+
+
+class TreasureMapStore:
+    """
+    Read-only mapping view of the TreasureMaps in Ursula's datastore, by map ID.
+    """
+
+    def __init__(self, datastore: 'Datastore'):
+        self.datastore = datastore
+
+    def __contains__(self, map_id: bytes) -> bool:
+        try:
+            self.datastore.get_treasure_map(map_id)
+        except NotFound:
+            return False
+        return True
+
+    def __getitem__(self, map_id: bytes) -> 'TreasureMap':
+        from nucypher.policy.collections import TreasureMap  # Avoid circular import
+        try:
+            treasure_map_bytes = self.datastore.get_treasure_map(map_id)
+        except NotFound:
+            raise KeyError(map_id)
+        return TreasureMap.from_bytes(treasure_map_bytes, verify=False)
+
+    def __len__(self) -> int:
+        return self.datastore.count_treasure_maps()
+
+
 class Datastore:
     """
     A storage class of persistent cryptographic entities for use by Ursula.
     """
     kfrag_splitter = BytestringSplitter(Signature, (KFrag, KFrag.expected_bytes_length()))
 
-    def __init__(self, sqlalchemy_engine=None) -> None:
+    PRUNING_CHUNK_SIZE = 500
+    DEFAULT_ARRANGEMENT_CACHE_SIZE = 10_000
+    DEFAULT_TREASURE_MAP_CACHE_SIZE = 1_000
+    DEFAULT_TREASURE_MAP_TTL = timedelta(days=365)  # For maps whose policy expiration is unknown
+
+    def __init__(self,
+                 sqlalchemy_engine=None,
+                 arrangement_cache_size: int = DEFAULT_ARRANGEMENT_CACHE_SIZE,
+                 treasure_map_cache_size: int = DEFAULT_TREASURE_MAP_CACHE_SIZE,
+                 workorder_flush_interval: float = WorkOrderJournal.DEFAULT_FLUSH_INTERVAL
+                 ) -> None:
         """
         Initializes a Datastore object.
 
         :param sqlalchemy_engine: SQLAlchemy engine object to create session
+        :param arrangement_cache_size: How many arrangements to keep deserialized in memory, for re-encryption
+        :param treasure_map_cache_size: How many serialized TreasureMaps to keep in memory
+        :param workorder_flush_interval: Longest time, in seconds, that journaled WorkOrders wait to be saved
         """
         self.engine = sqlalchemy_engine
-        Session = sessionmaker(bind=sqlalchemy_engine)
+        self.arrangement_cache = ExpiringLRUCache(max_size=arrangement_cache_size)
+        self.treasure_map_cache = ExpiringLRUCache(max_size=treasure_map_cache_size)
+        in_memory = sqlalchemy_engine is None or sqlalchemy_engine.url.database in (None, '', ':memory:')
+        self.workorder_journal = WorkOrderJournal(datastore=self,
+                                                  flush_interval=workorder_flush_interval,
+                                                  background=not in_memory)
+        Session = session_factory(sqlalchemy_engine) if sqlalchemy_engine else sessionmaker()
 
         # This will probably be on the reactor thread for most production configs.
         # Best to treat like hot lava.
@@ -149,6 +426,7 @@ class Datastore:
 
         session.add(new_policy_arrangement)
         self.__commit(session=session)
+        self.arrangement_cache.invalidate(arrangement_id)
         return new_policy_arrangement
 
     def get_policy_arrangement(self, arrangement_id: bytes, session=None) -> PolicyArrangement:
@@ -163,6 +441,24 @@ class Datastore:
             raise NotFound("No PolicyArrangement {} found.".format(arrangement_id))
         return policy_arrangement
 
+    def get_reencryption_material(self, arrangement_id: bytes, session=None) -> Tuple[KFrag, UmbralPublicKey]:
+        """
+        Returns the KFrag and Alice's verifying key of an enacted PolicyArrangement, deserialized,
+        and served from the arrangement cache when possible.
+        """
+        material = self.arrangement_cache.get(arrangement_id)
+        if material is None:
+            generation = self.arrangement_cache.generation()  # Lest a revocation during the read go unnoticed.
+            policy_arrangement = self.get_policy_arrangement(arrangement_id=arrangement_id, session=session)
+            kfrag = KFrag.from_bytes(policy_arrangement.kfrag)
+            alice_verifying_key = UmbralPublicKey.from_bytes(policy_arrangement.alice_verifying_key.key_data)
+            material = kfrag, alice_verifying_key
+            self.arrangement_cache.put(arrangement_id,
+                                       material,
+                                       expiration=policy_arrangement.expiration,
+                                       generation=generation)
+        return material
+
     def get_all_policy_arrangements(self, session=None) -> List[PolicyArrangement]:
         """
         Returns all the PolicyArrangements
@@ -185,6 +481,7 @@ class Datastore:
 
         policy_arrangement.kfrag = bytes(kfrag)
         self.__commit(session=session)
+        self.arrangement_cache.invalidate(id_as_hex.encode())
 
     def del_policy_arrangement(self, arrangement_id: bytes, session=None) -> int:
         """
@@ -194,20 +491,132 @@ class Datastore:
         deleted_records = session.query(PolicyArrangement).filter_by(id=arrangement_id).delete()
 
         self.__commit(session=session)
+        self.arrangement_cache.invalidate(arrangement_id)
         return deleted_records
 
-    def del_expired_policy_arrangements(self, session=None, now=None) -> int:
+    def del_expired_policy_arrangements(self,
+                                        session=None,
+                                        now=None,
+                                        workorder_archive: WorkOrderArchive = None,
+                                        chunk_size: int = PRUNING_CHUNK_SIZE
+                                        ) -> int:
         """
-        Deletes all expired PolicyArrangements from the Keystore.
+        Deletes all expired PolicyArrangements from the Keystore, committing every `chunk_size` of them
+        so that the database is never locked for long.  With a `workorder_archive`, the WorkOrders of
+        those arrangements are moved out of the Keystore into the archive.
         """
         session = session or self._session_on_init_thread
         now = now or datetime.now()
-        result = session.query(PolicyArrangement).filter(PolicyArrangement.expiration <= now)
+        if workorder_archive is not None:
+            self.workorder_journal.flush(session=session)
 
         deleted_records = 0
-        if result.count() > 0:
-            deleted_records = result.delete()
+        expired = session.query(PolicyArrangement.id).filter(PolicyArrangement.expiration <= now)
+        while True:
+            expired_ids = [arrangement_id for arrangement_id, in expired.limit(chunk_size)]
+            if not expired_ids:
+                break
+            try:
+                if workorder_archive is not None:
+                    self.__archive_workorders(arrangement_ids=expired_ids,
+                                              workorder_archive=workorder_archive,
+                                              now=now,
+                                              session=session)
+                expired_arrangements = session.query(PolicyArrangement).filter(PolicyArrangement.id.in_(expired_ids))
+                deleted_records += expired_arrangements.delete(synchronize_session=False)
+            except Exception:
+                session.rollback()  # Keep the chunk (and its WorkOrders) for the next attempt.
+                raise
+            self.__commit(session=session)
+
+        self.arrangement_cache.prune(now=now)
+        return deleted_records
+
+    def __archive_workorders(self,
+                             arrangement_ids: List[bytes],
+                             workorder_archive: WorkOrderArchive,
+                             now: datetime,
+                             session
+                             ) -> None:
+        # PolicyArrangements are stored by their hex-encoded ID, but Workorders by the raw one.
+        workorder_arrangement_ids = list()
+        for arrangement_id in arrangement_ids:
+            try:
+                workorder_arrangement_ids.append(bytes.fromhex(arrangement_id.decode()))
+            except ValueError:
+                continue
+        if not workorder_arrangement_ids:
+            return
+
+        workorders = session.query(Workorder).filter(Workorder.arrangement_id.in_(workorder_arrangement_ids))
+        workorders_with_keys = workorders.join(Key, Workorder.bob_verifying_key_id == Key.id).add_columns(Key.key_data)
+        records = [dict(arrangement_id=bytes(workorder.arrangement_id).hex(),
+                        bob_verifying_key=bytes(key_data).hex(),
+                        bob_signature=bytes(workorder.bob_signature).hex(),
+                        created_at=workorder.created_at.isoformat())
+                   for workorder, key_data in workorders_with_keys]
+        if records:
+            workorder_archive.write(records, now=now)
+            workorders.delete(synchronize_session=False)
+
+    #
+    # Treasure Maps
+    #
+
+    def add_treasure_map(self,
+                         map_id: bytes,
+                         treasure_map_bytes: bytes,
+                         expiration: Optional[datetime] = None,
+                         session=None
+                         ) -> None:
+        """
+        Saves a serialized TreasureMap until its expiration (or for DEFAULT_TREASURE_MAP_TTL, if it has none),
+        replacing any previous map with the same ID.
+        """
+        if expiration is None:
+            expiration = datetime.now() + self.DEFAULT_TREASURE_MAP_TTL
+        session = session or self._session_on_init_thread
+        session.merge(TreasureMapRecord(id=map_id, treasure_map=treasure_map_bytes, expiration=expiration))
         self.__commit(session=session)
+        self.treasure_map_cache.put(map_id, treasure_map_bytes, expiration=expiration)
+
+    def get_treasure_map(self, map_id: bytes, session=None) -> bytes:
+        """
+        Returns a serialized TreasureMap, from memory if it was requested (or saved) lately.
+        """
+        treasure_map_bytes = self.treasure_map_cache.get(map_id)
+        if treasure_map_bytes is None:
+            generation = self.treasure_map_cache.generation()
+            session = session or self._session_on_init_thread
+            record = session.query(TreasureMapRecord).filter_by(id=map_id).first()
+            if not record:
+                raise NotFound("No TreasureMap {} found.".format(map_id.hex()))
+            treasure_map_bytes = bytes(record.treasure_map)
+            self.treasure_map_cache.put(map_id, treasure_map_bytes, expiration=record.expiration, generation=generation)
+        return treasure_map_bytes
+
+    def count_treasure_maps(self, session=None) -> int:
+        session = session or self._session_on_init_thread
+        return session.query(TreasureMapRecord).count()
+
+    def del_expired_treasure_maps(self, session=None, now=None, chunk_size: int = PRUNING_CHUNK_SIZE) -> int:
+        """
+        Deletes all expired TreasureMaps, committing every `chunk_size` of them.
+        """
+        session = session or self._session_on_init_thread
+        now = now or datetime.now()
+
+        deleted_records = 0
+        expired = session.query(TreasureMapRecord.id).filter(TreasureMapRecord.expiration <= now)
+        while True:
+            expired_ids = [map_id for map_id, in expired.limit(chunk_size)]
+            if not expired_ids:
+                break
+            expired_maps = session.query(TreasureMapRecord).filter(TreasureMapRecord.id.in_(expired_ids))
+            deleted_records += expired_maps.delete(synchronize_session=False)
+            self.__commit(session=session)
+
+        self.treasure_map_cache.prune(now=now)
         return deleted_records
 
     #
@@ -223,21 +632,50 @@ class Datastore:
         """
         Adds a Workorder to the keystore.
         """
-        session = session or self._session_on_init_thread
+        record = WorkOrderRecord(bob_verifying_key=bytes(bob_verifying_key),
+                                 bob_signature=bytes(bob_signature),
+                                 arrangement_id=arrangement_id)
+        new_workorder, = self.save_workorders(records=[record], session=session)
+        return new_workorder
 
-        # Get or Create Bob Verifying Key
-        fingerprint = fingerprint_from_key(bob_verifying_key)
-        key = session.query(Key).filter_by(fingerprint=fingerprint).first()
-        if not key:
-            key = self.add_key(key=bob_verifying_key)
+    def save_workorders(self, records: List[WorkOrderRecord], session=None) -> List[Workorder]:
+        """
+        Adds many Workorders to the keystore in a single transaction.
+        If any of them is rejected (i.e. it, or Bob's key, was already saved), the rest are saved one by one.
+        """
+        session = session or self._session_on_init_thread
 
-        new_workorder = Workorder(bob_verifying_key_id=key.id,
-                                  bob_signature=bob_signature,
-                                  arrangement_id=arrangement_id)
+        # Get or Create Bob Verifying Keys
+        fingerprints = [fingerprint_from_key(record.bob_verifying_key) for record in records]
+        known_keys = session.query(Key).filter(Key.fingerprint.in_(set(fingerprints))).all()
+        keys = {key.fingerprint: key for key in known_keys}
+        for fingerprint, record in zip(fingerprints, records):
+            if fingerprint not in keys:
+                keys[fingerprint] = Key(fingerprint, record.bob_verifying_key, is_signing=True)
+                session.add(keys[fingerprint])
 
-        session.add(new_workorder)
-        self.__commit(session=session)
-        return new_workorder
+        try:
+            session.flush()  # The new keys, for their IDs.
+            new_workorders = [Workorder(bob_verifying_key_id=keys[fingerprint].id,
+                                        bob_signature=record.bob_signature,
+                                        arrangement_id=record.arrangement_id)
+                              for fingerprint, record in zip(fingerprints, records)]
+            session.add_all(new_workorders)
+            self.__commit(session=session)
+        except IntegrityError:
+            session.rollback()
+            if len(records) == 1:
+                raise
+            new_workorders = list()
+            for record in records:
+                try:
+                    new_workorders.extend(self.save_workorders(records=[record], session=session))
+                except IntegrityError:
+                    continue
+        except Exception:
+            session.rollback()  # Leave the session usable for whoever tries again.
+            raise
+        return new_workorders
 
     def get_workorders(self,
                        arrangement_id: bytes = None,
@@ -248,6 +686,7 @@ class Datastore:
         Returns a list of Workorders by HRAC.
         """
         session = session or self._session_on_init_thread
+        self.workorder_journal.flush(session=session)
         query = session.query(Workorder)
 
         if not arrangement_id and not bob_verifying_key:
@@ -275,6 +714,7 @@ class Datastore:
         Deletes a Workorder from the Keystore.
         """
         session = session or self._session_on_init_thread
+        self.workorder_journal.flush(session=session)
 
         workorders = session.query(Workorder).filter_by(arrangement_id=arrangement_id)
         deleted = workorders.delete()
@@ -14,7 +14,22 @@ GNU Affero General Public License for more details.
 You should have received a copy of the GNU Affero General Public License
 along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
 """
-from sqlalchemy.orm import scoped_session, sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
+from threading import Lock
+from weakref import WeakKeyDictionary
+
+_session_factories = WeakKeyDictionary()  # engine -> sessionmaker
+_session_factories_lock = Lock()
+
+
+def session_factory(sqlalchemy_engine) -> sessionmaker:
+    """Returns the session factory bound to an engine, which is made only once per engine."""
+    with _session_factories_lock:
+        try:
+            return _session_factories[sqlalchemy_engine]
+        except KeyError:
+            factory = _session_factories[sqlalchemy_engine] = sessionmaker(bind=sqlalchemy_engine)
+            return factory
 
 
 class ThreadedSession:
@@ -22,10 +37,9 @@ class ThreadedSession:
     def __init__(self, sqlalchemy_engine) -> None:
         self.engine = sqlalchemy_engine
 
-    def __enter__(self):
-        session_factory = sessionmaker(bind=self.engine)
-        self.session = scoped_session(session_factory)
+    def __enter__(self) -> Session:
+        self.session = session_factory(self.engine)()
         return self.session
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        self.session.remove()
+        self.session.close()
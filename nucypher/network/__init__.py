@@ -15,3 +15,4 @@ You should have received a copy of the GNU Affero General Public License
 along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
 """
 LEARNING_LOOP_VERSION = 1
+FLEET_SIZE_HEADER = 'X-Fleet-Size'  # Lets learners tell the size of a fleet from a delta of it.
@@ -207,6 +207,23 @@ class RestMiddleware:
         cfrags_and_signatures = splitter.repeat(ursula_rest_response.content)
         return cfrags_and_signatures
 
+    def reencrypt_batch(self, ursula, work_orders):
+        """
+        Sends many WorkOrders (possibly for different arrangements) to a single Ursula in one request.
+        Returns a list of cfrags and signatures for each WorkOrder, in order; the list is empty
+        for WorkOrders whose arrangement Ursula doesn't know about.
+        """
+        payload = bytes().join(work_order.arrangement_id + bytes(VariableLengthBytestring(work_order.payload()))
+                               for work_order in work_orders)
+        response = self.client.post(node_or_sprout=ursula,
+                                    path="reencrypt",
+                                    data=payload,
+                                    timeout=2 * len(work_orders))
+        splitter = BytestringSplitter((CapsuleFrag, VariableLengthBytestring), Signature)
+        cfrag_byte_streams = BytestringSplitter((bytes, VariableLengthBytestring)).repeat(response.content)
+        return [splitter.repeat(cfrag_byte_stream) if cfrag_byte_stream else []
+                for cfrag_byte_stream in cfrag_byte_streams]
+
     def revoke_arrangement(self, ursula, revocation):
         # TODO: Implement revocation confirmations
         response = self.client.delete(
@@ -225,9 +242,12 @@ class RestMiddleware:
                                    timeout=2)
         return response
 
-    def put_treasure_map_on_node(self, node, map_id, map_payload):
+    def put_treasure_map_on_node(self, node, map_id, map_payload, expiration: int = None, expiration_signature: bytes = None):
+        path = f"treasure_map/{map_id}"
+        if expiration is not None:
+            path += f"?expiration={expiration}&signature={expiration_signature.hex()}"
         response = self.client.post(node_or_sprout=node,
-                                    path=f"treasure_map/{map_id}",
+                                    path=path,
                                     data=map_payload,
                                     timeout=2)
         return response
@@ -255,17 +275,21 @@ class RestMiddleware:
                            node,
                            announce_nodes=None,
                            nodes_i_need=None,
-                           fleet_checksum=None):
+                           fleet_checksum=None,
+                           since_checksum=None):
         if nodes_i_need:
             # TODO: This needs to actually do something.  NRN
             # Include node_ids in the request; if the teacher node doesn't know about the
             # nodes matching these ids, then it will ask other nodes.
             pass
 
+        params = {}
         if fleet_checksum:
-            params = {'fleet': fleet_checksum}
-        else:
-            params = {}
+            params['fleet'] = fleet_checksum
+        if since_checksum:
+            # The teacher's fleet state as we last saw it;  teachers which still remember it reply with
+            # only the nodes that changed since, and all others simply ignore it and send everything.
+            params['since'] = since_checksum
 
         if announce_nodes:
             payload = bytes().join(bytes(VariableLengthBytestring(n)) for n in announce_nodes)
@@ -15,10 +15,15 @@ You should have received a copy of the GNU Affero General Public License
 along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
 """
 
+import bisect
 import contextlib
+import heapq
 import random
+import threading
 from collections import OrderedDict, defaultdict, deque, namedtuple
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from contextlib import suppress
+from functools import partial
 
 import binascii
 import maya
@@ -35,7 +40,7 @@ from requests.exceptions import SSLError
 from twisted.internet import defer, reactor, task
 from twisted.internet.threads import deferToThread
 from twisted.logger import Logger
-from typing import Set, Tuple, Union
+from typing import Optional, Set, Tuple, Union
 from umbral.signing import Signature
 
 import nucypher
@@ -43,13 +48,14 @@ from nucypher.blockchain.economics import EconomicsFactory
 from nucypher.blockchain.eth.agents import ContractAgency, StakingEscrowAgent
 from nucypher.blockchain.eth.constants import NULL_ADDRESS
 from nucypher.blockchain.eth.registry import BaseContractRegistry
+from nucypher.blockchain.eth.utils import epoch_to_period
 from nucypher.config.constants import SeednodeMetadata
 from nucypher.config.storages import ForgetfulNodeStorage
 from nucypher.crypto.api import keccak_digest, recover_address_eip_191, verify_eip_191
 from nucypher.crypto.kits import UmbralMessageKit
 from nucypher.crypto.powers import DecryptingPower, NoSigningPower, SigningPower, TransactingPower
 from nucypher.crypto.signing import signature_splitter
-from nucypher.network import LEARNING_LOOP_VERSION
+from nucypher.network import FLEET_SIZE_HEADER, LEARNING_LOOP_VERSION
 from nucypher.network.exceptions import NodeSeemsToBeDown
 from nucypher.network.middleware import RestMiddleware
 from nucypher.network.nicknames import nickname_from_seed
@@ -92,6 +98,7 @@ class FleetStateTracker:
     snapshot_splitter = BytestringSplitter(32, 4)
     log = Logger("Learning")
     FleetState = namedtuple("FleetState", ("nickname", "metadata", "icon", "nodes", "updated"))
+    DELTA_HISTORY_SIZE = 128  # Number of recent fleet states from which a delta can still be served.
 
     def __init__(self):
         self.additional_nodes_to_track = []
@@ -99,9 +106,35 @@ class FleetStateTracker:
         self._nodes = OrderedDict()
         self.states = OrderedDict()
 
+    @property
+    def _nodes(self):
+        return self.__nodes
+
+    @_nodes.setter
+    def _nodes(self, nodes):
+        # The fleet state checksum is computed over nodes sorted by checksum address;  keep a sorted
+        # index of addresses and a cache of serialized nodes so that a new state doesn't need a full re-sort.
+        self.__nodes = nodes
+        self.__sorted_nodes = {node.checksum_address: node for node in nodes.values()}
+        self.__sorted_addresses = sorted(self.__sorted_nodes)
+        self.__serialized_nodes = dict()
+
+        # Every change to a node appends its address to the change log;  a fleet state remembers the
+        # length of the log when it was recorded, so that the nodes changed since then can be sliced off.
+        self.__change_log = list(self.__sorted_addresses)
+        self.__change_log_offset = 0
+        self.__state_revisions = OrderedDict()
+
     def __setitem__(self, key, value):
         self._nodes[key] = value
 
+        checksum_address = value.checksum_address
+        if checksum_address not in self.__sorted_nodes:
+            bisect.insort(self.__sorted_addresses, checksum_address)
+        self.__sorted_nodes[checksum_address] = value
+        self.__serialized_nodes.pop(checksum_address, None)  # Serialized lazily, when the next state is recorded.
+        self.__change_log.append(checksum_address)
+
         if self._tracking:
             self.log.info("Updating fleet state after saving node {}".format(value))
             self.record_fleet_state()
@@ -169,12 +202,11 @@ class FleetStateTracker:
         if not self._nodes:
             # No news here.
             return
-        sorted_nodes = self.sorted()
+        sorted_nodes, serialized_nodes = self._sorted_and_serialized()
 
-        sorted_nodes_joined = b"".join(bytes(n) for n in sorted_nodes)
-        checksum = keccak_digest(sorted_nodes_joined).hex()
+        checksum = keccak_digest(*serialized_nodes).hex()
         if checksum not in self.states:
-            self.checksum = keccak_digest(b"".join(bytes(n) for n in self.sorted())).hex()
+            self.checksum = checksum
             self.updated = maya.now()
             # For now we store the sorted node list.  Someday we probably spin this out into
             # its own class, FleetState, and use it as the basis for partial updates.
@@ -184,7 +216,62 @@ class FleetStateTracker:
                                         icon=self.icon,
                                         updated=self.updated)
             self.states[checksum] = new_state
+            self.__remember_revision(checksum)
             return checksum, new_state
+        self.__remember_revision(checksum)
+
+    def __remember_revision(self, checksum: str) -> None:
+        self.__state_revisions[checksum] = self.__change_log_offset + len(self.__change_log)
+        self.__state_revisions.move_to_end(checksum)
+        if len(self.__state_revisions) > self.DELTA_HISTORY_SIZE:
+            self.__state_revisions.popitem(last=False)
+            oldest_revision = next(iter(self.__state_revisions.values()))
+            del self.__change_log[:oldest_revision - self.__change_log_offset]
+            self.__change_log_offset = oldest_revision
+
+    def remembers_state(self, checksum: str) -> bool:
+        """
+        True if a delta can still be described from the fleet state `checksum`.
+        """
+        return checksum in self.__state_revisions
+
+    def nodes_updated_since(self, checksum: str) -> Optional[list]:
+        """
+        Returns the known nodes which were added or updated after the fleet state `checksum` was recorded,
+        or None if that state was never recorded here or has fallen out of the delta history.
+        """
+        try:
+            revision = self.__state_revisions[checksum]
+        except KeyError:
+            return None
+        updated_addresses = set(self.__change_log[revision - self.__change_log_offset:])
+        return [self.__sorted_nodes[address] for address in sorted(updated_addresses)]
+
+    def _sorted_and_serialized(self) -> Tuple[list, list]:
+        """
+        Returns all tracked nodes sorted by checksum address, along with their serialized forms.
+        Known nodes come from the sorted index (serializing only those that changed since the last call);
+        the handful of additional nodes to track are merged in.
+        """
+        indexed_nodes = []
+        for checksum_address in self.__sorted_addresses:
+            node = self.__sorted_nodes[checksum_address]
+            try:
+                node_bytes = self.__serialized_nodes[checksum_address]
+            except KeyError:
+                node_bytes = self.__serialized_nodes[checksum_address] = bytes(node)
+            indexed_nodes.append((node, node_bytes))
+
+        if self.additional_nodes_to_track:
+            additional_nodes = sorted(((n, bytes(n)) for n in self.additional_nodes_to_track),
+                                      key=lambda pair: pair[0].checksum_address)
+            indexed_nodes = heapq.merge(indexed_nodes, additional_nodes, key=lambda pair: pair[0].checksum_address)
+
+        sorted_nodes, serialized_nodes = [], []
+        for node, node_bytes in indexed_nodes:
+            sorted_nodes.append(node)
+            serialized_nodes.append(node_bytes)
+        return sorted_nodes, serialized_nodes
 
     def start_tracking_state(self, additional_nodes_to_track=None):
         if additional_nodes_to_track is None:
@@ -194,8 +281,8 @@ class FleetStateTracker:
         self.update_fleet_state()
 
     def sorted(self):
-        nodes_to_consider = list(self._nodes.values()) + self.additional_nodes_to_track
-        return sorted(nodes_to_consider, key=lambda n: n.checksum_address)
+        sorted_nodes, _serialized_nodes = self._sorted_and_serialized()
+        return sorted_nodes
 
     def shuffled(self):
         nodes_we_know_about = list(self._nodes.values())
@@ -223,6 +310,8 @@ class NodeSprout(PartiallyKwargifiedBytes):
     An abridged node class designed for optimization of instantiation of > 100 nodes simultaneously.
     """
     verified_node = False
+    payload_bytes = None  # The bytes this sprout was split from, if known.
+    __serialized = None
 
     def __init__(self, node_metadata):
         super().__init__(node_metadata)
@@ -239,13 +328,15 @@ class NodeSprout(PartiallyKwargifiedBytes):
         return self._repr
 
     def __bytes__(self):
-        b = super().__bytes__()
+        if self.__serialized is None:
+            b = self.payload_bytes or super().__bytes__()
 
-        # We assume that the TEACHER_VERSION of this codebase is the version for this NodeSprout.
-        # This is probably true, right?  Might need to be re-examined someday if we have
-        # different node types of different versions.
-        version = Teacher.TEACHER_VERSION.to_bytes(2, "big")
-        return version + b
+            # We assume that the TEACHER_VERSION of this codebase is the version for this NodeSprout.
+            # This is probably true, right?  Might need to be re-examined someday if we have
+            # different node types of different versions.
+            version = Teacher.TEACHER_VERSION.to_bytes(2, "big")
+            self.__serialized = version + b
+        return self.__serialized
 
     @property
     def stamp(self) -> bytes:
@@ -275,6 +366,11 @@ class Learner:
     _LONG_LEARNING_DELAY = 90
     LEARNING_TIMEOUT = 10
     _ROUNDS_WITHOUT_NODES_AFTER_WHICH_TO_SLOW_DOWN = 10
+    _TEACHERS_PER_ROUND = 3
+    _TEACHER_BACKOFF_DELAY = 5  # seconds, doubled for every consecutive failure
+    _MAX_TEACHER_BACKOFF_DELAY = 600
+    _VERIFICATION_THREADS = 10
+    _VERIFICATIONS_PER_HOST = 2
 
     # For Keeps
     __DEFAULT_NODE_STORAGE = ForgetfulNodeStorage
@@ -319,7 +415,8 @@ class Learner:
                  node_storage=None,
                  save_metadata: bool = False,
                  abort_on_learning_error: bool = False,
-                 lonely: bool = False
+                 lonely: bool = False,
+                 teachers_per_round: int = None
                  ) -> None:
 
         self.log = Logger("learning-loop")  # type: Logger
@@ -363,12 +460,16 @@ class Learner:
                 self.unresponsive_startup_nodes.append(node)
 
         self.teacher_nodes = deque()
+        self.teachers_per_round = teachers_per_round or self._TEACHERS_PER_ROUND
+        self._teacher_backoffs = dict()  # checksum address -> (consecutive failures, time to retry)
+        self._host_verification_slots = defaultdict(partial(threading.BoundedSemaphore, self._VERIFICATIONS_PER_HOST))
         self._current_teacher_node = None  # type: Teacher
         self._learning_task = task.LoopingCall(self.keep_learning_about_nodes)
         self._learning_round = 0  # type: int
         self._rounds_without_new_nodes = 0  # type: int
         self._seed_nodes = seed_nodes or []
         self.unresponsive_seed_nodes = set()
+        self._seed_node_retry_lock = threading.Lock()
 
         if self.start_learning_now:
             self.start_learning_loop(now=self.learn_on_same_thread)
@@ -385,8 +486,23 @@ class Learner:
             self.log.debug("Already done seeding; won't try again.")
             return
 
+        self._seed_from(self._seed_nodes)
+
+        if not self.unresponsive_seed_nodes:
+            self.log.info("Finished learning about all seednodes.")
+
+        self.done_seeding = True
+
+        if read_storage is True:
+            self.read_nodes_from_storage()
+
+        if not self.known_nodes:
+            self.log.warn("No seednodes were available after {} attempts".format(retry_attempts))
+            # TODO: Need some actual logic here for situation with no seed nodes (ie, maybe try again much later)  567
+
+    def _seed_from(self, seednodes_metadata) -> None:
         from nucypher.characters.lawful import Ursula
-        for seednode_metadata in self._seed_nodes:
+        for seednode_metadata in seednodes_metadata:
 
             self.log.debug(
                 "Seeding from: {}|{}:{}".format(seednode_metadata.checksum_address,
@@ -402,17 +518,27 @@ class Learner:
                 self.unresponsive_seed_nodes.discard(seednode_metadata)
                 self.remember_node(seed_node)
 
-        if not self.unresponsive_seed_nodes:
-            self.log.info("Finished learning about all seednodes.")
-
-        self.done_seeding = True
-
-        if read_storage is True:
-            self.read_nodes_from_storage()
+    def retry_unresponsive_seed_nodes(self) -> None:
+        """
+        Tries once more to reach the seed nodes which didn't respond, off the reactor thread
+        unless learning happens on this one.  Only one retry is underway at a time.
+        """
+        if self.lonely or not self.unresponsive_seed_nodes:
+            return
+        if not self._seed_node_retry_lock.acquire(blocking=False):
+            return  # Already retrying.
+        self.log.info("Still have unresponsive seed nodes; trying again to connect.")
+        if self.learn_on_same_thread:
+            self.__retry_seed_nodes()
+        else:
+            seeder_deferred = deferToThread(self.__retry_seed_nodes)
+            seeder_deferred.addErrback(self.handle_learning_errors)
 
-        if not self.known_nodes:
-            self.log.warn("No seednodes were available after {} attempts".format(retry_attempts))
-            # TODO: Need some actual logic here for situation with no seed nodes (ie, maybe try again much later)  567
+    def __retry_seed_nodes(self) -> None:
+        try:
+            self._seed_from(tuple(self.unresponsive_seed_nodes))
+        finally:
+            self._seed_node_retry_lock.release()
 
     def read_nodes_from_storage(self) -> None:
         stored_nodes = self.node_storage.all(federated_only=self.federated_only)  # TODO: #466
@@ -431,6 +557,18 @@ class Learner:
         # VERIFIED_CERT
         # VERIFIED_STAKE
 
+        if not self._know_node(node):
+            return False
+
+        if eager and not self._verify_known_node(node, force_verification_recheck=force_verification_recheck):
+            return False
+
+        return self._finish_remembering(node, record_fleet_state=record_fleet_state)
+
+    def _know_node(self, node) -> bool:
+        """
+        Adds `node` to our known nodes, unless it's us or an outdated representation of a node we already know.
+        """
         if node == self:  # No need to remember self.
             return False
 
@@ -447,38 +585,45 @@ class Learner:
 
         if self.save_metadata:
             self.node_storage.store_node_metadata(node=node)
+        return True
 
-        if eager:
-            node.mature()
-            stranger_certificate = node.certificate
+    def _verify_known_node(self, node, force_verification_recheck=False) -> bool:
+        node.mature()
+        stranger_certificate = node.certificate
 
-            # Store node's certificate - It has been seen.
-            certificate_filepath = self.node_storage.store_node_certificate(certificate=stranger_certificate)
+        # Store node's certificate - It has been seen.
+        certificate_filepath = self.node_storage.store_node_certificate(certificate=stranger_certificate)
 
-            # In some cases (seed nodes or other temp stored certs),
-            # this will update the filepath from the temp location to this one.
-            node.certificate_filepath = certificate_filepath
+        # In some cases (seed nodes or other temp stored certs),
+        # this will update the filepath from the temp location to this one.
+        node.certificate_filepath = certificate_filepath
 
-            try:
-                node.verify_node(force=force_verification_recheck,
-                                 network_middleware_client=self.network_middleware.client,
-                                 registry=self.registry)  # composed on character subclass, determines operating mode
-            except SSLError:
-                # TODO: Bucket this node as having bad TLS info - maybe it's an update that hasn't fully propagated?  567
-                return False
+        try:
+            node.verify_node(force=force_verification_recheck,
+                             network_middleware_client=self.network_middleware.client,
+                             registry=self.registry)  # composed on character subclass, determines operating mode
+        except SSLError:
+            # TODO: Bucket this node as having bad TLS info - maybe it's an update that hasn't fully propagated?  567
+            return False
 
-            except NodeSeemsToBeDown:
-                self.log.info("No Response while trying to verify node {}|{}".format(node.rest_interface, node))
-                # TODO: Bucket this node as "ghost" or something: somebody else knows about it, but we can't get to it.  567
-                return False
+        except NodeSeemsToBeDown:
+            self.log.info("No Response while trying to verify node {}|{}".format(node.rest_interface, node))
+            # TODO: Bucket this node as "ghost" or something: somebody else knows about it, but we can't get to it.  567
+            return False
 
-            except node.NotStaking:
-                # TODO: Bucket this node as inactive, and potentially safe to forget.  567
-                self.log.info(f'Staker:Worker {node.checksum_address}:{node.worker_address} is not actively staking, skipping.')
-                return False
+        except node.NotStaking:
+            # TODO: Bucket this node as inactive, and potentially safe to forget.  567
+            self.log.info(f'Staker:Worker {node.checksum_address}:{node.worker_address} is not actively staking, skipping.')
+            return False
+
+        # TODO: What about InvalidNode?  (for that matter, any SuspiciousActivity)  1714, 567 too really
+        return True
 
-            # TODO: What about InvalidNode?  (for that matter, any SuspiciousActivity)  1714, 567 too really
+    def _verify_known_node_on_host(self, node, host_slots: threading.BoundedSemaphore) -> bool:
+        with host_slots:
+            return self._verify_known_node(node)
 
+    def _finish_remembering(self, node, record_fleet_state=True):
         listeners = self._learning_listeners.pop(node.checksum_address, tuple())
 
         for listener in listeners:
@@ -490,6 +635,37 @@ class Learner:
 
         return node
 
+    def _finish_remembering_verified(self, node, verification: Future):
+        if not verification.result():
+            return False
+        return self._finish_remembering(node, record_fleet_state=False)
+
+    def _remembering(self, sprouts_and_teachers, eager=False):
+        """
+        Yields (sprout, teacher, remember) for each sprout worth remembering, where calling `remember`
+        finishes remembering that sprout (raising any verification failure) and returns the node, or False.
+
+        Eager verification is spread across a thread pool, with at most a few verifications of nodes
+        on any one host at a time;  sprouts are yielded as their verifications complete.
+        """
+        if not eager:
+            for sprout, teacher in sprouts_and_teachers:
+                yield sprout, teacher, partial(self.remember_node, sprout, record_fleet_state=False)
+            return
+
+        with ThreadPoolExecutor(max_workers=self._VERIFICATION_THREADS) as executor:
+            verifications = dict()
+            for sprout, teacher in sprouts_and_teachers:
+                if not self._know_node(sprout):
+                    continue
+                host_slots = self._host_verification_slots[sprout.rest_interface.host]
+                verification = executor.submit(self._verify_known_node_on_host, sprout, host_slots)
+                verifications[verification] = sprout, teacher
+
+            for verification in as_completed(verifications):
+                sprout, teacher = verifications[verification]
+                yield sprout, teacher, partial(self._finish_remembering_verified, sprout, verification)
+
     def start_learning_loop(self, now=False):
         if self._learning_task.running:
             return False
@@ -503,7 +679,7 @@ class Learner:
             else:
                 self.load_seednodes()
 
-            self.learn_from_teacher_node()
+            self.learn_from_teachers()
             self.learning_deferred = self._learning_task.start(interval=self._SHORT_LEARNING_DELAY)
             self.learning_deferred.addErrback(self.handle_learning_errors)
             return self.learning_deferred
@@ -562,9 +738,7 @@ class Learner:
     def cycle_teacher_node(self):
         # To ensure that all the best teachers are available, first let's make sure
         # that we have connected to all the seed nodes.
-        if self.unresponsive_seed_nodes and not self.lonely:
-            self.log.info("Still have unresponsive seed nodes; trying again to connect.")
-            self.load_seednodes()  # Ideally, this is async and singular.
+        self.retry_unresponsive_seed_nodes()
 
         if not self.teacher_nodes:
             self.select_teacher_nodes()
@@ -602,7 +776,7 @@ class Learner:
         Continually learn about new nodes.
         """
         # TODO: Allow the user to set eagerness?  1712
-        self.learn_from_teacher_node(eager=False)
+        self.learn_from_teachers(eager=False)
 
     def learn_about_specific_nodes(self, addresses: Set):
         self._node_ids_to_learn_about_immediately.update(addresses)  # hmmmm
@@ -773,11 +947,6 @@ class Learner:
             self.log.warn("Can't learn right now: {}".format(e.args[0]))
             return
 
-        if Teacher in self.__class__.__bases__:
-            announce_nodes = [self]
-        else:
-            announce_nodes = None
-
         unresponsive_nodes = set()
 
         #
@@ -785,10 +954,7 @@ class Learner:
         #
 
         try:
-            response = self.network_middleware.get_nodes_via_rest(node=current_teacher,
-                                                                  nodes_i_need=self._node_ids_to_learn_about_immediately,
-                                                                  announce_nodes=announce_nodes,
-                                                                  fleet_checksum=self.known_nodes.checksum)
+            response = self._request_nodes_from_teacher(current_teacher)
         except NodeSeemsToBeDown as e:
             unresponsive_nodes.add(current_teacher)
             self.log.info("Bad Response from teacher: {}:{}.".format(current_teacher, e))
@@ -804,6 +970,132 @@ class Learner:
             # Is cycling happening in the right order?
             self.cycle_teacher_node()
 
+        sprouts = self._sprouts_from_teacher_response(current_teacher, response)
+        if not isinstance(sprouts, list):
+            return sprouts  # One of the edge cases;  there's nothing to remember.
+
+        remembered = self._remember_sprouts(((sprout, current_teacher) for sprout in sprouts), eager=eager)
+        self._finish_learning_from_teacher(current_teacher, sprouts)
+
+        learning_round_log_message = "Learning round {}.  Teacher: {} knew about {} nodes, {} were new."
+        self.log.info(learning_round_log_message.format(self._learning_round,
+                                                        current_teacher,
+                                                        len(sprouts),
+                                                        len(remembered)))
+        if remembered:
+            self.known_nodes.record_fleet_state()
+        return sprouts
+
+    def learn_from_teachers(self, eager=False):
+        """
+        Asks several teachers at once about the nodes they know, and learns about each announced node only once,
+        in its most recent form.  Teachers that can't be reached or don't teach us anything are backed off from.
+        """
+        self._learning_round += 1
+
+        # To ensure that all the best teachers are available, keep trying the seed nodes we couldn't reach.
+        self.retry_unresponsive_seed_nodes()
+
+        teachers = self._select_teachers_for_round()
+        if not teachers:
+            self.log.warn("Can't learn right now: No teachers are available this round.")
+            return
+        self._current_teacher_node = teachers[0]
+
+        newest_sprouts = dict()  # checksum address -> (sprout, teacher)
+        sprouts_by_teacher = list()
+        with ThreadPoolExecutor(max_workers=len(teachers)) as executor:
+            requests_to_teachers = {executor.submit(self._request_nodes_from_teacher, teacher): teacher
+                                    for teacher in teachers}
+
+            # Responses are parsed here, on this thread, as they arrive.
+            for request_to_teacher in as_completed(requests_to_teachers):
+                teacher = requests_to_teachers[request_to_teacher]
+                try:
+                    response = request_to_teacher.result()
+                except (NodeSeemsToBeDown, Teacher.InvalidNode) as e:
+                    self.log.info("Bad Response from teacher: {}:{}.".format(teacher, e))
+                    self._back_off_from_teacher(teacher)
+                    continue
+
+                sprouts = self._sprouts_from_teacher_response(teacher, response)
+                if sprouts is None:
+                    self._back_off_from_teacher(teacher)
+                    continue
+                self._teacher_backoffs.pop(teacher.checksum_address, None)
+                self._current_teacher_node = teacher  # The latest teacher to get through to us.
+
+                if not isinstance(sprouts, list):
+                    continue  # This teacher knows no nodes, or none that we don't.
+                sprouts_by_teacher.append((teacher, sprouts))
+                for sprout in sprouts:
+                    already_taught = newest_sprouts.get(sprout.checksum_address)
+                    if already_taught is None or sprout.timestamp > already_taught[0].timestamp:
+                        newest_sprouts[sprout.checksum_address] = sprout, teacher
+
+        remembered = self._remember_sprouts(newest_sprouts.values(), eager=eager)
+        for teacher, sprouts in sprouts_by_teacher:
+            self._finish_learning_from_teacher(teacher, sprouts)
+
+        learning_round_log_message = "Learning round {}.  {} teachers knew about {} distinct nodes, {} were new."
+        self.log.info(learning_round_log_message.format(self._learning_round,
+                                                        len(teachers),
+                                                        len(newest_sprouts),
+                                                        len(remembered)))
+        if remembered:
+            self.known_nodes.record_fleet_state()
+        return [sprout for sprout, _teacher in newest_sprouts.values()]
+
+    def _select_teachers_for_round(self) -> list:
+        """
+        Takes up to `teachers_per_round` distinct teachers off the teacher queue, skipping any we're backing off from.
+        """
+        now = time.time()
+        teachers = OrderedDict()
+        refilled = False
+        while len(teachers) < self.teachers_per_round:
+            if not self.teacher_nodes:
+                if refilled:
+                    break
+                try:
+                    self.select_teacher_nodes()
+                except self.NotEnoughTeachers:
+                    break
+                refilled = True
+            teacher = self.teacher_nodes.pop()
+            _failures, retry_at = self._teacher_backoffs.get(teacher.checksum_address, (0, now))
+            if retry_at <= now:
+                teachers.setdefault(teacher.checksum_address, teacher)
+        return list(teachers.values())
+
+    def _back_off_from_teacher(self, teacher) -> None:
+        failures, _retry_at = self._teacher_backoffs.get(teacher.checksum_address, (0, None))
+        delay = min(self._TEACHER_BACKOFF_DELAY * 2 ** failures, self._MAX_TEACHER_BACKOFF_DELAY)
+        self._teacher_backoffs[teacher.checksum_address] = failures + 1, time.time() + delay
+
+    def _request_nodes_from_teacher(self, teacher):
+        if Teacher in self.__class__.__bases__:
+            announce_nodes = [self]
+        else:
+            announce_nodes = None
+
+        # The teacher's fleet state as of the last visit from which we learned all it knew, if any,
+        # so that it can send only what changed since then.
+        # A teacher that is still an unmatured NodeSprout hasn't taught us anything yet.
+        last_teacher_checksum = getattr(teacher, 'last_learned_fleet_state', None)
+
+        response = self.network_middleware.get_nodes_via_rest(node=teacher,
+                                                              nodes_i_need=self._node_ids_to_learn_about_immediately,
+                                                              announce_nodes=announce_nodes,
+                                                              fleet_checksum=self.known_nodes.checksum,
+                                                              since_checksum=last_teacher_checksum)
+        return response
+
+    def _sprouts_from_teacher_response(self, current_teacher, response):
+        """
+        Returns the sprouts taught by `current_teacher`, NO_KNOWN_NODES or FLEET_STATES_MATCH,
+        or None if the response is of no use.
+        """
         # Before we parse the response, let's handle some edge cases.
         if response.status_code == 204:
             # In this case, this node knows about no other nodes.  Hopefully we've taught it something.
@@ -853,6 +1145,7 @@ class Learner:
                                             updated=maya.MayaDT(
                                                 int.from_bytes(fleet_state_updated_bytes, byteorder="big")),
                                             number_of_known_nodes=len(self.known_nodes))
+            current_teacher.last_learned_fleet_state = checksum
             return FLEET_STATES_MATCH
 
         # Note: There was previously a version check here, but that required iterating through node bytestrings twice,
@@ -860,14 +1153,38 @@ class Learner:
         # somewhere more performant, like mature() or verify_node().
 
         sprouts = self.node_class.batch_from_bytes(node_payload)
+
+        # A delta doesn't tell how many nodes the teacher knows, so teachers that send deltas say so separately.
+        try:
+            number_of_known_nodes = int(response.headers[FLEET_SIZE_HEADER])
+        except (KeyError, ValueError):
+            number_of_known_nodes = len(sprouts)
+
+        # Is cycling happening in the right order?
+        current_teacher.update_snapshot(checksum=checksum,
+                                        updated=maya.MayaDT(int.from_bytes(fleet_state_updated_bytes, byteorder="big")),
+                                        number_of_known_nodes=number_of_known_nodes)
+        return sprouts
+
+    def _finish_learning_from_teacher(self, teacher, sprouts) -> None:
+        """
+        Asks `teacher` for only what changed since its current fleet state if all the nodes it just taught
+        are now known;  otherwise, the next exchange with it is a full one, so that none are missed.
+        """
+        taught_addresses = {sprout.checksum_address for sprout in sprouts}
+        taught_addresses.discard(getattr(self, 'checksum_address', None))
+        if taught_addresses.issubset(self.known_nodes.addresses()):
+            teacher.last_learned_fleet_state = teacher.fleet_state_checksum
+        else:
+            teacher.last_learned_fleet_state = None
+
+    def _remember_sprouts(self, sprouts_and_teachers, eager=False) -> list:
         remembered = []
-        for sprout in sprouts:
+        # Do we want both verification and remembering to be decided by `eager`?
+        for sprout, current_teacher, remember in self._remembering(sprouts_and_teachers, eager=eager):
             fail_fast = True  # TODO  NRN
             try:
-                node_or_false = self.remember_node(sprout,
-                                                   record_fleet_state=False,
-                                                   # Do we want both of these to be decided by `eager`?
-                                                   eager=eager)
+                node_or_false = remember()
                 if node_or_false is not False:
                     remembered.append(node_or_false)
 
@@ -904,23 +1221,59 @@ class Learner:
                           f"Propagated by: {current_teacher}"
                 self.log.warn(message)
 
+        return remembered
 
-        # Is cycling happening in the right order?
-        current_teacher.update_snapshot(checksum=checksum,
-                                        updated=maya.MayaDT(int.from_bytes(fleet_state_updated_bytes, byteorder="big")),
-                                        number_of_known_nodes=len(sprouts))
-
-        ###################
 
+class StakingVerificationCache:
+    """
+    The on-chain facts that worker validation relies upon - which staker each worker is bonded to, and how many
+    tokens each staker has locked - cached for all the nodes verified in this process.  Entries expire at the end
+    of the period in which they were read, or after `ttl` seconds, whichever comes first.  Expired entries are
+    dropped at the next write after a period boundary, and the least recently used beyond `max_size` at every write.
+    """
 
-        learning_round_log_message = "Learning round {}.  Teacher: {} knew about {} nodes, {} were new."
-        self.log.info(learning_round_log_message.format(self._learning_round,
-                                                        current_teacher,
-                                                        len(sprouts),
-                                                        len(remembered)))
-        if remembered:
-            self.known_nodes.record_fleet_state()
-        return sprouts
+    DEFAULT_TTL = 60 * 10  # seconds
+    DEFAULT_MAX_SIZE = 10_000
+
+    def __init__(self, ttl: int = DEFAULT_TTL, max_size: int = DEFAULT_MAX_SIZE):
+        self.ttl = ttl
+        self.max_size = max_size
+        self.__entries = OrderedDict()  # key -> (value, expiration)
+        self.__lock = threading.Lock()
+        self.__pruned_in_period = None
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    def get(self, key: tuple, seconds_per_period: int, fetch):
+        now = time.time()
+        with self.__lock:
+            value, expiration = self.__entries.get(key, (None, now))
+            if expiration > now:
+                self.__entries.move_to_end(key)
+                return value
+
+        value = fetch()
+        current_period = epoch_to_period(int(now), seconds_per_period=seconds_per_period)
+        end_of_period = (current_period + 1) * seconds_per_period
+        with self.__lock:
+            if current_period != self.__pruned_in_period:
+                self.__prune(now)
+                self.__pruned_in_period = current_period
+            self.__entries[key] = value, min(now + self.ttl, end_of_period)
+            self.__entries.move_to_end(key)
+            while len(self.__entries) > self.max_size:
+                self.__entries.popitem(last=False)
+        return value
+
+    def __prune(self, now: float) -> None:
+        expired = [key for key, (_value, expiration) in self.__entries.items() if expiration <= now]
+        for key in expired:
+            del self.__entries[key]
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__entries.clear()
 
 
 class Teacher:
@@ -929,6 +1282,7 @@ class Teacher:
     log = Logger("teacher")
     synchronous_query_timeout = 20  # How long to wait during REST endpoints for blockchain queries to resolve
     __DEFAULT_MIN_SEED_STAKE = 0
+    _staking_verification_cache = StakingVerificationCache()
 
     def __init__(self,
                  domains: Set,
@@ -946,6 +1300,7 @@ class Teacher:
         self.serving_domains = domains
         self.fleet_state_checksum = None
         self.fleet_state_updated = None
+        self.last_learned_fleet_state = None  # The fleet state from which this teacher may send us a delta.
         self.last_seen = NEVER_SEEN("No Connection to Node")
 
         self.fleet_state_icon = UNKNOWN_FLEET_STATE
@@ -1007,6 +1362,10 @@ class Teacher:
     def set_federated_mode(cls, federated_only: bool):
         cls._federated_only_instances = federated_only
 
+    @classmethod
+    def set_staking_verification_ttl(cls, ttl: int):
+        cls._staking_verification_cache.ttl = ttl
+
     @classmethod
     def from_tls_hosting_power(cls, tls_hosting_power: TLSHostingPower, *args, **kwargs) -> 'Teacher':
         certificate_filepath = tls_hosting_power.keypair.certificate_filepath
@@ -1031,9 +1390,18 @@ class Teacher:
         nodes_to_consider = list(self.known_nodes.values()) + [self]
         return sorted(nodes_to_consider, key=lambda n: n.checksum_address)
 
-    def bytestring_of_known_nodes(self):
+    def bytestring_of_known_nodes(self, since: str = None):
+        """
+        Our fleet state snapshot followed by our known nodes and ourselves.  If `since` is the checksum
+        of one of our recent fleet states, only the nodes that changed after that state are included.
+        """
         payload = self.known_nodes.snapshot()
-        ursulas_as_vbytes = (VariableLengthBytestring(n) for n in self.known_nodes)
+        nodes = None
+        if since:
+            nodes = self.known_nodes.nodes_updated_since(since)
+        if nodes is None:
+            nodes = self.known_nodes  # We can't tell what changed;  send everything.
+        ursulas_as_vbytes = (VariableLengthBytestring(n) for n in nodes)
         ursulas_as_bytes = bytes().join(bytes(u) for u in ursulas_as_vbytes)
         ursulas_as_bytes += VariableLengthBytestring(bytes(self))
 
@@ -1085,8 +1453,13 @@ class Teacher:
         """
         # Lazy agent get or create
         staking_agent = ContractAgency.get_agent(StakingEscrowAgent, registry=registry)
+        economics = EconomicsFactory.get_economics(registry=registry)
 
-        staker_address = staking_agent.get_staker_from_worker(worker_address=self.worker_address)
+        worker_address = self.worker_address
+        staker_address = self._staking_verification_cache.get(
+            key=(registry.id, 'staker_from_worker', worker_address),
+            seconds_per_period=economics.seconds_per_period,
+            fetch=lambda: staking_agent.get_staker_from_worker(worker_address=worker_address))
         if staker_address == NULL_ADDRESS:
             raise self.UnbondedWorker(f"Worker {self.worker_address} is not bonded")
         return staker_address == self.checksum_address
@@ -1106,8 +1479,12 @@ class Teacher:
 
         min_stake = economics.minimum_allowed_locked
 
-        stake_current_period = staking_agent.get_locked_tokens(staker_address=self.checksum_address, periods=0)
-        stake_next_period = staking_agent.get_locked_tokens(staker_address=self.checksum_address, periods=1)
+        staker_address = self.checksum_address
+        stake_current_period, stake_next_period = self._staking_verification_cache.get(
+            key=(registry.id, 'locked_tokens', staker_address),
+            seconds_per_period=economics.seconds_per_period,
+            fetch=lambda: (staking_agent.get_locked_tokens(staker_address=staker_address, periods=0),
+                           staking_agent.get_locked_tokens(staker_address=staker_address, periods=1)))
         is_staking = max(stake_current_period, stake_next_period) >= min_stake
         return is_staking
 
@@ -171,6 +171,21 @@ class TreasureMap:
         _id = keccak_digest(bytes(self._verifying_key) + bytes(self._hrac)).hex()
         return _id
 
+    def _expiration_message(self, expiration: int) -> bytes:
+        return bytes.fromhex(self.public_id()) + expiration.to_bytes(8, 'big')
+
+    def sign_expiration(self, alice_stamp, expiration: maya.MayaDT) -> Tuple[int, bytes]:
+        """
+        Alice's signed word of when the policy expires (in seconds since the epoch), so that Ursulas
+        know for how long to keep this map.
+        """
+        epoch = expiration.epoch
+        return epoch, bytes(alice_stamp(self._expiration_message(epoch)))
+
+    def verify_expiration(self, expiration: int, signature: bytes) -> bool:
+        signature = Signature.from_bytes(signature)
+        return signature.verify(self._expiration_message(expiration), self._verifying_key)
+
     @classmethod
     def from_bytes(cls, bytes_representation, verify=True):
         signature, hrac, tmap_message_kit = cls.splitter(bytes_representation)
@@ -16,14 +16,16 @@ along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
 """
 
 import random
+import time
 from collections import OrderedDict, deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 
 import maya
 from abc import ABC, abstractmethod
 from bytestring_splitter import BytestringSplitter, VariableLengthBytestring
 from constant_sorrow.constants import NOT_SIGNED, UNKNOWN_KFRAG
 from twisted.logger import Logger
-from typing import Generator, List, Set
+from typing import Dict, Generator, List, Set, Tuple
 from umbral.keys import UmbralPublicKey
 from umbral.kfrags import KFrag
 
@@ -176,6 +178,10 @@ class Policy(ABC):
     POLICY_ID_LENGTH = 16
     _arrangement_class = NotImplemented
 
+    # Arrangement negotiation and enactment requests are sent to Ursulas concurrently
+    MAX_CONCURRENT_REQUESTS = 10
+    NODE_TIMEOUT = 10  # seconds
+
     log = Logger("Policy")
 
     class Rejected(RuntimeError):
@@ -263,6 +269,11 @@ class Policy(ABC):
             # TODO: Optionally, block.
             raise RuntimeError("Alice hasn't learned of any nodes.  Thus, she can't push the TreasureMap.")
 
+        # Ursulas keep the map for as long as Alice vouches that the policy lasts.
+        expiration, expiration_signature = None, None
+        if self.expiration is not None:
+            expiration, expiration_signature = self.treasure_map.sign_expiration(self.alice.stamp, self.expiration)
+
         responses = dict()
         self.log.debug(f"Pushing {self.treasure_map} to all known nodes from {self.alice}")
         for node in self.alice.known_nodes:
@@ -274,7 +285,9 @@ class Policy(ABC):
                 # TODO: Certificate filepath needs to be looked up and passed here
                 response = network_middleware.put_treasure_map_on_node(node=node,
                                                                        map_id=treasure_map_id,
-                                                                       map_payload=bytes(self.treasure_map))
+                                                                       map_payload=bytes(self.treasure_map),
+                                                                       expiration=expiration,
+                                                                       expiration_signature=expiration_signature)
             except NodeSeemsToBeDown:
                 # TODO: Introduce good failure mode here if too few nodes receive the map.
                 self.log.debug(f"Failed pushing {self.treasure_map} to unresponsive {node}")
@@ -334,48 +347,129 @@ class Policy(ABC):
         Assign kfrags to ursulas_on_network, and distribute them via REST,
         populating enacted_arrangements
         """
-        for arrangement in self.__assign_kfrags():
-            arrangement_message_kit = arrangement.encrypt_payload_for_ursula()
-
-            try:
-                response = network_middleware.enact_policy(arrangement.ursula,
-                                                           arrangement.id,
-                                                           arrangement_message_kit.to_bytes())
-            except network_middleware.UnexpectedResponse as e:
-                arrangement.status = e.status
-            else:
-                arrangement.status = response.status_code
+        unsent_arrangements = deque(self.__assign_kfrags())
+        enactments = dict()  # future -> (arrangement, deadline)
+        abandoned = set()  # Timed-out requests, still holding a worker
+        executor = ThreadPoolExecutor(max_workers=self.MAX_CONCURRENT_REQUESTS)
+        try:
+            while unsent_arrangements or enactments:
+                while unsent_arrangements and self._free_workers(enactments, abandoned) > 0:
+                    arrangement = unsent_arrangements.popleft()
+                    future = executor.submit(self._enact_arrangement,
+                                             network_middleware=network_middleware,
+                                             arrangement=arrangement)
+                    enactments[future] = (arrangement, time.monotonic() + self.NODE_TIMEOUT)
+
+                if not enactments:
+                    if self._wait_for_abandoned_requests(abandoned):
+                        continue
+                    self.log.debug(f"Gave up enacting {len(unsent_arrangements)} arrangements")
+                    break
+
+                for future, arrangement in self._wait_for_requests(enactments, abandoned):
+                    try:
+                        arrangement.status = future.result()
+                    except NodeSeemsToBeDown:
+                        self.log.debug(f"Failed to enact arrangement with unreachable {arrangement.ursula}")
+                        continue
+
+                    # Only Ursulas which took their KFrag go into the TreasureMap.
+                    if arrangement.status == 200:
+                        self.treasure_map.add_arrangement(arrangement)
+                    else:
+                        self.log.debug(f"Arrangement with {arrangement.ursula} was not enacted ({arrangement.status})")
+        finally:
+            for future in enactments:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+        # OK, let's check: if two or more Ursulas claimed we didn't pay,
+        # we need to re-evaulate our situation here.
+        arrangement_statuses = [a.status for a in self._accepted_arrangements]
+        number_of_claims_of_freeloading = sum(status==402 for status in arrangement_statuses)
+
+        if number_of_claims_of_freeloading > 2:
+            raise self.alice.NotEnoughNodes  # TODO: Clean this up and enable re-tries.
+
+        self.treasure_map.check_for_sufficient_destinations()
+
+        # TODO: Leave a note to try any failures later.
+        pass
 
-            # Assuming response is what we hope for.
-            self.treasure_map.add_arrangement(arrangement)
+        # ...After *all* the arrangements are enacted
+        # Create Alice's revocation kit
+        self.revocation_kit = RevocationKit(self, self.alice.stamp)
+        self.alice.add_active_policy(self)
 
-        else:
-            # OK, let's check: if two or more Ursulas claimed we didn't pay,
-            # we need to re-evaulate our situation here.
-            arrangement_statuses = [a.status for a in self._accepted_arrangements]
-            number_of_claims_of_freeloading = sum(status==402 for status in arrangement_statuses)
+        if publish is True:
+            return self.publish_treasure_map(network_middleware=network_middleware)
 
-            if number_of_claims_of_freeloading > 2:
-                raise self.alice.NotEnoughNodes  # TODO: Clean this up and enable re-tries.
+    def _free_workers(self, requests: Dict[Future, Tuple['Arrangement', float]], abandoned: Set[Future]) -> int:
+        """
+        How many more requests can start right away, out of MAX_CONCURRENT_REQUESTS;
+        abandoned requests hold on to their worker until they return.
+        """
+        abandoned.difference_update([future for future in abandoned if future.done()])
+        return self.MAX_CONCURRENT_REQUESTS - len(requests) - len(abandoned)
 
-            self.treasure_map.check_for_sufficient_destinations()
+    def _wait_for_requests(self,
+                           requests: Dict[Future, Tuple['Arrangement', float]],
+                           abandoned: Set[Future]
+                           ) -> List[Tuple[Future, 'Arrangement']]:
+        """
+        Waits for the first of the requests to complete (or to run out of time), removing those that did from
+        `requests` and returning the completed ones.  Requests that ran out of time are moved to `abandoned`.
+        """
+        next_deadline = min(deadline for _arrangement, deadline in requests.values())
+        done, _not_done = wait(requests, timeout=max(next_deadline - time.monotonic(), 0), return_when=FIRST_COMPLETED)
+        completed = [(future, requests.pop(future)[0]) for future in done]
+
+        now = time.monotonic()
+        for future, (arrangement, deadline) in list(requests.items()):
+            if deadline <= now:
+                if not future.cancel():
+                    abandoned.add(future)
+                del requests[future]
+                self.log.debug(f"Request to {arrangement.ursula} timed out")
+        return completed
+
+    def _wait_for_abandoned_requests(self, abandoned: Set[Future]) -> bool:
+        """
+        Waits up to NODE_TIMEOUT seconds for an abandoned request to return and free its worker,
+        returning whether one did.
+        """
+        done, _not_done = wait(abandoned, timeout=self.NODE_TIMEOUT, return_when=FIRST_COMPLETED)
+        if not done:
+            self.log.warn(f"All {self.MAX_CONCURRENT_REQUESTS} request workers are held by "
+                          f"Ursulas which stopped answering")
+        return bool(done)
 
-            # TODO: Leave a note to try any failures later.
-            pass
+    @staticmethod
+    def _enact_arrangement(network_middleware, arrangement) -> int:
+        """Send the KFrag of an accepted arrangement to its Ursula, returning the response status code."""
+        arrangement_message_kit = arrangement.encrypt_payload_for_ursula()
+        try:
+            response = network_middleware.enact_policy(arrangement.ursula,
+                                                       arrangement.id,
+                                                       arrangement_message_kit.to_bytes())
+        except network_middleware.UnexpectedResponse as e:
+            return e.status
+        return response.status_code
 
-            # ...After *all* the arrangements are enacted
-            # Create Alice's revocation kit
-            self.revocation_kit = RevocationKit(self, self.alice.stamp)
-            self.alice.add_active_policy(self)
+    @staticmethod
+    def _negotiate_arrangement(network_middleware, arrangement) -> bool:
+        """Offer an arrangement to its Ursula, returning whether it was accepted."""
+        try:
+            negotiation_response = network_middleware.consider_arrangement(arrangement=arrangement)
+        except network_middleware.UnexpectedResponse:
+            return False
 
-            if publish is True:
-                return self.publish_treasure_map(network_middleware=network_middleware)
+        # TODO: check out the response: need to assess the result and see if we're actually good to go.
+        return negotiation_response.status_code == 200
 
     def consider_arrangement(self, network_middleware, ursula, arrangement) -> bool:
-        negotiation_response = network_middleware.consider_arrangement(arrangement=arrangement)
-
-        # TODO: check out the response: need to assess the result and see if we're actually good to go.
-        arrangement_is_accepted = negotiation_response.status_code == 200
+        arrangement_is_accepted = self._negotiate_arrangement(network_middleware=network_middleware,
+                                                              arrangement=arrangement)
 
         bucket = self._accepted_arrangements if arrangement_is_accepted else self._rejected_arrangements
         bucket.add(arrangement)
@@ -397,7 +491,6 @@ class Policy(ABC):
                  know which nodes to use.  Either pass them here or when you make ' \
                  the Policy.".format(self.n))
 
-        # TODO: One of these layers needs to add concurrency.
         self._consider_arrangements(network_middleware=network_middleware,
                                     candidate_ursulas=sampled_ursulas,
                                     *args, **kwargs)
@@ -432,36 +525,62 @@ class Policy(ABC):
                                consider_everyone: bool = False,
                                *args,
                                **kwargs) -> None:
-
-        for index, selected_ursula in enumerate(candidate_ursulas):
-            arrangement = self.make_arrangement(ursula=selected_ursula, *args, **kwargs)
-            try:
-                is_accepted = self.consider_arrangement(ursula=selected_ursula,
-                                                        arrangement=arrangement,
-                                                        network_middleware=network_middleware)
-
-            except NodeSeemsToBeDown as e:  # TODO: #355 Also catch InvalidNode here?
-                # This arrangement won't be added to the accepted bucket.
-                # If too many nodes are down, it will fail in make_arrangements.
-                # Also TODO: Prolly log this or something at this stage.
-                continue
-
-            else:
-                # Bucket the arrangements
-                if is_accepted:
-                    self.log.debug(f"Arrangement accepted by {selected_ursula}")
-                    self._accepted_arrangements.add(arrangement)
-                    accepted = len(self._accepted_arrangements)
-                    if accepted == self.n and not consider_everyone:
-                        try:
-                            spares = set(list(candidate_ursulas)[index+1::])
-                            self._spare_candidates.update(spares)
-                        except IndexError:
-                            self._spare_candidates = set()
-                        break
-                else:
-                    self.log.debug(f"Arrangement failed with {selected_ursula}")
-                    self._rejected_arrangements.add(arrangement)
+        """
+        Offer arrangements to the candidate Ursulas concurrently, keeping just enough negotiations
+        in flight to reach n acceptances.  Ursulas that reject, are down, or don't answer within
+        NODE_TIMEOUT seconds are replaced by the next candidate; untried candidates are kept as spares.
+        At most MAX_CONCURRENT_REQUESTS requests run at once, counting those abandoned but not yet returned.
+        """
+        candidates = deque(candidate_ursulas)
+        negotiations = dict()  # future -> (arrangement, deadline)
+        abandoned = set()  # Timed-out requests, still holding a worker
+        executor = ThreadPoolExecutor(max_workers=self.MAX_CONCURRENT_REQUESTS)
+        try:
+            while candidates or negotiations:
+                outstanding = self.n - len(self._accepted_arrangements)
+                if outstanding <= 0 and not consider_everyone:
+                    break
+
+                # Top up the in-flight negotiations;  those that timed out are abandoned, and no longer count.
+                in_flight_limit = self.MAX_CONCURRENT_REQUESTS
+                if not consider_everyone:
+                    in_flight_limit = min(in_flight_limit, outstanding)
+                while (candidates and len(negotiations) < in_flight_limit
+                       and self._free_workers(negotiations, abandoned) > 0):
+                    selected_ursula = candidates.popleft()
+                    arrangement = self.make_arrangement(ursula=selected_ursula, *args, **kwargs)
+                    future = executor.submit(self._negotiate_arrangement,
+                                             network_middleware=network_middleware,
+                                             arrangement=arrangement)
+                    negotiations[future] = (arrangement, time.monotonic() + self.NODE_TIMEOUT)
+
+                if not negotiations:
+                    if self._wait_for_abandoned_requests(abandoned):
+                        continue
+                    break
+
+                for future, arrangement in self._wait_for_requests(negotiations, abandoned):
+                    try:
+                        is_accepted = future.result()
+                    except NodeSeemsToBeDown:  # TODO: #355 Also catch InvalidNode here?
+                        # This arrangement won't be added to the accepted bucket.
+                        # If too many nodes are down, it will fail in make_arrangements.
+                        self.log.debug(f"Arrangement failed with unreachable {arrangement.ursula}")
+                        continue
+
+                    # Bucket the arrangements
+                    if is_accepted:
+                        self.log.debug(f"Arrangement accepted by {arrangement.ursula}")
+                        self._accepted_arrangements.add(arrangement)
+                    else:
+                        self.log.debug(f"Arrangement failed with {arrangement.ursula}")
+                        self._rejected_arrangements.add(arrangement)
+        finally:
+            for future in negotiations:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+        self._spare_candidates.update(candidates)
 
 
 class FederatedPolicy(Policy):
@@ -28,6 +28,7 @@ from nucypher.blockchain.eth.actors import NucypherTokenActor
 from nucypher.blockchain.eth.agents import ContractAgency, PolicyManagerAgent, StakingEscrowAgent, WorkLockAgent
 from nucypher.blockchain.eth.interfaces import BlockchainInterfaceFactory
 from nucypher.blockchain.eth.registry import BaseContractRegistry
+from nucypher.blockchain.eth.token import StakeRecord
 
 from prometheus_client.metrics import MetricWrapperBase
 from prometheus_client.registry import CollectorRegistry
@@ -103,6 +104,15 @@ class UrsulaInfoMetricsCollector(BaseMetricsCollector):
             "policies_held_gauge": Gauge(f'{metrics_prefix}_policies_held',
                                          'Policies held',
                                          registry=registry),
+            "commitment_latency_gauge": Gauge(f'{metrics_prefix}_commitment_latency_seconds',
+                                              'Seconds from the start of the period to the latest commitment',
+                                              registry=registry),
+            "arrangement_cache_hits_gauge": Gauge(f'{metrics_prefix}_arrangement_cache_hits',
+                                                  'Re-encryptions served from cached arrangements',
+                                                  registry=registry),
+            "arrangement_cache_misses_gauge": Gauge(f'{metrics_prefix}_arrangement_cache_misses',
+                                                    'Re-encryptions that had to load their arrangement',
+                                                    registry=registry),
         }
 
     def _collect_internal(self) -> None:
@@ -118,6 +128,8 @@ class UrsulaInfoMetricsCollector(BaseMetricsCollector):
         self.metrics["learning_status"].state('running' if self.ursula._learning_task.running else 'stopped')
         self.metrics["known_nodes_gauge"].set(len(self.ursula.known_nodes))
         self.metrics["work_orders_gauge"].set(len(self.ursula.work_orders()))
+        self.metrics["arrangement_cache_hits_gauge"].set(self.ursula.datastore.arrangement_cache.hits)
+        self.metrics["arrangement_cache_misses_gauge"].set(self.ursula.datastore.arrangement_cache.misses)
 
         if not self.ursula.federated_only:
             staking_agent = ContractAgency.get_agent(StakingEscrowAgent, registry=self.ursula.registry)
@@ -132,6 +144,10 @@ class UrsulaInfoMetricsCollector(BaseMetricsCollector):
             # TODO should this be here?
             self.metrics["policies_held_gauge"].set(len(self.ursula.datastore.get_all_policy_arrangements()))
 
+            commitment_latency = self.ursula.work_tracker.last_commitment_latency
+            if commitment_latency is not None:
+                self.metrics["commitment_latency_gauge"].set(commitment_latency)
+
         self.metrics["host_info"].info(base_payload)
 
 
@@ -166,6 +182,9 @@ class StakerMetricsCollector(BaseMetricsCollector):
             "eth_balance_gauge": Gauge(f'{metrics_prefix}_staker_eth_balance', 'Ethereum balance', registry=registry),
             "token_balance_gauge": Gauge(f'{metrics_prefix}_staker_token_balance', 'NuNit balance', registry=registry),
             "substakes_count_gauge": Gauge(f'{metrics_prefix}_substakes_count', 'Substakes count', registry=registry),
+            "active_substakes_count_gauge": Gauge(f'{metrics_prefix}_active_substakes_count',
+                                                  'Count of substakes which are not expired',
+                                                  registry=registry),
             "active_stake_gauge": Gauge(f'{metrics_prefix}_active_stake', 'Active stake', registry=registry),
             "unlocked_tokens_gauge": Gauge(f'{metrics_prefix}_unlocked_tokens',
                                            'Amount of unlocked tokens',
@@ -183,7 +202,8 @@ class StakerMetricsCollector(BaseMetricsCollector):
         staking_agent = ContractAgency.get_agent(StakingEscrowAgent, registry=self.contract_registry)
 
         # current period
-        self.metrics["current_period_gauge"].set(staking_agent.get_current_period())
+        current_period = staking_agent.get_current_period()
+        self.metrics["current_period_gauge"].set(current_period)
 
         # balances
         nucypher_token_actor = NucypherTokenActor(self.contract_registry, checksum_address=self.staker_address)
@@ -191,8 +211,11 @@ class StakerMetricsCollector(BaseMetricsCollector):
         self.metrics["token_balance_gauge"].set(int(nucypher_token_actor.token_balance))
 
         # stake information
-        self.metrics["substakes_count_gauge"].set(
-            staking_agent.contract.functions.getSubStakesLength(self.staker_address).call())
+        substakes = StakeRecord.read_all(staking_agent=staking_agent,
+                                         staker_addresses=[self.staker_address])[self.staker_address]
+        self.metrics["substakes_count_gauge"].set(len(substakes))
+        self.metrics["active_substakes_count_gauge"].set(sum(1 for substake in substakes
+                                                             if substake.is_active(current_period)))
 
         locked = staking_agent.get_locked_tokens(staker_address=self.staker_address, periods=1)
         self.metrics["active_stake_gauge"].set(locked)
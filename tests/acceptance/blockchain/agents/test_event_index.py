@@ -0,0 +1,95 @@
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import os
+import sqlite3
+
+from nucypher.blockchain.eth.events import ContractEvents, EventIndex, EventRecord
+
+
+def test_event_index(testerchain, agency, tmpdir, monkeypatch):
+    token_agent, _staking_agent, _policy_agent = agency
+    transfer_event = token_agent.contract.events.Transfer
+
+    calls_to_get_logs = list()
+    get_logs = transfer_event.getLogs
+
+    def counting_get_logs(*args, **kwargs):
+        calls_to_get_logs.append(kwargs)
+        return get_logs(*args, **kwargs)
+
+    monkeypatch.setattr(transfer_event, 'getLogs', counting_get_logs)
+
+    def summary(records):
+        return [(r.block_number, r.transaction_hash, r.args) for r in records]
+
+    expected_events = summary(ContractEvents(token_agent.contract)['Transfer']())
+    assert expected_events
+
+    filepath = os.path.join(tmpdir, 'events.sqlite')
+    event_index = EventIndex(filepath=filepath, chunk_size=3, finality_depth=2)
+    EventRecord.block_headers.clear()
+    assert summary(event_index.events(transfer_event)) == expected_events
+
+    # The timestamps of indexed blocks come from the shared (batched) block header cache.
+    final_block = testerchain.w3.eth.blockNumber - event_index.finality_depth
+    indexed_blocks = {number for number, _transaction_hash, _args in expected_events if number <= final_block}
+    assert all(testerchain.w3.eth.getBlock(number)['hash'] in EventRecord.block_headers for number in indexed_blocks)
+
+    # Only the blocks that are not final yet are read from the chain again.
+    calls_to_get_logs.clear()
+    indexed_events = list(event_index.events(transfer_event))
+    assert summary(indexed_events) == expected_events
+    assert len(calls_to_get_logs) == 1
+    final_block = testerchain.w3.eth.blockNumber - event_index.finality_depth
+    assert calls_to_get_logs[0]['fromBlock'] == final_block + 1
+    for record in indexed_events:
+        if record.block_number <= final_block:
+            assert record.timestamp == testerchain.w3.eth.getBlock(record.block_number)['timestamp']
+
+    # Argument filters are applied to indexed events too.
+    recipient = expected_events[-1][2]['to']
+    filtered_events = summary(event_index.events(transfer_event, argument_filters={'to': recipient}))
+    assert filtered_events == [event for event in expected_events if event[2]['to'] == recipient]
+
+    # The index survives a restart.
+    event_index.close()
+    calls_to_get_logs.clear()
+    contract_events = ContractEvents(token_agent.contract, index=EventIndex(filepath=filepath, finality_depth=2))
+    assert summary(contract_events['Transfer']()) == expected_events
+    assert len(calls_to_get_logs) == 1
+
+    # An index of a longer chain than the current one (e.g. before a development chain was reset) is discarded.
+    with sqlite3.connect(filepath) as db:
+        db.execute("UPDATE indexed_ranges SET last_block = last_block + 1000")
+    assert summary(EventIndex(filepath=filepath, finality_depth=2).events(transfer_event)) == expected_events
+
+
+def test_event_timestamps_are_fetched_lazily_and_together(testerchain, agency):
+    token_agent, _staking_agent, _policy_agent = agency
+    EventRecord.block_headers.clear()
+
+    records = list(ContractEvents(token_agent.contract)['Transfer']())
+    assert len({record.block_hash for record in records}) > 1
+    assert len(EventRecord.block_headers) == 0
+
+    # Reading one timestamp fetches the headers of every block these events were emitted in.
+    first_record = records[0]
+    assert first_record.timestamp == testerchain.w3.eth.getBlock(first_record.block_number)['timestamp']
+    assert all(record.block_hash in EventRecord.block_headers for record in records)
+    for record in records:
+        assert record.timestamp == testerchain.w3.eth.getBlock(record.block_hash)['timestamp']
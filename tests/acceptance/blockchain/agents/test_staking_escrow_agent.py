@@ -21,8 +21,10 @@ from eth_tester.exceptions import TransactionFailed
 from eth_utils.address import is_address, to_checksum_address
 
 from nucypher.blockchain.eth.agents import ContractAgency, StakingEscrowAgent
+from nucypher.blockchain.eth.batch import ContractCallBatch
 from nucypher.blockchain.eth.constants import NULL_ADDRESS
 from nucypher.blockchain.eth.registry import BaseContractRegistry
+from nucypher.blockchain.eth.token import StakeRecord
 from nucypher.types import StakerInfo
 from tests.constants import INSECURE_DEVELOPMENT_PASSWORD
 
@@ -101,6 +103,21 @@ def test_get_all_stakes(testerchain, agency, token_economics):
     assert token_economics.maximum_allowed_locked > value > token_economics.minimum_allowed_locked
 
 
+@pytest.mark.slow()
+def test_get_all_stakes_of_many_stakers(testerchain, agency):
+    _token_agent, staking_agent, _policy_agent = agency
+    staker_account = testerchain.unassigned_accounts[0]
+    someone_without_stakes = to_checksum_address(os.urandom(20))
+
+    all_stakes = staking_agent.get_all_stakes_of(staker_addresses=[staker_account, someone_without_stakes])
+    assert all_stakes[staker_account] == list(staking_agent.get_all_stakes(staker_address=staker_account))
+    assert all_stakes[someone_without_stakes] == list()
+
+    records = StakeRecord.read_all(staking_agent=staking_agent, staker_addresses=[staker_account])[staker_account]
+    assert [record.to_stake_info() for record in records] == list(map(tuple, all_stakes[staker_account]))
+    assert records[0].index == 0 and records[0].is_active(staking_agent.get_current_period())
+
+
 @pytest.mark.slow()
 def test_stakers_and_workers_relationships(testerchain, agency):
     _token_agent, staking_agent, _policy_agent = agency
@@ -145,6 +162,44 @@ def test_get_swarm(agency, blockchain_ursulas):
     assert is_address(staker_addr)
 
 
+@pytest.mark.slow()
+def test_batched_staker_reads(agency, blockchain_ursulas):
+    _token_agent, staking_agent, _policy_agent = agency
+
+    stakers = staking_agent.get_stakers()
+    assert stakers == list(staking_agent.swarm())
+    assert stakers == [staking_agent.contract.functions.stakers(i).call() for i in range(len(stakers))]
+
+    active, pending, missing = staking_agent.partition_stakers_by_activity()
+    assert sorted(active + pending + missing) == sorted(stakers)
+
+    # Batched results are decoded from raw eth_call return data exactly as ContractFunction.call() would.
+    staker = stakers[0]
+    functions = (staking_agent.contract.functions.getAllTokens(staker),
+                 staking_agent.contract.functions.getFlags(staker),
+                 staking_agent.contract.functions.getWorkerFromStaker(staker))
+    for function in functions:
+        return_data = staking_agent.blockchain.client.w3.eth.call({'to': function.address,
+                                                                   'data': function._encode_transaction_data()})
+        assert ContractCallBatch._decode(function, return_data.hex()) == function.call()
+
+
+@pytest.mark.slow()
+def test_batched_reads_of_many_stakers(agency, blockchain_ursulas):
+    _token_agent, staking_agent, policy_agent = agency
+    stakers = staking_agent.get_stakers()
+
+    # Each batched read agrees with its single-staker counterpart.
+    assert staking_agent.get_staker_info_of(stakers) == [staking_agent.get_staker_info(s) for s in stakers]
+    assert staking_agent.get_locked_tokens_of(stakers) == [staking_agent.get_locked_tokens(s) for s in stakers]
+    assert staking_agent.get_last_committed_periods(stakers) == [staking_agent.get_last_committed_period(s)
+                                                                 for s in stakers]
+    assert staking_agent.get_flags_of(stakers) == [staking_agent.get_flags(s) for s in stakers]
+    assert staking_agent.are_restaking_locked(stakers) == [staking_agent.is_restaking_locked(s) for s in stakers]
+    assert policy_agent.get_fee_amounts(stakers) == [policy_agent.get_fee_amount(s) for s in stakers]
+    assert policy_agent.get_min_fee_rates(stakers) == [policy_agent.get_min_fee_rate(s) for s in stakers]
+
+
 @pytest.mark.slow()
 @pytest.mark.usefixtures("blockchain_ursulas")
 def test_sample_stakers(agency):
@@ -169,6 +224,14 @@ def test_sample_stakers(agency):
     assert len(set(stakers)) == 3
     staking_agent.blockchain.is_light = light
 
+    # Without replacement, exactly as many distinct stakers as requested are drawn.
+    stakers = staking_agent.sample(quantity=stakers_population, duration=1, replacement=False)
+    assert len(set(stakers)) == stakers_population
+
+    # The stake distribution is read once per period and duration.
+    distribution = staking_agent.get_stake_distribution(duration=5)
+    assert staking_agent.get_stake_distribution(duration=5) is distribution
+
 
 def test_get_current_period(agency, testerchain):
     _token_agent, staking_agent, _policy_agent = agency
@@ -95,6 +95,39 @@ def test_transfer(agent, token_economics, mock_transacting_power_activation):
     assert new_balance == old_balance + token_economics.minimum_allowed_locked
 
 
+def test_transfers_without_waiting_for_receipts(agent, token_economics, mock_transacting_power_activation):
+    testerchain = agent.blockchain
+    origin, *recipients = testerchain.client.accounts[:4]
+
+    mock_transacting_power_activation(account=origin, password=INSECURE_DEVELOPMENT_PASSWORD)
+
+    old_balances = [agent.get_balance(recipient) for recipient in recipients]
+    first_nonce = testerchain.client.w3.eth.getTransactionCount(origin, 'pending')
+    futures = [agent.transfer(amount=token_economics.minimum_allowed_locked,
+                              target_address=recipient,
+                              sender_address=origin,
+                              wait=False)
+               for recipient in recipients]
+
+    receipts = [future.result(timeout=30) for future in futures]
+    assert all(receipt['status'] == 1 for receipt in receipts)
+
+    # Nonces were assigned locally, one after the other.
+    nonces = [testerchain.client.get_transaction(receipt['transactionHash'])['nonce'] for receipt in receipts]
+    assert nonces == list(range(first_nonce, first_nonce + len(recipients)))
+
+    for recipient, old_balance in zip(recipients, old_balances):
+        assert agent.get_balance(recipient) == old_balance + token_economics.minimum_allowed_locked
+
+    # A transaction sent the usual way takes a nonce the pipeline didn't hand out, which it then takes into account.
+    agent.transfer(amount=token_economics.minimum_allowed_locked, target_address=recipients[0], sender_address=origin)
+    receipt = agent.transfer(amount=token_economics.minimum_allowed_locked,
+                             target_address=recipients[0],
+                             sender_address=origin,
+                             wait=False).result(timeout=30)
+    assert receipt['status'] == 1
+
+
 def test_approve_and_call(agent, token_economics, mock_transacting_power_activation, deploy_contract):
     testerchain = agent.blockchain
     deployer, someone, *everybody_else = testerchain.client.accounts
@@ -75,6 +75,12 @@ def test_staking_escrow_has_dispatcher(staking_escrow_deployer, testerchain, tes
     target = staking_escrow_deployer.contract.functions.target().call()
     assert target == existing_bare_contract.address
 
+    # Looking the contract up again is served from the cache.
+    assert testerchain.get_contract_by_name(registry=test_registry,
+                                            contract_name=staking_escrow_deployer.contract_name,
+                                            proxy_name=DispatcherDeployer.contract_name,
+                                            use_proxy_address=False) is existing_bare_contract
+
 
 def test_upgrade(testerchain, test_registry, token_economics):
 
@@ -113,6 +119,9 @@ def test_rollback(testerchain, test_registry):
     assert new_target != current_target
     assert new_target == old_target
 
+    # Contracts resolved through the proxy follow the rollback.
+    assert deployer.get_principal_contract().address == new_target
+
 
 def test_deploy_bare_upgradeable_contract_deployment(testerchain, test_registry, token_economics):
     deployer = StakingEscrowDeployer(registry=test_registry,
@@ -461,6 +461,10 @@ def testerchain(_testerchain) -> TesterBlockchain:
     snapshot = pyevm_backend.chain.get_canonical_block_by_number(0).hash
     pyevm_backend.revert_to_snapshot(snapshot)
 
+    # Contracts are redeployed at the same addresses, so results cached against the old chain are stale.
+    StakingEscrowAgent.active_stakers_cache.invalidate()
+    testerchain.clear_contract_cache()
+
     coinbase, *addresses = testerchain.client.accounts
 
     for address in addresses:
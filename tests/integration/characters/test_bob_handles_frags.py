@@ -18,6 +18,7 @@ along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
 import pytest
 import pytest_twisted
 from twisted.internet import threads
+from types import SimpleNamespace
 from umbral import pre
 from umbral.cfrags import CapsuleFrag
 from umbral.kfrags import KFrag
@@ -677,3 +678,101 @@ def test_bob_retrieves_multiple_messages_in_a_single_adventure(federated_bob,
     assert b"Welcome to flippering number 0." == delivered_cleartexts[0]
     assert b"Welcome to flippering number 0." == delivered_cleartexts[1]
     assert b"Welcome to flippering number 0." == delivered_cleartexts[2]
+
+
+def test_bob_sends_work_orders_to_fastest_ursulas_first(federated_bob,
+                                                        federated_alice,
+                                                        capsule_side_channel,
+                                                        enacted_federated_policy):
+    # By now, Bob has measured how long each Ursula took to answer his WorkOrders.
+    assert federated_bob._ursula_latencies
+
+    treasure_map = enacted_federated_policy.treasure_map
+    node_ids = [node_id for node_id, _arrangement_id in treasure_map]
+    fastest_ursula, *other_ursulas = node_ids
+
+    original_latencies = federated_bob._ursula_latencies
+    federated_bob._ursula_latencies = {node_id: 1.0 for node_id in other_ursulas}
+    federated_bob._ursula_latencies[fastest_ursula] = 0.01
+    try:
+        work_orders, _ = federated_bob.work_orders_for_capsules(
+            capsule_side_channel().capsule,
+            map_id=treasure_map.public_id(),
+            alice_verifying_key=federated_alice.stamp.as_umbral_pubkey(),
+            num_ursulas=1)
+    finally:
+        federated_bob._ursula_latencies = original_latencies
+
+    assert list(work_orders.keys()) == [fastest_ursula]
+
+
+def test_ursula_reencrypts_a_batch_of_work_orders(federated_bob,
+                                                  federated_alice,
+                                                  capsule_side_channel,
+                                                  enacted_federated_policy):
+    map_id = enacted_federated_policy.treasure_map.public_id()
+    alices_verifying_key = federated_alice.stamp.as_umbral_pubkey()
+
+    # Two WorkOrders, each for a different capsule, both for the same Ursula.
+    capsules = [capsule_side_channel().capsule, capsule_side_channel().capsule]
+    work_orders_by_ursula = []
+    for capsule in capsules:
+        capsule.set_correctness_keys(delegating=enacted_federated_policy.public_key,
+                                     receiving=federated_bob.public_keys(DecryptingPower),
+                                     verifying=alices_verifying_key)
+        incomplete_work_orders, _ = federated_bob.work_orders_for_capsules(capsule,
+                                                                          map_id=map_id,
+                                                                          alice_verifying_key=alices_verifying_key)
+        work_orders_by_ursula.append(incomplete_work_orders)
+
+    ursula_address = list(work_orders_by_ursula[0].keys())[0]
+    work_orders = [work_orders[ursula_address] for work_orders in work_orders_by_ursula]
+    ursula = work_orders[0].ursula
+
+    results = federated_bob.network_middleware.reencrypt_batch(ursula=ursula, work_orders=work_orders)
+
+    # One result per WorkOrder, in order, each with a single valid cfrag.
+    assert len(results) == len(work_orders)
+    for work_order, capsule, cfrags_and_signatures in zip(work_orders, capsules, results):
+        assert len(cfrags_and_signatures) == 1
+        cfrags = work_order.complete(cfrags_and_signatures)
+        assert cfrags[0].verify_correctness(capsule)
+
+
+def test_ursula_reencrypts_a_batch_of_work_orders_in_worker_processes(federated_bob,
+                                                                      federated_alice,
+                                                                      capsule_side_channel,
+                                                                      enacted_federated_policy):
+    map_id = enacted_federated_policy.treasure_map.public_id()
+    alices_verifying_key = federated_alice.stamp.as_umbral_pubkey()
+
+    capsule = capsule_side_channel().capsule
+    capsule.set_correctness_keys(delegating=enacted_federated_policy.public_key,
+                                 receiving=federated_bob.public_keys(DecryptingPower),
+                                 verifying=alices_verifying_key)
+    incomplete_work_orders, _ = federated_bob.work_orders_for_capsules(capsule,
+                                                                      map_id=map_id,
+                                                                      alice_verifying_key=alices_verifying_key)
+    work_order = list(incomplete_work_orders.values())[0]
+    ursula = work_order.ursula
+
+    # A WorkOrder which can't be understood is reported on its own, without failing the rest of the batch.
+    garbled_work_order = SimpleNamespace(arrangement_id=work_order.arrangement_id, payload=lambda: b'garbled')
+
+    ursula._reencryption_processes = 2
+    try:
+        results = federated_bob.network_middleware.reencrypt_batch(ursula=ursula,
+                                                                   work_orders=[garbled_work_order, work_order])
+    finally:
+        # Back to re-encrypting in-process, with the worker processes shut down.
+        ursula._reencryption_processes = None
+        pool = ursula._Ursula__reencryption_pool
+        if pool is not None:
+            ursula._Ursula__discard_reencryption_pool(pool)
+        assert ursula._Ursula__reencryption_pool is None
+
+    garbled_result, cfrags_and_signatures = results
+    assert garbled_result == []
+    assert len(cfrags_and_signatures) == 1
+    cfrags = work_order.complete(cfrags_and_signatures)
+    assert cfrags[0].verify_correctness(capsule)
@@ -16,6 +16,7 @@ along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
 """
 
 from nucypher.characters.lawful import Ursula
+from tests.utils.ursula import make_federated_ursulas
 
 
 def test_serialize_ursula(federated_ursulas):
@@ -23,3 +24,22 @@ def test_serialize_ursula(federated_ursulas):
     ursula_as_bytes = bytes(ursula)
     ursula_object = Ursula.from_bytes(ursula_as_bytes)
     assert ursula == ursula_object
+
+
+def test_ursula_serialization_is_reused_until_it_changes(ursula_federated_test_config):
+    ursula = make_federated_ursulas(ursula_config=ursula_federated_test_config,
+                                    quantity=1,
+                                    know_each_other=False).pop()
+    ursula_as_bytes = bytes(ursula)
+    assert bytes(ursula) is ursula_as_bytes
+
+    # Signing the interface anew replaces the signature, so Ursula is serialized again.
+    ursula._sign_and_date_interface_info()
+    resigned_ursula_as_bytes = bytes(ursula)
+    assert resigned_ursula_as_bytes is not ursula_as_bytes
+
+    # A sprout passes along the very bytes it was split from.
+    sprout = Ursula.from_bytes(resigned_ursula_as_bytes)
+    assert sprout == ursula
+    assert bytes(sprout) == resigned_ursula_as_bytes
+    assert bytes(sprout) is bytes(sprout)
@@ -18,11 +18,13 @@ along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
 import datetime
 import maya
 import pytest
+import threading
 from umbral.kfrags import KFrag
 
 from nucypher.characters.lawful import Enrico
 from nucypher.crypto.api import keccak_digest
 from nucypher.policy.collections import Revocation
+from tests.utils.middleware import MockRestMiddleware
 
 
 @pytest.mark.usefixtures('federated_ursulas')
@@ -60,6 +62,78 @@ def test_federated_grant(federated_alice, federated_bob):
         assert kfrag == retrieved_kfrag
 
 
+def test_federated_grant_replaces_rejecting_ursulas(federated_alice, federated_bob, federated_ursulas):
+    m, n = 2, 3
+    policy_end_datetime = maya.now() + datetime.timedelta(days=5)
+    label = b"this_is_a_policy_some_ursulas_do_not_want"
+
+    candidate_ursulas = set(list(federated_ursulas)[:n + 2])
+    rejecting_ursulas = set(list(candidate_ursulas)[:2])
+
+    class RejectingMiddleware(MockRestMiddleware):
+        def consider_arrangement(self, arrangement):
+            if arrangement.ursula in rejecting_ursulas:
+                raise self.UnexpectedResponse("No thanks", status=403)
+            return super().consider_arrangement(arrangement)
+
+    policy = federated_alice.create_policy(federated_bob, label=label, m=m, n=n, expiration=policy_end_datetime)
+    policy.make_arrangements(network_middleware=RejectingMiddleware(), handpicked_ursulas=candidate_ursulas)
+
+    # The rejecting Ursulas were replaced by the remaining candidates.
+    assert policy.accepted_ursulas == candidate_ursulas - rejecting_ursulas
+    assert {a.ursula for a in policy._rejected_arrangements} == rejecting_ursulas
+    assert not policy._spare_candidates
+
+
+def test_federated_grant_abandons_hung_ursulas(federated_alice, federated_bob, federated_ursulas, mocker):
+    m, n = 1, 2
+    policy_end_datetime = maya.now() + datetime.timedelta(days=5)
+    label = b"this_is_a_policy_some_ursulas_are_too_slow_for"
+
+    candidate_ursulas = list(federated_ursulas)[:n + 1]
+    hung_ursula = candidate_ursulas[0]
+    hang_up = threading.Event()
+
+    class HangingMiddleware(MockRestMiddleware):
+        def consider_arrangement(self, arrangement):
+            if arrangement.ursula == hung_ursula:
+                hang_up.wait()
+            return super().consider_arrangement(arrangement)
+
+    policy = federated_alice.create_policy(federated_bob, label=label, m=m, n=n, expiration=policy_end_datetime)
+    mocker.patch.object(policy, 'NODE_TIMEOUT', 0.5)
+    mocker.patch.object(policy, 'MAX_CONCURRENT_REQUESTS', 2)
+    try:
+        # The hung Ursula keeps one of the two workers for good, but holds back none of the others.
+        policy.make_arrangements(network_middleware=HangingMiddleware(), handpicked_ursulas=set(candidate_ursulas))
+    finally:
+        hang_up.set()
+    assert policy.accepted_ursulas == set(candidate_ursulas[1:])
+
+
+def test_federated_treasure_map_lists_only_enacted_arrangements(federated_alice, federated_bob, federated_ursulas):
+    m, n = 2, 3
+    policy_end_datetime = maya.now() + datetime.timedelta(days=5)
+    label = b"this_is_a_policy_one_ursula_fails_to_enact"
+
+    handpicked_ursulas = set(list(federated_ursulas)[:n])
+    failing_ursula = list(handpicked_ursulas)[0]
+
+    class FailingMiddleware(MockRestMiddleware):
+        def enact_policy(self, ursula, kfrag_id, payload):
+            if ursula == failing_ursula:
+                raise self.UnexpectedResponse("Something went wrong", status=500)
+            return super().enact_policy(ursula, kfrag_id, payload)
+
+    middleware = FailingMiddleware()
+    policy = federated_alice.create_policy(federated_bob, label=label, m=m, n=n, expiration=policy_end_datetime)
+    policy.make_arrangements(network_middleware=middleware, handpicked_ursulas=handpicked_ursulas)
+    policy.enact(network_middleware=middleware, publish=False)
+
+    destinations = {ursula_address for ursula_address, _arrangement_id in policy.treasure_map}
+    assert destinations == {u.checksum_address for u in handpicked_ursulas - {failing_ursula}}
+
+
 def test_federated_alice_can_decrypt(federated_alice, federated_bob):
     """
     Test that alice can decrypt data encrypted by an enrico
@@ -71,6 +71,15 @@ def mock_token_agent(mock_testerchain, token_economics, mock_contract_agency):
 @pytest.fixture(scope='function', autouse=True)
 def mock_staking_agent(mock_testerchain, token_economics, mock_contract_agency):
     mock_agent = mock_contract_agency.get_agent(StakingEscrowAgent)
+
+    # Batched reads are answered by the single-staker mocks, so that tests only need to set those up.
+    mock_agent.get_all_stakes_of.side_effect = lambda staker_addresses: {
+        staker: list(mock_agent.get_all_stakes(staker_address=staker)) for staker in staker_addresses}
+    mock_agent.get_workers_from_stakers.side_effect = lambda staker_addresses: [
+        mock_agent.get_worker_from_staker(staker_address=staker) for staker in staker_addresses]
+    mock_agent.owned_tokens_of.side_effect = lambda staker_addresses: [
+        mock_agent.owned_tokens(staker_address=staker) for staker in staker_addresses]
+
     yield mock_agent
     mock_agent.reset()
 
@@ -14,10 +14,21 @@ GNU Affero General Public License for more details.
 You should have received a copy of the GNU Affero General Public License
 along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
 """
+import os
 import pytest
-from datetime import datetime
+import threading
+from datetime import datetime, timedelta
+from sqlalchemy import inspect
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.engine import create_engine
+from umbral import pre
+from umbral.keys import UmbralPrivateKey
+from umbral.signing import Signer
 
 from nucypher.datastore import datastore, keypairs
+from nucypher.datastore.db import Base, create_schema, make_engine
+from nucypher.datastore.db.models import TreasureMapRecord
+from nucypher.datastore.threading import ThreadedSession, session_factory
 
 
 @pytest.mark.usefixtures('testerchain')
@@ -57,6 +68,78 @@ def test_policy_arrangement_sqlite_datastore(test_datastore):
         del_key = test_datastore.get_policy_arrangement(arrangement_id)
 
 
+def test_reencryption_material_is_cached_until_revoked_or_expired(test_datastore, monkeypatch):
+    alice_keypair_sig = keypairs.SigningKeypair(generate_keys_if_needed=True)
+    delegating_privkey = UmbralPrivateKey.gen_key()
+    kfrag, *_other_kfrags = pre.generate_kfrags(delegating_privkey=delegating_privkey,
+                                                signer=Signer(UmbralPrivateKey.gen_key()),
+                                                receiving_pubkey=UmbralPrivateKey.gen_key().get_pubkey(),
+                                                threshold=1,
+                                                N=2)
+    cache = test_datastore.arrangement_cache
+
+    arrangement_id = b'cached'
+    test_datastore.add_policy_arrangement(datetime.utcnow() + timedelta(days=1), arrangement_id, kfrag=bytes(kfrag),
+                                          alice_verifying_key=alice_keypair_sig.pubkey)
+
+    # The first request deserializes the arrangement from the database; the next one is served from memory.
+    hits, misses = cache.hits, cache.misses
+    first_kfrag, first_alice_key = test_datastore.get_reencryption_material(arrangement_id)
+    assert bytes(first_kfrag) == bytes(kfrag)
+    assert first_alice_key == alice_keypair_sig.pubkey
+    assert test_datastore.get_reencryption_material(arrangement_id) == (first_kfrag, first_alice_key)
+    assert (cache.hits - hits, cache.misses - misses) == (1, 1)
+
+    # Revocation drops the cached material.
+    test_datastore.del_policy_arrangement(arrangement_id)
+    assert arrangement_id not in cache
+    with pytest.raises(datastore.NotFound):
+        test_datastore.get_reencryption_material(arrangement_id)
+
+    # A revocation landing between reading an arrangement and caching it wins.
+    racing_id = b'racing'
+    test_datastore.add_policy_arrangement(datetime.utcnow() + timedelta(days=1), racing_id, kfrag=bytes(kfrag),
+                                          alice_verifying_key=alice_keypair_sig.pubkey)
+    read_policy_arrangement = test_datastore.get_policy_arrangement
+
+    def read_then_revoke(arrangement_id, session=None):
+        policy_arrangement = read_policy_arrangement(arrangement_id=arrangement_id, session=session)
+        with ThreadedSession(test_datastore.engine) as revoking_session:
+            test_datastore.del_policy_arrangement(arrangement_id, session=revoking_session)
+        return policy_arrangement
+
+    monkeypatch.setattr(test_datastore, 'get_policy_arrangement', read_then_revoke)
+    test_datastore.get_reencryption_material(racing_id)
+    monkeypatch.undo()
+    assert racing_id not in cache
+    with pytest.raises(datastore.NotFound):
+        test_datastore.get_reencryption_material(racing_id)
+
+    # And so does pruning, once the arrangement expires.
+    expiring_id = b'expiring'
+    expiration = datetime.utcnow() + timedelta(seconds=60)
+    test_datastore.add_policy_arrangement(expiration, expiring_id, kfrag=bytes(kfrag),
+                                          alice_verifying_key=alice_keypair_sig.pubkey)
+    test_datastore.get_reencryption_material(expiring_id)
+    test_datastore.del_expired_policy_arrangements(now=datetime.utcnow())
+    assert expiring_id in cache
+    test_datastore.del_expired_policy_arrangements(now=expiration + timedelta(seconds=1))
+    assert expiring_id not in cache
+
+
+def test_datastore_caches_evict_least_recently_used():
+    cache = datastore.ExpiringLRUCache(max_size=2)
+    expiration = datetime.utcnow()
+    cache.put(b'first', b'1', expiration=expiration)
+    cache.put(b'second', b'2', expiration=expiration)
+    assert cache.get(b'first') == b'1'
+
+    cache.put(b'third', b'3', expiration=expiration)
+    assert len(cache) == 2
+    assert b'second' not in cache
+    assert b'first' in cache and b'third' in cache
+
+
 def test_workorder_sqlite_datastore(test_datastore):
     bob_keypair_sig1 = keypairs.SigningKeypair(generate_keys_if_needed=True)
     bob_keypair_sig2 = keypairs.SigningKeypair(generate_keys_if_needed=True)
@@ -75,3 +158,174 @@ def test_workorder_sqlite_datastore(test_datastore):
     deleted = test_datastore.del_workorders(arrangement_id)
     assert deleted > 0
     assert len(test_datastore.get_workorders(arrangement_id)) == 0
+
+
+def test_workorders_are_journaled_and_saved_in_batches(test_datastore):
+    bob_keypair_sig = keypairs.SigningKeypair(generate_keys_if_needed=True)
+    journal = test_datastore.workorder_journal
+    arrangement_id = b'journaled'
+
+    journal.record(bytes(bob_keypair_sig.pubkey), b'signature0', arrangement_id)
+    journal.record(bytes(bob_keypair_sig.pubkey), b'signature1', arrangement_id)
+    assert len(journal) == 2
+
+    # Reads see journaled WorkOrders, which are saved (with Bob's key) in one go.
+    workorders = test_datastore.get_workorders(arrangement_id)
+    assert len(journal) == 0
+    assert {workorder.bob_signature for workorder in workorders} == {b'signature0', b'signature1'}
+    assert len({workorder.bob_verifying_key_id for workorder in workorders}) == 1
+
+    # A WorkOrder saved twice doesn't take the rest of its batch down with it.
+    journal.record(bytes(bob_keypair_sig.pubkey), b'signature1', arrangement_id)
+    journal.record(bytes(bob_keypair_sig.pubkey), b'signature2', arrangement_id)
+    assert journal.flush() == 1
+    assert len(test_datastore.get_workorders(arrangement_id)) == 3
+
+
+def test_workorder_journal_keeps_records_it_failed_to_save(test_datastore, monkeypatch):
+    bob_keypair_sig = keypairs.SigningKeypair(generate_keys_if_needed=True)
+    journal = test_datastore.workorder_journal
+    arrangement_id = b'unsaved'
+
+    def fail_to_save(records, session=None):
+        raise IntegrityError(statement=None, params=None, orig=Exception("Bob's key was saved concurrently"))
+
+    journal.record(bytes(bob_keypair_sig.pubkey), b'signature0', arrangement_id)
+    journal.record(bytes(bob_keypair_sig.pubkey), b'signature1', arrangement_id)
+    monkeypatch.setattr(test_datastore, 'save_workorders', fail_to_save)
+    with pytest.raises(IntegrityError):
+        journal.flush()
+    assert len(journal) == 2
+
+    # Nothing was lost;  the records are saved on the next attempt.
+    monkeypatch.undo()
+    assert journal.flush() == 2
+    assert len(test_datastore.get_workorders(arrangement_id)) == 2
+
+
+def test_workorder_journal_flushes_in_the_background(tmpdir):
+    engine = create_engine(f"sqlite:///{os.path.join(tmpdir, 'ursula.db')}")
+    Base.metadata.create_all(engine)
+    file_datastore = datastore.Datastore(engine, workorder_flush_interval=0.1)
+    journal = file_datastore.workorder_journal
+    assert journal.background
+
+    bob_keypair_sig = keypairs.SigningKeypair(generate_keys_if_needed=True)
+    journal.record(bytes(bob_keypair_sig.pubkey), b'signature', b'background')
+
+    # Stopping saves whatever the background thread didn't yet.
+    journal.stop()
+    assert len(journal) == 0
+    workorders = datastore.Datastore(engine).get_workorders(b'background')
+    assert [workorder.bob_signature for workorder in workorders] == [b'signature']
+
+
+def test_datastore_engine_uses_write_ahead_logging(tmpdir):
+    engine = make_engine(f"sqlite:///{os.path.join(tmpdir, 'ursula.db')}")
+    with engine.connect() as connection:
+        assert connection.execute("PRAGMA journal_mode").scalar() == 'wal'
+        assert connection.execute("PRAGMA synchronous").scalar() == 1  # NORMAL
+
+    # Sessions are made by a factory built once per engine.
+    assert session_factory(engine) is session_factory(engine)
+    Base.metadata.create_all(engine)
+    with ThreadedSession(engine) as session:
+        assert session.bind is engine
+
+
+def test_expired_arrangements_are_pruned_in_chunks_and_their_workorders_archived(test_datastore, tmpdir):
+    alice_keypair_sig = keypairs.SigningKeypair(generate_keys_if_needed=True)
+    bob_keypair_sig = keypairs.SigningKeypair(generate_keys_if_needed=True)
+    now = datetime.utcnow()
+
+    arrangement_ids = [os.urandom(16) for _ in range(5)]
+    for index, arrangement_id in enumerate(arrangement_ids):
+        expiration = now - timedelta(days=1) if index < 3 else now + timedelta(days=1)
+        test_datastore.add_policy_arrangement(expiration, arrangement_id.hex().encode(),
+                                              alice_verifying_key=alice_keypair_sig.pubkey)
+        test_datastore.save_workorder(bob_keypair_sig.pubkey, f'signature{index}'.encode(), arrangement_id)
+
+    archive = datastore.WorkOrderArchive(str(tmpdir))
+    pruned = test_datastore.del_expired_policy_arrangements(now=now, workorder_archive=archive, chunk_size=2)
+    assert pruned == 3
+    assert len(test_datastore.get_all_policy_arrangements()) == 2
+
+    # The WorkOrders of expired arrangements moved to the (compressed) archive.
+    archived_signatures = {bytes.fromhex(record['bob_signature']) for record in archive.read()}
+    assert archived_signatures == {b'signature0', b'signature1', b'signature2'}
+    assert {workorder.bob_signature for workorder in test_datastore.get_workorders()} == {b'signature3', b'signature4'}
+
+
+def test_arrangements_are_kept_when_their_workorders_fail_to_be_archived(test_datastore, monkeypatch):
+    alice_keypair_sig = keypairs.SigningKeypair(generate_keys_if_needed=True)
+    bob_keypair_sig = keypairs.SigningKeypair(generate_keys_if_needed=True)
+    now = datetime.utcnow()
+
+    arrangement_id = os.urandom(16)
+    test_datastore.add_policy_arrangement(now - timedelta(days=1), arrangement_id.hex().encode(),
+                                          alice_verifying_key=alice_keypair_sig.pubkey)
+    test_datastore.save_workorder(bob_keypair_sig.pubkey, b'signature', arrangement_id)
+
+    class FullDiskArchive:
+        def write(self, records, now):
+            raise OSError(28, 'No space left on device')
+
+    with pytest.raises(OSError):
+        test_datastore.del_expired_policy_arrangements(now=now, workorder_archive=FullDiskArchive())
+    assert test_datastore.get_policy_arrangement(arrangement_id.hex().encode())
+    assert len(test_datastore.get_workorders(arrangement_id)) == 1
+
+    # The next round of pruning goes ahead as usual.
+    assert test_datastore.del_expired_policy_arrangements(now=now) == 1
+
+
+def test_schema_creation_adds_missing_indexes():
+    engine = create_engine('sqlite://')
+    engine.execute("CREATE TABLE workorders (id INTEGER PRIMARY KEY, bob_verifying_key_id INTEGER, "
+                   "bob_signature BLOB UNIQUE, arrangement_id BLOB, created_at DATETIME)")
+    create_schema(engine)
+    indexes = {index['name'] for index in inspect(engine).get_indexes('workorders')}
+    assert {'ix_workorders_arrangement_id', 'ix_workorders_bob_verifying_key_id'} <= indexes
+
+
+def test_treasure_maps_outlive_the_datastore_in_memory(tmpdir):
+    engine = make_engine(f"sqlite:///{os.path.join(tmpdir, 'ursula.db')}")
+    create_schema(engine)
+    expiration = datetime.now() + timedelta(days=1)
+    datastore.Datastore(engine).add_treasure_map(b'map', b'serialized treasure map', expiration=expiration)
+
+    # As if Ursula restarted.
+    restarted_datastore = datastore.Datastore(engine)
+    assert restarted_datastore.get_treasure_map(b'map') == b'serialized treasure map'
+    assert restarted_datastore.treasure_map_cache.misses == 1
+    assert restarted_datastore.get_treasure_map(b'map') == b'serialized treasure map'
+    assert restarted_datastore.treasure_map_cache.hits == 1
+
+    assert restarted_datastore.del_expired_treasure_maps(now=expiration) == 1
+    with pytest.raises(datastore.NotFound):
+        restarted_datastore.get_treasure_map(b'map')
+
+
+def test_in_memory_datastore_threads_keep_out_of_each_others_transactions():
+    engine = make_engine('sqlite://')
+    create_schema(engine)
+    writer = session_factory(engine)()
+    writer.add(TreasureMapRecord(id=b'map', treasure_map=b'serialized treasure map',
+                                  expiration=datetime.now() + timedelta(days=1)))
+    writer.flush()  # Written, but not yet committed
+
+    def read_and_roll_back():
+        with ThreadedSession(engine) as session:
+            session.query(TreasureMapRecord).count()
+            session.rollback()
+
+    # Threads share the one connection, but the reader's rollback waits for the writer to commit...
+    reader = threading.Thread(target=read_and_roll_back)
+    reader.start()
+    reader.join(timeout=0.5)
+    assert reader.is_alive()
+    writer.commit()
+    reader.join()
+
+    # ...so it doesn't discard the writer's work.
+    assert datastore.Datastore(engine).get_treasure_map(b'map') == b'serialized treasure map'
@@ -15,11 +15,14 @@
  along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
 """
 
+import gzip
 from constant_sorrow.constants import FLEET_STATES_MATCH, NO_KNOWN_NODES
 from functools import partial
 from hendrix.experience import crosstown_traffic
 from hendrix.utils.test_utils import crosstownTaskListDecoratorFactory
 
+from nucypher.crypto.api import keccak_digest
+from nucypher.crypto.signing import signature_splitter
 from tests.utils.ursula import make_federated_ursulas
 
 
@@ -124,3 +127,159 @@ def test_state_is_recorded_after_learning(federated_ursulas, ursula_federated_te
 
     assert len(states[0].nodes) == 2  # This and one other.
     assert len(states[1].nodes) == len(federated_ursulas) + 1  # Again, accounting for this Learner.
+
+
+def test_incremental_checksum_matches_full_serialization(federated_ursulas, ursula_federated_test_config):
+    lonely_ursula_maker = partial(make_federated_ursulas,
+                                  ursula_config=ursula_federated_test_config,
+                                  quantity=1,
+                                  know_each_other=False)
+    lonely_learner = lonely_ursula_maker().pop()
+
+    for ursula in list(federated_ursulas)[:3]:
+        lonely_learner.remember_node(ursula)
+
+        # The checksum is still the digest of every tracked node, sorted by address and serialized anew.
+        all_nodes = sorted(list(lonely_learner.known_nodes) + [lonely_learner], key=lambda n: n.checksum_address)
+        expected_checksum = keccak_digest(b"".join(bytes(n) for n in all_nodes)).hex()
+        assert lonely_learner.known_nodes.checksum == expected_checksum
+        assert lonely_learner.known_nodes.sorted() == all_nodes
+
+
+def test_teacher_sends_only_nodes_updated_since_a_known_fleet_state(federated_ursulas, ursula_federated_test_config):
+    lonely_ursula_maker = partial(make_federated_ursulas,
+                                  ursula_config=ursula_federated_test_config,
+                                  quantity=1,
+                                  know_each_other=False)
+    lonely_teacher = lonely_ursula_maker().pop()
+    fleet = sorted(federated_ursulas, key=lambda n: n.checksum_address)
+
+    lonely_teacher.remember_node(fleet[0])
+    lonely_teacher.remember_node(fleet[1])
+    checksum_seen_by_learner = lonely_teacher.known_nodes.checksum
+
+    lonely_teacher.remember_node(fleet[2])
+    assert lonely_teacher.known_nodes.nodes_updated_since(checksum_seen_by_learner) == [fleet[2]]
+
+    # The delta carries the same snapshot, but only the new node (and the teacher itself).
+    delta_payload = lonely_teacher.bytestring_of_known_nodes(since=checksum_seen_by_learner)
+    full_payload = lonely_teacher.bytestring_of_known_nodes()
+    assert delta_payload[:36] == full_payload[:36] == lonely_teacher.known_nodes.snapshot()
+
+    sprouts = lonely_teacher.node_class.batch_from_bytes(delta_payload[36:])
+    assert {s.checksum_address for s in sprouts} == {fleet[2].checksum_address, lonely_teacher.checksum_address}
+
+    # A fleet state which the teacher never recorded gets the full snapshot.
+    assert lonely_teacher.known_nodes.nodes_updated_since(fleet[3].known_nodes.checksum) is None
+    assert lonely_teacher.bytestring_of_known_nodes(since=fleet[3].known_nodes.checksum) == full_payload
+
+
+def test_learner_asks_for_a_delta_only_after_learning_every_node_taught(federated_ursulas,
+                                                                        ursula_federated_test_config):
+    lonely_ursula_maker = partial(make_federated_ursulas,
+                                  ursula_config=ursula_federated_test_config,
+                                  quantity=1,
+                                  know_each_other=False)
+    lonely_learner = lonely_ursula_maker().pop()
+    teacher = list(federated_ursulas)[0]
+    lonely_learner.remember_node(teacher)
+    teacher = lonely_learner.known_nodes[teacher.checksum_address]
+
+    lonely_learner._current_teacher_node = teacher
+    sprouts = lonely_learner.learn_from_teacher_node()
+    assert sprouts
+    assert teacher.last_learned_fleet_state == teacher.fleet_state_checksum
+
+    # Should a taught node fail to be remembered, the next exchange with that teacher is a full one.
+    stranger = lonely_ursula_maker().pop()
+    lonely_learner._finish_learning_from_teacher(teacher, sprouts + [stranger])
+    assert teacher.last_learned_fleet_state is None
+
+
+def test_signed_node_metadata_is_cached_per_fleet_state(federated_ursulas, ursula_federated_test_config):
+    lonely_ursula_maker = partial(make_federated_ursulas,
+                                  ursula_config=ursula_federated_test_config,
+                                  quantity=1,
+                                  know_each_other=False)
+    lonely_teacher = lonely_ursula_maker().pop()
+    fleet = list(federated_ursulas)
+    lonely_teacher.remember_node(fleet[0])
+
+    with lonely_teacher.rest_app.test_client() as client:
+        first_response = client.get('/node_metadata')
+        # Signatures are randomized, so identical bytes mean that the same signed payload was served again.
+        assert client.get('/node_metadata').data == first_response.data
+
+        gzipped_response = client.get('/node_metadata', headers={'Accept-Encoding': 'gzip'})
+        assert gzipped_response.headers['Content-Encoding'] == 'gzip'
+        assert gzip.decompress(gzipped_response.data) == first_response.data
+
+        # A new fleet state invalidates the cached payload.
+        lonely_teacher.remember_node(fleet[1])
+        response_after_learning = client.get('/node_metadata')
+        assert response_after_learning.data != first_response.data
+
+        signature, payload = signature_splitter(response_after_learning.data, return_remainder=True)
+        assert payload == lonely_teacher.bytestring_of_known_nodes()
+        assert signature.verify(payload, lonely_teacher.stamp.as_umbral_pubkey())
+
+
+def test_learning_from_several_teachers_in_one_round(federated_ursulas, ursula_federated_test_config):
+    lonely_ursula_maker = partial(make_federated_ursulas,
+                                  ursula_config=ursula_federated_test_config,
+                                  quantity=1,
+                                  know_each_other=False)
+    lonely_learner = lonely_ursula_maker().pop()
+    fleet = list(federated_ursulas)
+    for teacher in fleet[:3]:
+        lonely_learner.remember_node(teacher)
+    lonely_learner.teachers_per_round = 3
+
+    sprouts = lonely_learner.learn_from_teachers()
+
+    # All three teachers know the whole fleet, yet each node was taught only once.
+    taught_addresses = [sprout.checksum_address for sprout in sprouts]
+    assert len(taught_addresses) == len(set(taught_addresses))
+    assert {ursula.checksum_address for ursula in fleet}.issubset(lonely_learner.known_nodes.addresses())
+    assert lonely_learner.current_teacher_node().checksum_address in {teacher.checksum_address for teacher in fleet[:3]}
+
+    # Seed nodes which didn't respond are tried again, one retry at a time.
+    retried_seed_nodes = list()
+    lonely_learner._seed_from = retried_seed_nodes.append
+    lonely_learner.learn_on_same_thread = True
+    lonely_learner.unresponsive_seed_nodes.add('unresponsive seed node metadata')
+    lonely_learner.learn_from_teachers()
+    assert retried_seed_nodes == [('unresponsive seed node metadata',)]
+    lonely_learner.unresponsive_seed_nodes.clear()
+
+    # A teacher that let us down is skipped until its backoff has elapsed.
+    unreliable_teacher = fleet[0]
+    lonely_learner._back_off_from_teacher(unreliable_teacher)
+    lonely_learner.teacher_nodes.clear()
+    lonely_learner.teachers_per_round = len(lonely_learner.known_nodes)
+    teachers = lonely_learner._select_teachers_for_round()
+    assert unreliable_teacher.checksum_address not in {teacher.checksum_address for teacher in teachers}
+    assert len(teachers) == len(lonely_learner.known_nodes) - 1
+
+
+def test_eager_learning_verifies_and_announces_taught_nodes(federated_ursulas, ursula_federated_test_config):
+    lonely_ursula_maker = partial(make_federated_ursulas,
+                                  ursula_config=ursula_federated_test_config,
+                                  quantity=1,
+                                  know_each_other=False)
+    lonely_learner = lonely_ursula_maker().pop()
+    teacher = list(federated_ursulas)[0]
+    lonely_learner.remember_node(teacher)
+
+    # Ask to be told about a couple of nodes, as Bob does when following a TreasureMap.
+    awaited_addresses = {ursula.checksum_address for ursula in list(federated_ursulas)[1:3]}
+    listener = set()
+    lonely_learner._push_certain_newly_discovered_nodes_here(listener, awaited_addresses)
+
+    lonely_learner._current_teacher_node = teacher
+    sprouts = lonely_learner.learn_from_teacher_node(eager=True)
+    assert sprouts
+
+    assert listener == awaited_addresses
+    for address in awaited_addresses:
+        assert lonely_learner.known_nodes[address].verified_node
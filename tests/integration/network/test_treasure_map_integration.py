@@ -15,6 +15,7 @@
  along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
 """
 
+import datetime
 import pytest
 
 from nucypher.characters.lawful import Ursula
@@ -119,3 +120,36 @@ def test_alice_does_not_update_with_old_ursula_info(federated_alice, federated_u
 
     new_metadata = bytes(federated_alice.known_nodes[ursula.checksum_address])
     assert new_metadata != old_metadata
+
+
+def test_ursula_keeps_treasure_maps_in_her_datastore_until_the_policy_expires(enacted_federated_policy,
+                                                                              federated_ursulas):
+    treasure_map = enacted_federated_policy.treasure_map
+    ursula_address, _arrangement_id = next(iter(treasure_map))
+    ursula = next(u for u in federated_ursulas if u.checksum_address == ursula_address)
+    treasure_map_index = bytes.fromhex(treasure_map.public_id())
+
+    # Even once out of memory, the map is served just as Alice published it.
+    ursula.datastore.treasure_map_cache.clear()
+    with ursula.rest_app.test_client() as client:
+        response = client.get(f'/treasure_map/{treasure_map.public_id()}')
+    assert response.status_code == 200
+    assert response.data == bytes(treasure_map)
+
+    # The map expires along with the policy, as Alice signed for it.
+    expiration = datetime.datetime.fromtimestamp(enacted_federated_policy.expiration.epoch)
+    assert ursula.datastore.del_expired_treasure_maps(now=expiration - datetime.timedelta(seconds=1)) == 0
+    assert treasure_map_index in ursula.treasure_maps
+    ursula.datastore.del_expired_treasure_maps(now=expiration)
+    assert treasure_map_index not in ursula.treasure_maps
+
+    # Without a word from Alice on when the policy expires, the map is kept for a default TTL.
+    posted_at = datetime.datetime.now()
+    with ursula.rest_app.test_client() as client:
+        response = client.post(f'/treasure_map/{treasure_map.public_id()}', data=bytes(treasure_map))
+    assert response.status_code == 202
+    ttl = ursula.datastore.DEFAULT_TREASURE_MAP_TTL
+    assert ursula.datastore.del_expired_treasure_maps(now=posted_at + ttl - datetime.timedelta(minutes=1)) == 0
+    assert treasure_map_index in ursula.treasure_maps
+    ursula.datastore.del_expired_treasure_maps(now=posted_at + ttl + datetime.timedelta(minutes=1))
+    assert treasure_map_index not in ursula.treasure_maps
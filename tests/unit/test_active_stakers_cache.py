@@ -0,0 +1,74 @@
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import os
+
+from nucypher.blockchain.eth.agents import ActiveStakersCache
+
+CONTRACT = '0x0000000000000000000000000000000000000001'
+OTHER_CONTRACT = '0x0000000000000000000000000000000000000002'
+ACTIVE_STAKERS = (2 ** 80, {'0x000000000000000000000000000000000000000A': 2 ** 79,
+                            '0x000000000000000000000000000000000000000B': 2 ** 79})
+
+
+def test_active_stakers_are_cached_per_period():
+    cache = ActiveStakersCache()
+    cache.put(CONTRACT, period=10, duration=5, active_stakers=ACTIVE_STAKERS)
+    assert cache.get(CONTRACT, period=10, duration=5) is ACTIVE_STAKERS
+    assert cache.get(CONTRACT, period=10, duration=6) is None
+    assert cache.get(OTHER_CONTRACT, period=10, duration=5) is None
+
+    # Seeing a new period drops everything cached for past ones.
+    cache.put(CONTRACT, period=11, duration=6, active_stakers=ACTIVE_STAKERS)
+    assert cache.get(CONTRACT, period=10, duration=5) is None
+    assert len(cache) == 1
+
+
+def test_invalidating_active_stakers():
+    cache = ActiveStakersCache()
+    cache.put(CONTRACT, period=10, duration=5, active_stakers=ACTIVE_STAKERS)
+    cache.put(OTHER_CONTRACT, period=10, duration=5, active_stakers=ACTIVE_STAKERS)
+
+    cache.invalidate(CONTRACT)
+    assert cache.get(CONTRACT, period=10, duration=5) is None
+    assert cache.get(OTHER_CONTRACT, period=10, duration=5) is ACTIVE_STAKERS
+
+    cache.invalidate()
+    assert len(cache) == 0
+
+
+def test_active_stakers_survive_a_restart(tmpdir):
+    filepath = os.path.join(tmpdir, 'active_stakers.json')
+    cache = ActiveStakersCache(filepath=filepath)
+    cache.put(CONTRACT, period=10, duration=5, active_stakers=ACTIVE_STAKERS)
+
+    restarted_cache = ActiveStakersCache(filepath=filepath)
+    assert restarted_cache.get(CONTRACT, period=10, duration=5) == ACTIVE_STAKERS
+
+    restarted_cache.invalidate(CONTRACT)
+    assert ActiveStakersCache(filepath=filepath).get(CONTRACT, period=10, duration=5) is None
+
+
+def test_unreadable_cache_file_is_ignored(tmpdir):
+    filepath = os.path.join(tmpdir, 'active_stakers.json')
+    with open(filepath, 'w') as file:
+        file.write('{not json')
+    cache = ActiveStakersCache(filepath=filepath)
+    assert len(cache) == 0
+
+    cache.put(CONTRACT, period=10, duration=5, active_stakers=ACTIVE_STAKERS)
+    assert ActiveStakersCache(filepath=filepath).get(CONTRACT, period=10, duration=5) == ACTIVE_STAKERS
@@ -15,6 +15,8 @@ You should have received a copy of the GNU Affero General Public License
 along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
 """
 
+import json
+import os
 import pytest
 
 from nucypher.blockchain.eth.interfaces import BaseContractRegistry
@@ -79,3 +81,47 @@ def test_contract_registry(tempfile_path):
     # Check that searching for an unknown contract raises
     with pytest.raises(BaseContractRegistry.InvalidRegistry):
         test_registry.search(contract_address=test_addr)
+
+
+def test_contract_registry_index_is_reused_until_the_file_changes(tempfile_path):
+    test_registry = LocalContractRegistry(filepath=tempfile_path)
+    test_registry.enroll(contract_name='TestContract',
+                         contract_address='0xDEADBEEF',
+                         contract_abi=['fake', 'data'],
+                         contract_version='v1.0.0')
+
+    index = test_registry.index
+    assert test_registry.index is index
+    assert index.by_address['0xDEADBEEF'] == [('TestContract', 'v1.0.0', '0xDEADBEEF', ['fake', 'data'])]
+
+    # Another process rewrites the registry file.
+    with open(tempfile_path, 'w') as registry_file:
+        registry_file.write(json.dumps([['TestContract', 'v1.0.0', '0xDEADBEEF', ['fake', 'data']],
+                                        ['TestContract', 'v2.0.0', '0xCAFEBABE', ['more', 'fake', 'data']]]))
+
+    assert test_registry.index is not index
+    records = test_registry.search(contract_name='TestContract')
+    assert [version for _name, version, _address, _abi in records] == ['v1.0.0', 'v2.0.0']
+    assert test_registry.search(contract_name='TestContract', contract_version='v2.0.0')[0][2] == '0xCAFEBABE'
+
+
+def test_contract_registry_is_parsed_again_only_when_its_contents_change(tempfile_path):
+    test_registry = LocalContractRegistry(filepath=tempfile_path)
+    test_registry.enroll(contract_name='TestContract',
+                         contract_address='0xDEADBEEF',
+                         contract_abi=['fake', 'data'],
+                         contract_version='v1.0.0')
+    assert list(test_registry.enrolled_names) == ['TestContract']
+    assert list(test_registry.enrolled_addresses) == ['0xDEADBEEF']
+
+    index, registry_id = test_registry.index, test_registry.id
+
+    # Touching the file makes the registry read it again, but its contents (and so its index) are unchanged.
+    os.utime(tempfile_path, (0, 0))
+    assert test_registry.index is index
+    assert test_registry.id == registry_id
+
+    # Callers can't alter the registry by modifying what they read.
+    registry_data = test_registry.read()
+    registry_data.append(['AnotherContract', 'v1.0.0', '0xCAFEBABE', []])
+    assert len(test_registry.read()) == 1
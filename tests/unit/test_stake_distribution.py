@@ -0,0 +1,51 @@
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import random
+from collections import Counter
+
+import pytest
+
+from nucypher.blockchain.eth.agents import StakeDistribution
+
+STAKES = {'0xA': 10, '0xB': 0, '0xC': 30, '0xD': 60}
+
+
+def test_points_map_to_the_stake_they_fall_within():
+    distribution = StakeDistribution(stakers_map=STAKES)
+    assert distribution.total_stake == 100
+    assert distribution.sample_with_replacement([0, 9, 10, 39, 40, 99]) == ['0xA', '0xA', '0xC', '0xC', '0xD', '0xD']
+
+
+def test_sampling_without_replacement():
+    distribution = StakeDistribution(stakers_map=STAKES)
+    rng = random.Random(1234)
+
+    # Every staker with a stake is drawn exactly once;  the one without a stake never is.
+    for _ in range(100):
+        sampled = distribution.sample_without_replacement(quantity=3, rng=rng)
+        assert sorted(sampled) == ['0xA', '0xC', '0xD']
+    assert len(distribution.sample_without_replacement(quantity=4, rng=rng)) == 3
+
+    with pytest.raises(ValueError):
+        distribution.sample_without_replacement(quantity=5, rng=rng)
+
+    # The first draw is still proportional to stake.
+    first_draws = Counter(distribution.sample_without_replacement(quantity=2, rng=rng)[0] for _ in range(5000))
+    assert first_draws['0xB'] == 0
+    assert 0.55 < first_draws['0xD'] / 5000 < 0.65
+    assert 0.07 < first_draws['0xA'] / 5000 < 0.13
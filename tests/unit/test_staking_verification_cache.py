@@ -0,0 +1,85 @@
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from unittest.mock import patch
+
+from nucypher.network.nodes import StakingVerificationCache
+
+SECONDS_PER_PERIOD = 60 * 60 * 24
+START_OF_PERIOD = 18000 * SECONDS_PER_PERIOD
+
+
+def test_staking_verification_cache_expires_at_the_end_of_the_period():
+    cache = StakingVerificationCache(ttl=SECONDS_PER_PERIOD * 2)
+    fetches = []
+
+    def fetch():
+        fetches.append(1)
+        return len(fetches)
+
+    def cached_value_at(now):
+        with patch('nucypher.network.nodes.time.time', return_value=now):
+            return cache.get(key=('registry', 'locked_tokens', 'staker'), seconds_per_period=SECONDS_PER_PERIOD, fetch=fetch)
+
+    assert cached_value_at(START_OF_PERIOD + 10) == 1
+    assert cached_value_at(START_OF_PERIOD + SECONDS_PER_PERIOD - 1) == 1
+
+    # A new period;  the value is read again.
+    assert cached_value_at(START_OF_PERIOD + SECONDS_PER_PERIOD) == 2
+    assert len(fetches) == 2
+
+
+def test_staking_verification_cache_expires_after_ttl():
+    cache = StakingVerificationCache(ttl=60)
+    values = iter(('0xStaker', '0xAnotherStaker'))
+
+    def cached_value_at(now):
+        with patch('nucypher.network.nodes.time.time', return_value=now):
+            return cache.get(key=('registry', 'staker_from_worker', 'worker'),
+                             seconds_per_period=SECONDS_PER_PERIOD,
+                             fetch=lambda: next(values))
+
+    assert cached_value_at(START_OF_PERIOD) == '0xStaker'
+    assert cached_value_at(START_OF_PERIOD + 59) == '0xStaker'
+    assert cached_value_at(START_OF_PERIOD + 60) == '0xAnotherStaker'
+
+    cache.clear()
+    with patch('nucypher.network.nodes.time.time', return_value=START_OF_PERIOD + 61):
+        assert cache.get(key=('registry', 'staker_from_worker', 'worker'),
+                         seconds_per_period=SECONDS_PER_PERIOD,
+                         fetch=lambda: '0xNewStaker') == '0xNewStaker'
+
+
+def test_staking_verification_cache_is_bounded():
+    cache = StakingVerificationCache(ttl=SECONDS_PER_PERIOD * 2, max_size=2)
+
+    def cache_at(now, worker):
+        with patch('nucypher.network.nodes.time.time', return_value=now):
+            return cache.get(key=('registry', 'staker_from_worker', worker),
+                             seconds_per_period=SECONDS_PER_PERIOD,
+                             fetch=lambda: f'staker of {worker}')
+
+    # The least recently used entry makes way for new ones.
+    cache_at(START_OF_PERIOD, 'first')
+    cache_at(START_OF_PERIOD, 'second')
+    cache_at(START_OF_PERIOD, 'first')
+    cache_at(START_OF_PERIOD, 'third')
+    assert len(cache) == 2
+
+    # Entries of past periods are dropped once a new period begins.
+    cache_at(START_OF_PERIOD + SECONDS_PER_PERIOD, 'fourth')
+    assert len(cache) == 1
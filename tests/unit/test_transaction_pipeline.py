@@ -0,0 +1,79 @@
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import os
+import pytest
+from concurrent.futures import Future
+from unittest.mock import Mock
+from web3.exceptions import TimeExhausted, TransactionNotFound
+
+from nucypher.blockchain.eth import pipeline as pipeline_module
+from nucypher.blockchain.eth.pipeline import PendingTransaction, TransactionPipeline
+
+STUCK_TIMEOUT = 10  # seconds
+
+
+class FakeClock:
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture()
+def clock(monkeypatch):
+    fake_clock = FakeClock()
+    monkeypatch.setattr(pipeline_module.time, 'monotonic', fake_clock)
+    return fake_clock
+
+
+@pytest.fixture()
+def blockchain():
+    blockchain = Mock(TIMEOUT=1)
+    blockchain.client.gas_price = 1
+    blockchain.client.w3.eth.getTransactionReceipt.side_effect = TransactionNotFound
+    blockchain.client.send_raw_transaction.side_effect = lambda signed_transaction: os.urandom(32)
+    return blockchain
+
+
+def test_stuck_transactions_time_out_only_after_the_last_gas_bump(clock, blockchain):
+    pipeline = TransactionPipeline(blockchain=blockchain, stuck_timeout=STUCK_TIMEOUT)
+    check = pipeline._TransactionPipeline__check
+    pending = PendingTransaction(transaction_dict={'gasPrice': 100},
+                                 transaction_hash=os.urandom(32),
+                                 transaction_name='TRANSFER',
+                                 future=Future())
+
+    # Receipts are polled a little late every time, so the bumps drift past the nominal timeout.
+    for bump in range(1, pipeline.MAX_GAS_BUMPS + 1):
+        clock.now += STUCK_TIMEOUT + 3
+        assert check(pending) is False
+        assert pending.gas_bumps == bump
+    assert clock.now - pending.broadcast_at > pipeline.timeout
+    assert len(pending.transaction_hashes) == pipeline.MAX_GAS_BUMPS + 1
+
+    # Even so, the last replacement gets its full `stuck_timeout` to be mined...
+    clock.now += STUCK_TIMEOUT - 1
+    assert check(pending) is False
+
+    # ...and only then does the transaction time out.
+    clock.now += 2
+    with pytest.raises(TimeExhausted):
+        check(pending)
+    assert pending.gas_bumps == pipeline.MAX_GAS_BUMPS
@@ -0,0 +1,111 @@
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from twisted.internet.task import Clock
+
+from nucypher.blockchain.eth.token import WorkTracker
+
+SECONDS_PER_PERIOD = 60 * 60 * 24
+PERIOD = 18000
+
+
+class FakeStakingAgent:
+
+    def __init__(self, clock: Clock):
+        self.clock = clock
+        self.last_committed_period = PERIOD
+        self.status_reads = 0
+        self.failures = 0
+
+    def get_current_period(self) -> int:
+        return int(self.clock.seconds() // SECONDS_PER_PERIOD)
+
+    def get_seconds_per_period(self) -> int:
+        return SECONDS_PER_PERIOD
+
+    def get_commitment_status(self, staker_address: str):
+        self.status_reads += 1
+        if self.failures:
+            self.failures -= 1
+            raise ConnectionError("The node is unreachable")
+        return self.get_current_period(), self.last_committed_period
+
+
+class FakeTransactingPower:
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+class FakeWorker:
+
+    checksum_address = '0xStaker'
+
+    def __init__(self, staking_agent: FakeStakingAgent):
+        self.staking_agent = staking_agent
+        self.transacting_power = FakeTransactingPower()
+        self.commitments = []
+
+    def commit_to_next_period(self):
+        period = self.staking_agent.get_current_period()
+        self.commitments.append(period)
+        self.staking_agent.last_committed_period = period + 1
+
+
+def make_work_tracker(monkeypatch, now: int):
+    clock = Clock()
+    clock.advance(now)
+    monkeypatch.setattr(WorkTracker, 'CLOCK', clock)
+    worker = FakeWorker(FakeStakingAgent(clock))
+    return clock, worker, WorkTracker(worker=worker)
+
+
+def test_work_tracker_wakes_just_after_the_period_boundary(monkeypatch):
+    clock, worker, tracker = make_work_tracker(monkeypatch, now=PERIOD * SECONDS_PER_PERIOD + 60)
+    tracker.start(act_now=True)
+    assert worker.commitments == [PERIOD]  # Right away.
+
+    # Sleeping through the period costs one status read an hour, at most.
+    clock.advance(SECONDS_PER_PERIOD - 60 - 1)
+    assert worker.commitments == [PERIOD]
+    assert worker.staking_agent.status_reads <= 1 + SECONDS_PER_PERIOD // WorkTracker.REFRESH_RATE
+
+    clock.advance(1 + WorkTracker.BOUNDARY_MARGIN)
+    assert worker.commitments == [PERIOD, PERIOD + 1]
+    assert tracker.last_commitment_latency == WorkTracker.BOUNDARY_MARGIN
+
+    tracker.stop()
+    assert not tracker.running
+    assert not clock.getDelayedCalls()
+
+
+def test_work_tracker_retries_with_exponential_backoff(monkeypatch):
+    clock, worker, tracker = make_work_tracker(monkeypatch, now=PERIOD * SECONDS_PER_PERIOD + 60)
+    worker.staking_agent.failures = 3
+    tracker.start(act_now=True)
+    assert worker.staking_agent.status_reads == 1
+
+    for delay in (WorkTracker.RETRY_DELAY, WorkTracker.RETRY_DELAY * 2, WorkTracker.RETRY_DELAY * 4):
+        assert clock.getDelayedCalls()[0].getTime() == clock.seconds() + delay
+        clock.advance(delay)
+
+    assert worker.staking_agent.status_reads == 4
+    assert worker.commitments == [PERIOD]
+    tracker.stop()
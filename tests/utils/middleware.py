@@ -23,6 +23,7 @@ from constant_sorrow.constants import CERTIFICATE_NOT_SAVED
 from flask import Response
 
 from nucypher.characters.lawful import Ursula
+from nucypher.network import FLEET_SIZE_HEADER
 from nucypher.network.middleware import NucypherMiddlewareClient, RestMiddleware
 from tests.utils.ursula import MOCK_KNOWN_URSULAS_CACHE
 
@@ -104,10 +105,12 @@ class MockRestMiddlewareForLargeFleetTests(MockRestMiddleware):
                            node,
                            announce_nodes=None,
                            nodes_i_need=None,
-                           fleet_checksum=None):
-        known_nodes_bytestring = node.bytestring_of_known_nodes()
+                           fleet_checksum=None,
+                           since_checksum=None):
+        known_nodes_bytestring = node.bytestring_of_known_nodes(since=since_checksum)
         signature = node.stamp(known_nodes_bytestring)
-        r = Response(bytes(signature) + known_nodes_bytestring)
+        r = Response(bytes(signature) + known_nodes_bytestring,
+                     headers={FLEET_SIZE_HEADER: str(len(node.known_nodes))})
         r.content = r.data
         return r
 